@@ -1,36 +1,104 @@
 /* Giscus Comments Integration for MkDocs Material */
 
-// This file handles the client-side Giscus integration
-// The actual Giscus script is loaded in comments.html partial
+// The comments.html partial only renders a placeholder carrying the Giscus
+// configuration. The giscus.app client script is injected when the
+// placeholder scrolls near the viewport or its button is clicked, so pages
+// with comments don't pay for the script and iframe bootstrap up front.
+
+(function () {
+  const GISCUS_ORIGIN = 'https://giscus.app';
+  const GISCUS_CLIENT = GISCUS_ORIGIN + '/client.js';
+
+  // Start loading a little before the comments heading becomes visible
+  const ROOT_MARGIN = '600px 0px';
+
+  let observer = null;
+
+  // Giscus theme matching the current Material palette
+  const currentTheme = () => {
+    const palette = __md_get("__palette");
+    if (palette && typeof palette.color === "object") {
+      return palette.color.scheme === "slate" ? "dark" : "light";
+    }
+    return null;
+  };
 
-document.addEventListener('DOMContentLoaded', function() {
   // Function to update Giscus theme when Material theme changes
   const updateGiscusTheme = () => {
     const iframe = document.querySelector('iframe.giscus-frame');
-    if (!iframe) return;
-    
-    // Get current Material theme
-    const palette = __md_get("__palette");
-    if (palette && typeof palette.color === "object") {
-      const theme = palette.color.scheme === "slate" ? "dark" : "light";
-      
-      // Send message to Giscus iframe to update theme
-      iframe.contentWindow.postMessage(
-        { giscus: { setConfig: { theme } } },
-        'https://giscus.app'
-      );
+    const theme = currentTheme();
+    if (!iframe || !theme) return;
+
+    // Send message to Giscus iframe to update theme
+    iframe.contentWindow.postMessage(
+      { giscus: { setConfig: { theme } } },
+      GISCUS_ORIGIN
+    );
+  };
+
+  // Inject the Giscus client into the placeholder, once
+  const loadGiscus = (container) => {
+    if (container.hasAttribute('data-giscus-loaded')) return;
+    container.setAttribute('data-giscus-loaded', '');
+    if (observer) {
+      observer.disconnect();
+      observer = null;
+    }
+
+    const script = document.createElement('script');
+    script.src = GISCUS_CLIENT;
+    for (const { name, value } of Array.from(container.attributes)) {
+      if (name.startsWith('data-') && !name.startsWith('data-giscus-')) {
+        script.setAttribute(name, value);
+      }
+    }
+    const theme = currentTheme();
+    if (theme) script.setAttribute('data-theme', theme);
+    script.crossOrigin = 'anonymous';
+    script.async = true;
+
+    // The client replaces the placeholder's children with its iframe
+    container.appendChild(script);
+  };
+
+  // Wire up the placeholder of the page currently displayed
+  const setupComments = () => {
+    // Instant navigation swaps the page, so drop the previous page's observer
+    if (observer) {
+      observer.disconnect();
+      observer = null;
+    }
+
+    const container = document.querySelector('[data-giscus-deferred]');
+    if (!container || container.hasAttribute('data-giscus-loaded')) return;
+
+    const button = container.querySelector('[data-giscus-load]');
+    if (button) {
+      button.addEventListener('click', () => loadGiscus(container));
+    }
+
+    if ('IntersectionObserver' in window) {
+      observer = new IntersectionObserver((entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) loadGiscus(container);
+      }, { rootMargin: ROOT_MARGIN });
+      observer.observe(container);
     }
   };
-  
-  // Listen for Material theme changes
-  const ref = document.querySelector("[data-md-component=palette]");
-  if (ref) {
-    ref.addEventListener("change", function() {
+
+  // Material's document$ emits on the first load and after every instant
+  // navigation; fall back to DOMContentLoaded without it
+  if (typeof document$ !== 'undefined') {
+    document$.subscribe(setupComments);
+  } else {
+    document.addEventListener('DOMContentLoaded', setupComments);
+  }
+
+  // Listen for Material theme changes; the palette toggle survives page
+  // swaps, but delegating from the document keeps this independent of it
+  document.addEventListener('change', (event) => {
+    if (event.target.closest && event.target.closest('[data-md-component=palette]')) {
       // Small delay to ensure theme has fully changed
       setTimeout(updateGiscusTheme, 100);
-    });
-  }
-  
-  // Initial theme sync (handled by comments.html, but this is a backup)
-  setTimeout(updateGiscusTheme, 1000);
-});
\ No newline at end of file
+    }
+  });
+})();
@@ -1,4 +1,10 @@
-// MathJax configuration
+/* MathJax configuration and loader
+ *
+ * hooks/lazy_mathjax.py marks pages with math with a hidden
+ * .druids-mathjax element carrying the library URL. The library is only
+ * fetched on those pages; once loaded, it typesets the page itself, and
+ * pages reached afterwards by instant navigation are typeset here.
+ */
 window.MathJax = {
   tex: {
     inlineMath: [['$', '$'], ['\\(', '\\)']],
@@ -10,4 +16,50 @@ window.MathJax = {
     ignoreHtmlClass: '.*|',
     processHtmlClass: 'arithmatex'
   }
-};
\ No newline at end of file
+};
+
+(function () {
+  "use strict";
+
+  const config = document.getElementById("__config");
+  const siteRoot = new URL(
+    ((config && JSON.parse(config.textContent).base) || ".").replace(/\/?$/, "/"),
+    location.href
+  );
+
+  let requested = false;
+
+  function setup() {
+    const marker = document.querySelector(".druids-mathjax");
+    if (!marker) return;
+
+    if (requested) {
+      // Loaded (or loading, and typesetting on startup): redo the new page
+      if (window.MathJax.typesetPromise) {
+        window.MathJax.startup.output.clearCache();
+        window.MathJax.typesetClear();
+        window.MathJax.texReset();
+        window.MathJax.typesetPromise();
+      }
+      return;
+    }
+    requested = true;
+    const script = document.createElement("script");
+    script.src = new URL(marker.dataset.mathjaxSrc, siteRoot).href;
+    if (marker.dataset.mathjaxIntegrity) {
+      script.integrity = marker.dataset.mathjaxIntegrity;
+      script.crossOrigin = "anonymous";
+    }
+    script.async = true;
+    script.onerror = () => { requested = false; };
+    document.head.appendChild(script);
+  }
+
+  // Material's document$ emits on the first load and after every instant
+  // navigation; fall back to DOMContentLoaded without it
+  if (typeof document$ !== "undefined") {
+    document$.subscribe(setup);
+  } else {
+    document.addEventListener("DOMContentLoaded", setup);
+  }
+})();
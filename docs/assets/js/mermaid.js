@@ -0,0 +1,154 @@
+/* Lazy Mermaid rendering
+ *
+ * hooks/lazy_mermaid.py replaces each ```mermaid block with a placeholder
+ * that reserves an estimated height and keeps the diagram source in a
+ * hidden <pre>. This script loads the Mermaid library the first time a
+ * placeholder comes near the viewport and renders each diagram only
+ * then, so pages without diagrams never fetch Mermaid and diagrams below
+ * the fold don't hold up the ones being read.
+ */
+(function () {
+  "use strict";
+
+  // Render a little before a diagram scrolls into view
+  const ROOT_MARGIN = "400px 0px";
+
+  // Remembered rendered heights, so revisits reserve the exact space
+  const HEIGHTS_KEY = "druids-mermaid-heights";
+
+  // Diagram colors follow Material's --md-mermaid-* palette variables
+  const THEME_CSS = [
+    ".node circle,.node ellipse,.node path,.node polygon,.node rect{fill:var(--md-mermaid-node-bg-color);stroke:var(--md-mermaid-node-fg-color)}",
+    ".label,.nodeLabel,.edgeLabel{color:var(--md-mermaid-label-fg-color);font-family:var(--md-mermaid-font-family)}",
+    ".edgeLabel,.edgeLabel rect{background-color:var(--md-mermaid-label-bg-color);fill:var(--md-mermaid-label-bg-color)}",
+    ".edgePath .path,.flowchart-link{stroke:var(--md-mermaid-edge-color)}",
+    ".arrowheadPath,marker{fill:var(--md-mermaid-edge-color);stroke:none}",
+    ".cluster rect{fill:var(--md-default-fg-color--lightest);stroke:var(--md-default-fg-color--lighter)}",
+  ].join("");
+
+  const config = document.getElementById("__config");
+  const siteRoot = new URL(
+    ((config && JSON.parse(config.textContent).base) || ".").replace(/\/?$/, "/"),
+    location.href
+  );
+
+  let library = null;
+  let observer = null;
+  let counter = 0;
+
+  function loadHeights() {
+    try {
+      return JSON.parse(sessionStorage.getItem(HEIGHTS_KEY)) || {};
+    } catch (error) {
+      return {};
+    }
+  }
+
+  function saveHeight(key, height) {
+    const heights = loadHeights();
+    heights[key] = height;
+    try {
+      sessionStorage.setItem(HEIGHTS_KEY, JSON.stringify(heights));
+    } catch (error) {
+      // Storage full or disabled: estimates are still reserved
+    }
+  }
+
+  // Cheap stable key for a diagram's source
+  function sourceKey(source) {
+    let hash = 0;
+    for (let i = 0; i < source.length; i++) hash = (hash * 31 + source.charCodeAt(i)) | 0;
+    return location.pathname + ":" + hash;
+  }
+
+  function loadLibrary(container) {
+    if (!library) {
+      library = new Promise((resolve, reject) => {
+        const script = document.createElement("script");
+        script.src = new URL(container.dataset.mermaidSrc, siteRoot).href;
+        if (container.dataset.mermaidIntegrity) {
+          script.integrity = container.dataset.mermaidIntegrity;
+          script.crossOrigin = "anonymous";
+        }
+        script.onload = () => {
+          window.mermaid.initialize({
+            startOnLoad: false,
+            themeCSS: THEME_CSS,
+            sequence: { actorFontSize: "16px", messageFontSize: "16px", noteFontSize: "16px" },
+          });
+          resolve(window.mermaid);
+        };
+        script.onerror = () => {
+          library = null;
+          reject(new Error("Mermaid failed to load"));
+        };
+        document.head.appendChild(script);
+      });
+    }
+    return library;
+  }
+
+  function render(container) {
+    if (container.hasAttribute("data-mermaid-rendered")) return;
+    container.setAttribute("data-mermaid-rendered", "");
+    const source = container.querySelector(".druids-mermaid__source").textContent;
+
+    loadLibrary(container)
+      .then(mermaid => mermaid.render(`__druids_mermaid_${counter++}`, source))
+      .then(({ svg, bindFunctions }) => {
+        // Shadow DOM keeps Mermaid's styles out of the page, as Material does
+        const host = document.createElement("div");
+        host.className = "mermaid";
+        const shadow = host.attachShadow({ mode: "closed" });
+        shadow.innerHTML = svg;
+        container.replaceChildren(host);
+        if (bindFunctions) bindFunctions(shadow);
+        container.style.minHeight = "";
+        saveHeight(sourceKey(source), host.getBoundingClientRect().height);
+      })
+      .catch(() => {
+        // Show the source instead of an empty box
+        container.removeAttribute("data-mermaid-rendered");
+        container.querySelector(".druids-mermaid__source").hidden = false;
+        container.style.minHeight = "";
+      });
+  }
+
+  function setup() {
+    if (observer) {
+      observer.disconnect();
+      observer = null;
+    }
+    const containers = document.querySelectorAll(".druids-mermaid:not([data-mermaid-rendered])");
+    if (!containers.length) return;
+
+    const heights = loadHeights();
+    containers.forEach(container => {
+      const source = container.querySelector(".druids-mermaid__source").textContent;
+      const height = heights[sourceKey(source)];
+      if (height) container.style.minHeight = `${height}px`;
+    });
+
+    if (!("IntersectionObserver" in window)) {
+      containers.forEach(render);
+      return;
+    }
+    observer = new IntersectionObserver(entries => {
+      entries.forEach(entry => {
+        if (entry.isIntersecting) {
+          observer.unobserve(entry.target);
+          render(entry.target);
+        }
+      });
+    }, { rootMargin: ROOT_MARGIN });
+    containers.forEach(container => observer.observe(container));
+  }
+
+  // Material's document$ emits on the first load and after every instant
+  // navigation; fall back to DOMContentLoaded without it
+  if (typeof document$ !== "undefined") {
+    document$.subscribe(setup);
+  } else {
+    document.addEventListener("DOMContentLoaded", setup);
+  }
+})();
@@ -0,0 +1,26 @@
+/* Offline support
+ *
+ * Registers the service worker at the site root (docs/sw.js), which
+ * precaches the site shell and the Start and Learn sections and keeps them
+ * up to date from the build's precache manifest.
+ */
+(function () {
+  "use strict";
+
+  if (!("serviceWorker" in navigator)) return;
+
+  // Don't let a worker cache pages under `mkdocs serve`
+  if (/^(localhost|127\.0\.0\.1|\[::1\])$/.test(location.hostname)) return;
+
+  const config = document.getElementById("__config");
+  const siteRoot = new URL(
+    ((config && JSON.parse(config.textContent).base) || ".").replace(/\/?$/, "/"),
+    location.href
+  );
+
+  window.addEventListener("load", () => {
+    navigator.serviceWorker
+      .register(new URL("sw.js", siteRoot).href, { scope: siteRoot.pathname })
+      .catch(error => console.warn("Offline support unavailable:", error));
+  });
+})();
@@ -0,0 +1,77 @@
+/* Idle-time prefetch of likely next pages
+ *
+ * hooks/prefetch.py writes prefetch.json, mapping every page URL to its most
+ * likely next pages: the nav successor, its most prominent internal links
+ * and the nav predecessor. After each page load, including instant
+ * navigation swaps, this script adds <link rel="prefetch"> hints for them
+ * once the browser is idle, so the next click is served from cache.
+ */
+(function () {
+  "use strict";
+
+  const MANIFEST_FILE = "prefetch.json";
+
+  // extra_javascript runs once, so resolve the site root against the page
+  // it was loaded on; instant navigation changes location afterwards
+  const config = document.getElementById("__config");
+  const siteRoot = new URL(
+    ((config && JSON.parse(config.textContent).base) || ".").replace(/\/?$/, "/"),
+    location.href
+  );
+
+  const prefetched = new Set();
+  let manifest = null;
+
+  // Respect data saver and slow connections
+  function allowed() {
+    const connection = navigator.connection;
+    return !(connection && (connection.saveData || /2g/.test(connection.effectiveType || "")));
+  }
+
+  function whenIdle(callback) {
+    if ("requestIdleCallback" in window) requestIdleCallback(callback, { timeout: 2000 });
+    else setTimeout(callback, 200);
+  }
+
+  function loadManifest() {
+    if (!manifest) {
+      manifest = fetch(new URL(MANIFEST_FILE, siteRoot))
+        .then(response => (response.ok ? response.json() : {}))
+        .catch(() => ({}));
+    }
+    return manifest;
+  }
+
+  // Page URL as MkDocs writes it: relative to the site root, "" for home
+  function currentPage() {
+    const path = decodeURIComponent(location.pathname);
+    const root = decodeURIComponent(siteRoot.pathname);
+    return path.startsWith(root) ? path.slice(root.length).replace(/index\.html$/, "") : null;
+  }
+
+  function prefetch(url) {
+    const href = new URL(url, siteRoot).href;
+    if (prefetched.has(href) || href === location.href.split("#")[0]) return;
+    prefetched.add(href);
+
+    const link = document.createElement("link");
+    link.rel = "prefetch";
+    link.href = href;
+    document.head.appendChild(link);
+  }
+
+  function warm() {
+    if (!allowed()) return;
+    const page = currentPage();
+    if (page === null) return;
+    whenIdle(() => loadManifest().then(data => (data[page] || []).forEach(prefetch)));
+  }
+
+  // Material's document$ emits on the first load and after every instant
+  // navigation; fall back to the load event without it
+  if (typeof document$ !== "undefined") {
+    document$.subscribe(warm);
+  } else {
+    window.addEventListener("load", warm);
+  }
+})();
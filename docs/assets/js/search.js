@@ -1,2 +1,160 @@
-// Search functionality - handled by MkDocs Material theme
-// This file exists to prevent 404 errors
\ No newline at end of file
+/* Sharded search worker
+ *
+ * hooks/search_shards.py splits the search index at build time into
+ * gzip-compressed shards keyed by the first character of each stemmed term,
+ * plus the document table in chunks and a manifest, and points Material's
+ * search UI at this script instead of its Lunr worker. The worker speaks
+ * the same messages as Material's: it is ready as soon as the UI sets it up
+ * (the documents are no longer in search_index.json), fetches the manifest
+ * once and then only the shards and document chunks a query touches, so
+ * the time to the first result does not grow with the site.
+ */
+(function () {
+  "use strict";
+
+  const SHARD_DIR = "search/shards/";
+  const MANIFEST_FILE = "manifest.json";
+
+  // Material's SearchMessageType
+  const SETUP = 0;
+  const READY = 1;
+  const QUERY = 2;
+  const RESULT = 3;
+
+  // This script is served from assets/js/ under the site root
+  const siteRoot = new URL("../../", self.location.href);
+  const shardRoot = new URL(SHARD_DIR, siteRoot);
+
+  const files = new Map();
+  let manifest = null;
+  let latest = 0;
+
+  /* Must match stem() in hooks/search_shards.py */
+  function stem(word) {
+    if (word.length <= 3 || /^\d+$/.test(word)) return word;
+    if (word.endsWith("ies") && word.length > 4) return word.slice(0, -3) + "y";
+    if (word.endsWith("sses")) return word.slice(0, -2);
+    if (word.endsWith("ing") && word.length > 5) return word.slice(0, -3);
+    if (word.endsWith("ed") && word.length > 4) return word.slice(0, -2);
+    if (word.endsWith("s") && !/(ss|us|is)$/.test(word)) return word.slice(0, -1);
+    return word;
+  }
+
+  function shardKey(term) {
+    return /^\d/.test(term) ? "0" : term[0];
+  }
+
+  async function decode(response) {
+    const bytes = new Uint8Array(await response.arrayBuffer());
+    // Servers may already have removed the gzip layer via Content-Encoding
+    if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+      const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+      return JSON.parse(await new Response(stream).text());
+    }
+    return JSON.parse(new TextDecoder().decode(bytes));
+  }
+
+  function load(file) {
+    if (!files.has(file)) {
+      const request = fetch(new URL(file, shardRoot)).then(response => {
+        if (!response.ok) throw new Error(`Search shard ${file}: HTTP ${response.status}`);
+        return file.endsWith(".gz") ? decode(response) : response.json();
+      });
+      // Forget failed requests so the next query retries them
+      request.catch(() => files.delete(file));
+      files.set(file, request);
+    }
+    return files.get(file);
+  }
+
+  async function loadManifest() {
+    if (!manifest) {
+      manifest = load(MANIFEST_FILE).then(data => {
+        data.stopwords = new Set(data.stopwords);
+        return data;
+      });
+      manifest.catch(() => { manifest = null; });
+    }
+    return manifest;
+  }
+
+  /* Words terms() in hooks/search_shards.py would index, before stemming */
+  function words(text, index) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+      .filter(word => !index.stopwords.has(word) && word.length <= index.max_term_length);
+  }
+
+  /* Weights per document for one query term, prefix-matched if requested */
+  function postings(shard, term, prefix) {
+    const weights = new Map();
+    const add = flat => {
+      for (let i = 0; i < flat.length; i += 2) {
+        weights.set(flat[i], (weights.get(flat[i]) || 0) + flat[i + 1]);
+      }
+    };
+    if (prefix) {
+      for (const key in shard) if (key.startsWith(term)) add(shard[key]);
+    } else if (shard[term]) {
+      add(shard[term]);
+    }
+    return weights;
+  }
+
+  /* Results as Material's worker returns them: one item per group */
+  async function query(text, limit = 50) {
+    const index = await loadManifest();
+    const queryWords = words(text, index);
+    const queryTerms = queryWords.map(stem);
+    if (!queryTerms.length) return [];
+
+    // The last word is still being typed unless the query ends in a space
+    const prefixLast = !/\s$/.test(text);
+    const shards = await Promise.all(queryTerms.map(term => {
+      const shard = index.shards[shardKey(term)];
+      return shard ? load(shard.file) : {};
+    }));
+
+    // Every term has to match; scores add up across terms
+    let scores = null;
+    queryTerms.forEach((term, i) => {
+      const weights = postings(shards[i], term, prefixLast && i === queryTerms.length - 1);
+      if (scores === null) {
+        scores = weights;
+        return;
+      }
+      for (const [doc, score] of scores) {
+        if (weights.has(doc)) scores.set(doc, score + weights.get(doc));
+        else scores.delete(doc);
+      }
+    });
+
+    const ranked = [...scores]
+      .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+      .slice(0, limit);
+    const chunk = index.docs.chunk;
+    const tables = await Promise.all(ranked.map(([doc]) => load(index.docs.files[Math.floor(doc / chunk)])));
+
+    // Highlighting on the result page marks the words as typed
+    const matched = Object.fromEntries(queryWords.map(word => [word, true]));
+    return ranked.map(([doc, score], i) => {
+      const [location, title, text] = tables[i][doc % chunk];
+      return [{ location, title, text, score, terms: matched }];
+    });
+  }
+
+  self.addEventListener("message", event => {
+    const message = event.data;
+    if (message.type === SETUP) {
+      loadManifest().catch(() => {});
+      self.postMessage({ type: READY });
+    } else if (message.type === QUERY) {
+      // Answer only the newest query; earlier ones may resolve after it
+      const current = ++latest;
+      query(message.data)
+        .catch(() => [])
+        .then(items => {
+          if (current === latest) self.postMessage({ type: RESULT, data: { items } });
+        });
+    }
+  });
+})();
@@ -0,0 +1,108 @@
+/* DRUIDS offline service worker
+ *
+ * hooks/offline.py writes precache-manifest.json (cache key -> content hash)
+ * and stamps its version below, so every deploy that changes a precached
+ * file installs a new worker. Installing diffs the new manifest against the
+ * one applied last time and refetches only changed files. Precached files
+ * are served cache-first; other same-origin requests are served from the
+ * runtime cache and refreshed in the background.
+ */
+"use strict";
+
+const VERSION = "__PRECACHE_VERSION__";
+const SCOPE = self.registration.scope;
+const MANIFEST_URL = new URL("precache-manifest.json", SCOPE).href;
+// The manifest that was applied to the precache, stored alongside it
+const APPLIED_KEY = new URL("__precache-manifest__", SCOPE).href;
+const PRECACHE = "druids-precache";
+const RUNTIME = "druids-runtime";
+
+async function appliedManifest(cache) {
+  const response = await cache.match(APPLIED_KEY);
+  return response ? response.json() : { version: null, files: {} };
+}
+
+async function updatePrecache() {
+  const response = await fetch(MANIFEST_URL, { cache: "no-store" });
+  if (!response.ok) throw new Error(`Precache manifest: HTTP ${response.status}`);
+  const manifest = await response.json();
+
+  const cache = await caches.open(PRECACHE);
+  const previous = await appliedManifest(cache);
+  const applied = { version: manifest.version, files: {} };
+
+  await Promise.all(Object.entries(manifest.files).map(async ([key, hash]) => {
+    const url = new URL(key, SCOPE).href;
+    if (previous.files[key] === hash && await cache.match(url)) {
+      applied.files[key] = hash;
+      return;
+    }
+    try {
+      const file = await fetch(url, { cache: "no-cache" });
+      if (file.ok) {
+        await cache.put(url, file);
+        applied.files[key] = hash;
+      }
+    } catch (error) {
+      // Left out of the applied manifest, so the next update retries it
+    }
+  }));
+
+  // Drop files that are no longer part of the site shell
+  await Promise.all(Object.keys(previous.files)
+    .filter(key => !(key in manifest.files))
+    .map(key => cache.delete(new URL(key, SCOPE).href)));
+
+  await cache.put(APPLIED_KEY, new Response(JSON.stringify(applied), {
+    headers: { "Content-Type": "application/json" }
+  }));
+}
+
+self.addEventListener("install", event => {
+  event.waitUntil(updatePrecache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener("activate", event => {
+  event.waitUntil(self.clients.claim());
+});
+
+async function respond(event, key) {
+  const precached = await caches.open(PRECACHE).then(cache => cache.match(key));
+  if (precached) return precached;
+
+  const runtime = await caches.open(RUNTIME);
+  const network = fetch(event.request).then(response => {
+    if (response.ok && response.type === "basic") runtime.put(key, response.clone());
+    return response;
+  });
+
+  const cached = await runtime.match(key);
+  if (cached) {
+    // Stale-while-revalidate: answer now, refresh for the next visit
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+
+  try {
+    return await network;
+  } catch (error) {
+    if (event.request.mode === "navigate") {
+      const fallback = await caches.match(new URL("404.html", SCOPE).href);
+      if (fallback) return fallback;
+    }
+    throw error;
+  }
+}
+
+self.addEventListener("fetch", event => {
+  const request = event.request;
+  if (request.method !== "GET" || !request.url.startsWith(SCOPE)) return;
+
+  // Query strings and fragments don't change static files
+  const url = new URL(request.url);
+  event.respondWith(respond(event, url.origin + url.pathname));
+});
+
+self.addEventListener("message", event => {
+  if (event.data === "version" && event.ports[0]) event.ports[0].postMessage(VERSION);
+});
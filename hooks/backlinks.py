@@ -0,0 +1,82 @@
+"""
+MkDocs hook that precomputes the site-wide backlinks index.
+
+The reverse-link map is built once per build in on_nav from the parsed
+corpus, each page gets its backlinks through the template context, and the
+whole map is written to backlinks.json for client-side "linked mentions" and
+for the link checks.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path, PurePosixPath
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import build_corpus
+
+BACKLINKS_FILE = 'backlinks.json'
+
+H1_PATTERN = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.MULTILINE)
+
+_index = {'pages': {}, 'backlinks': {}}
+
+
+def page_title(record, text: str) -> str:
+    """Frontmatter title, then first H1, then the filename"""
+    if record.frontmatter and record.frontmatter.get('title'):
+        return str(record.frontmatter['title'])
+    match = H1_PATTERN.search(text)
+    if match:
+        return match.group(1)
+    name = PurePosixPath(record.path).stem
+    if name in ('index', 'README'):
+        name = PurePosixPath(record.path).parent.name or 'Home'
+    return name.replace('-', ' ').replace('_', ' ').capitalize()
+
+
+def build_index(files) -> dict:
+    """
+    Build the backlinks index from the MkDocs file collection
+
+    Args:
+        files: MkDocs Files
+
+    Returns:
+        Dict with 'pages' (url -> title) and 'backlinks' (url -> linking urls)
+    """
+    corpus = build_corpus(files)
+    titles = {
+        file.src_uri: page_title(corpus.pages[file.src_uri], file.content_string)
+        for file in files.documentation_pages()
+    }
+
+    urls = {file.src_uri: file.url for file in files.documentation_pages()}
+    return {
+        'pages': {urls[path]: titles[path] for path in sorted(urls)},
+        'backlinks': {
+            urls[target]: [urls[source] for source in sources]
+            for target, sources in corpus.backlink_map().items()
+        },
+    }
+
+
+def on_nav(nav, config, files):
+    global _index
+    _index = build_index(files)
+    return nav
+
+
+def on_page_context(context, page, config, nav):
+    context['backlinks'] = [
+        {'title': _index['pages'].get(url, url), 'url': url}
+        for url in _index['backlinks'].get(page.url, [])
+    ]
+    return context
+
+
+def on_post_build(config):
+    output = Path(config['site_dir']) / BACKLINKS_FILE
+    output.write_text(json.dumps(_index, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
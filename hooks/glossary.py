@@ -0,0 +1,191 @@
+"""
+MkDocs hook that links glossary terms to their definitions.
+
+The terms of docs/reference/glossary.md (its level-3 headings, with aliases
+such as "OpSec (Operational Security)" or "Push/Pull") are compiled into one
+Aho-Corasick automaton at on_config. Each page's markdown is then scanned
+once: the first occurrence of every term outside code, links, headings and
+HTML becomes a link to the definition whose title shows the definition as a
+tooltip (content.tooltips).
+"""
+
+import posixpath
+import re
+import sys
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.aho_corasick import AhoCorasick
+from validators.markdown_tokens import Fence, Heading, tokenize
+
+GLOSSARY_PAGE = 'reference/glossary.md'
+TERM_LEVEL = 3
+MAX_DEFINITION_LENGTH = 200
+
+# Inline spans that must not be touched: code, links, wikilinks, images,
+# reference links, autolinks/HTML tags, bare URLs and attr lists
+PROTECTED_PATTERN = re.compile(
+    r'(`+).*?\1'
+    r'|!?\[\[[^\]]*\]\]'
+    r'|!?\[[^\]]*\]\([^)]*\)'
+    r'|!?\[[^\]]*\]\[[^\]]*\]'
+    r'|<[^>]*>'
+    r'|https?://\S+'
+    r'|\{[^}]*\}'
+)
+# Lines whose text ends up in attributes or definitions rather than prose
+SKIPPED_LINE_PATTERN = re.compile(r'^\s*(?:!!!|\?\?\?|===|\*\[|\[[^\]]+\]:)')
+# Raw HTML blocks run from a line starting with a tag to the next blank line
+HTML_BLOCK_PATTERN = re.compile(r'^\s{0,3}<')
+CODE_OR_LINK_PATTERN = re.compile(r'(`+)(.*?)\1|!?\[([^\]]*)\]\([^)]*\)')
+MARKUP_PATTERN = re.compile(r'\*\*|__')
+BULLET_PATTERN = re.compile(r'^\s*[-*+]\s+')
+
+
+class GlossaryEntry(NamedTuple):
+    term: str
+    anchor: str
+    definition: str
+
+
+def term_aliases(term: str) -> List[str]:
+    """
+    Spellings a glossary heading is matched by
+
+    "OpSec (Operational Security)" -> OpSec, Operational Security;
+    "Push/Pull" -> Push/Pull, Push, Pull; surrounding quotes are dropped.
+    """
+    term = term.strip().strip('"“”')
+    aliases = []
+    match = re.match(r'^(.*?)\s*\(([^)]+)\)$', term)
+    if match:
+        aliases.extend([match.group(1), match.group(2)])
+    else:
+        aliases.append(term)
+        if re.fullmatch(r'\w+(?:/\w+)+', term):
+            aliases.extend(term.split('/'))
+    return [alias.strip() for alias in aliases if alias.strip()]
+
+
+def _definition(lines: List[str]) -> str:
+    """Plain-text tooltip of a definition paragraph; list items are joined with ';'"""
+    parts = []
+    for line in lines:
+        bullet = BULLET_PATTERN.match(line)
+        if bullet:
+            line = line[bullet.end():]
+        if parts:
+            parts.append('; ' if bullet and not parts[-1].endswith(':') else ' ')
+        line = CODE_OR_LINK_PATTERN.sub(lambda m: m.group(2) if m.group(1) else m.group(3), line)
+        parts.append(MARKUP_PATTERN.sub('', line).strip())
+    text = ''.join(parts).replace('"', "'")
+    if len(text) > MAX_DEFINITION_LENGTH:
+        text = text[:MAX_DEFINITION_LENGTH - 1].rsplit(' ', 1)[0] + '…'
+    return text
+
+
+def parse_glossary(text: str) -> List[GlossaryEntry]:
+    """Entries of the glossary page: term headings and their first paragraph"""
+    page = tokenize(text)
+    lines = text.split('\n')
+    entries = []
+    for heading in page.headings:
+        if heading.level != TERM_LEVEL:
+            continue
+        paragraph = []
+        for line in lines[heading.line:]:
+            if line.lstrip().startswith('#') or (not line.strip() and paragraph):
+                break
+            if line.strip():
+                paragraph.append(line)
+        entries.append(GlossaryEntry(heading.text, heading.slug, _definition(paragraph)))
+    return entries
+
+
+def build_matcher(entries: List[GlossaryEntry]) -> AhoCorasick:
+    return AhoCorasick(
+        (alias, index) for index, entry in enumerate(entries) for alias in term_aliases(entry.term)
+    )
+
+
+def _protected_spans(line: str) -> List[Tuple[int, int]]:
+    return [match.span() for match in PROTECTED_PATTERN.finditer(line)]
+
+
+def link_terms(markdown: str, entries: List[GlossaryEntry], matcher: AhoCorasick,
+               glossary_url: str) -> str:
+    """
+    Link the first occurrence of every glossary term in a page
+
+    Args:
+        markdown: Page markdown without frontmatter
+        entries: Glossary entries, indexed by the matcher's values
+        matcher: Automaton built by build_matcher()
+        glossary_url: Link to the glossary page relative to this page
+
+    Returns:
+        The markdown with term links inserted
+    """
+    page = tokenize(markdown)
+    skipped: Set[int] = {heading.line for heading in page.of(Heading)}
+    for fence in page.of(Fence):
+        skipped.update(range(fence.line, fence.end + 1))
+
+    linked: Set[int] = set()
+    lines = markdown.split('\n')
+    in_html = False
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            in_html = False
+            continue
+        if number in skipped:
+            continue
+        in_html = in_html or bool(HTML_BLOCK_PATTERN.match(line))
+        if in_html or SKIPPED_LINE_PATTERN.match(line):
+            continue
+        matches = matcher.find_words(line)
+        if not matches:
+            continue
+
+        protected = _protected_spans(line)
+        pieces = []
+        position = 0
+        for start, end, index in matches:
+            if index in linked or any(start < span_end and end > span_start for span_start, span_end in protected):
+                continue
+            linked.add(index)
+            entry = entries[index]
+            pieces.append(line[position:start])
+            pieces.append(f'[{line[start:end]}]({glossary_url}#{entry.anchor} "{entry.definition}")')
+            position = end
+        if pieces:
+            lines[number - 1] = ''.join(pieces) + line[position:]
+        if len(linked) == len(entries):
+            break
+    return '\n'.join(lines)
+
+
+_entries: List[GlossaryEntry] = []
+_matcher: Optional[AhoCorasick] = None
+
+
+def on_config(config):
+    global _entries, _matcher
+    glossary = Path(config['docs_dir']) / GLOSSARY_PAGE
+    if glossary.exists():
+        _entries = parse_glossary(glossary.read_text(encoding='utf-8'))
+        _matcher = build_matcher(_entries)
+    else:
+        _entries, _matcher = [], None
+    return config
+
+
+def on_page_markdown(markdown, page, config, files):
+    source = page.file.src_uri
+    if _matcher is None or source == GLOSSARY_PAGE:
+        return markdown
+    glossary_url = posixpath.relpath(GLOSSARY_PAGE, posixpath.dirname(source) or '.')
+    return link_terms(markdown, _entries, _matcher, glossary_url)
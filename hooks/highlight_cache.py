@@ -0,0 +1,164 @@
+"""
+MkDocs hook that caches Pygments highlighting of code blocks.
+
+pymdownx.highlight calls pygments.highlight() once per code block on every
+build. This hook wraps that call with a cache keyed by (lexer, formatter
+options, code hash) that is shared by all pages and persisted between builds
+in .cache/druids/highlight.json, so repeated snippets and unchanged reference
+cards are only highlighted once.
+
+Per-block ids (line spans and anchors such as "__span-3") are swapped for a
+placeholder before formatting, so the same snippet hits the cache regardless
+of its position on the page.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pygments
+import pymdownx
+import pymdownx.highlight
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.render_pool import share
+
+log = logging.getLogger('mkdocs.hooks.highlight_cache')
+
+CACHE_VERSION = '1'
+CACHE_FILE = Path('.cache') / 'druids' / 'highlight.json'
+
+# Private-use characters pass through Pygments' HTML escaping unchanged
+SPANS_PLACEHOLDER = '\ue000spans\ue000'
+ANCHORS_PLACEHOLDER = '\ue000anchors\ue000'
+
+
+class HighlightCache:
+    """Memoizes pygments.highlight() output"""
+
+    def __init__(self, path=None, highlight=pygments.highlight):
+        self.path = Path(path) if path else None
+        self.highlight = highlight
+        self.entries = {}
+        self.used = set()
+        self.added = set()
+        self.hits = 0
+        self.misses = 0
+        self.version = f'{CACHE_VERSION}:{pygments.__version__}:{pymdownx.__version__}'
+
+    def load(self):
+        """Read the on-disk cache; a version mismatch or unreadable file starts empty"""
+        if self.path and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == self.version:
+                self.entries = data.get('entries', {})
+        return self
+
+    def save(self):
+        """Write back the entries used by this build, dropping stale ones"""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entries = {key: self.entries[key] for key in sorted(self.used) if key in self.entries}
+        tmp = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'version': self.version, 'entries': entries}), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def key(code, lexer, formatter):
+        options = {k: v for k, v in formatter.options.items() if k not in ('linespans', 'lineanchors')}
+        options['linespans'] = bool(formatter.linespans)
+        options['lineanchors'] = bool(formatter.lineanchors)
+        parts = [
+            type(lexer).__name__,
+            repr(sorted(lexer.options.items())),
+            type(formatter).__name__,
+            repr(sorted(options.items(), key=lambda item: item[0])),
+            code,
+        ]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def __call__(self, code, lexer, formatter, outfile=None):
+        if outfile is not None or SPANS_PLACEHOLDER[0] in code:
+            return self.highlight(code, lexer, formatter, outfile)
+
+        key = self.key(code, lexer, formatter)
+        self.used.add(key)
+        linespans, lineanchors = formatter.linespans, formatter.lineanchors
+
+        html = self.entries.get(key)
+        if html is None:
+            self.misses += 1
+            formatter.linespans = SPANS_PLACEHOLDER if linespans else ''
+            formatter.lineanchors = ANCHORS_PLACEHOLDER if lineanchors else ''
+            try:
+                html = self.highlight(code, lexer, formatter)
+            finally:
+                formatter.linespans, formatter.lineanchors = linespans, lineanchors
+            self.entries[key] = html
+            self.added.add(key)
+        else:
+            self.hits += 1
+
+        return html.replace(SPANS_PLACEHOLDER, linespans).replace(ANCHORS_PLACEHOLDER, lineanchors)
+
+    def export(self):
+        """Entries added and used since the last export; used by render workers"""
+        changes = {
+            'entries': {key: self.entries[key] for key in self.added},
+            'used': sorted(self.used),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+        self.added, self.used, self.hits, self.misses = set(), set(), 0, 0
+        return changes
+
+    def merge(self, changes):
+        self.entries.update(changes['entries'])
+        self.used.update(changes['used'])
+        self.hits += changes['hits']
+        self.misses += changes['misses']
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+_cache = None
+
+
+def on_config(config):
+    global _cache
+    root = Path(config['config_file_path']).parent if config.get('config_file_path') else Path.cwd()
+    _cache = HighlightCache(root / CACHE_FILE).load()
+    pymdownx.highlight.highlight = _cache
+    # Pages rendered by hooks/parallel_render.py highlight in worker processes
+    share('highlight', _cache)
+    return config
+
+
+def on_post_build(config):
+    if _cache is None:
+        return
+    _cache.save()
+    stats = _cache.stats()
+    log.info(
+        f"Highlight cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} hit rate)"
+    )
+
+
+def on_shutdown():
+    pymdownx.highlight.highlight = pygments.highlight
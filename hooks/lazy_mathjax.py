@@ -0,0 +1,71 @@
+"""
+MkDocs hook that loads MathJax only on pages with math.
+
+tex-mml-chtml.js is several times the weight of a whole page, but only
+pages with pymdownx.arithmatex output use it. Instead of loading it
+everywhere from extra_javascript, this hook appends a hidden marker that
+carries the library's URL to the content of those pages and marks them
+(page.meta['mathjax']). docs/assets/js/mathjax.js, which holds the
+MathJax configuration, loads the library when a page has the marker and
+typesets again after instant navigation.
+
+The library is a pinned release self-hosted like the other CDN scripts
+(validators/vendor.py).
+"""
+
+import html
+import logging
+import sys
+from pathlib import Path
+
+from mkdocs.structure.files import File
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.vendor import vendor_scripts
+
+log = logging.getLogger('mkdocs.hooks.lazy_mathjax')
+
+MATHJAX_URL = 'https://cdn.jsdelivr.net/npm/mathjax@3.2.2/es5/tex-mml-chtml.js'
+
+# As emitted by pymdownx.arithmatex with generic: true
+MATH_CLASS = 'class="arithmatex"'
+
+_state = {}
+
+
+def marker(library: dict) -> str:
+    """Hidden element the loader reads the library URL from"""
+    attributes = f'data-mathjax-src="{html.escape(library["src"])}"'
+    if library.get('integrity'):
+        attributes += f' data-mathjax-integrity="{library["integrity"]}"'
+    return f'<div class="druids-mathjax" {attributes} hidden></div>'
+
+
+def on_config(config):
+    root = Path(config['config_file_path']).parent if config.get('config_file_path') else Path.cwd()
+    run = vendor_scripts([MATHJAX_URL], root)
+    vendored = run.scripts.get(MATHJAX_URL)
+    if vendored is None:
+        log.warning(f"Not self-hosting {MATHJAX_URL}: {run.errors[MATHJAX_URL]}")
+        _state.update(library={'src': MATHJAX_URL}, files={})
+    else:
+        _state.update(library={'src': vendored.src, 'integrity': vendored.integrity}, files=vendored.files)
+    return config
+
+
+def on_files(files, config):
+    for src_uri, content in _state.get('files', {}).items():
+        files.append(File.generated(config, src_uri, content=content))
+    return files
+
+
+def on_page_content(html_content, page, config, files):
+    if 'library' not in _state:
+        return html_content
+    count = html_content.count(MATH_CLASS)
+    if count:
+        page.meta['mathjax'] = count
+        html_content += marker(_state['library'])
+    return html_content
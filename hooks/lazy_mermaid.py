@@ -0,0 +1,91 @@
+"""
+MkDocs hook that renders Mermaid diagrams lazily.
+
+Material loads the Mermaid library and renders every diagram as soon as a
+page with a `pre.mermaid` block opens. This hook rewrites those blocks at
+build time into placeholders that reserve an estimated height and carry
+the diagram source, and marks the page (page.meta['mermaid']).
+docs/assets/js/mermaid.js fetches the library on the first placeholder
+that nears the viewport and renders each diagram only then, so pages
+without diagrams never load Mermaid and long pages don't render
+off-screen diagrams up front.
+
+The library is a pinned release self-hosted like the other CDN scripts
+(validators/vendor.py).
+"""
+
+import html
+import logging
+import re
+import sys
+from pathlib import Path
+
+from mkdocs.structure.files import File
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.vendor import vendor_scripts
+
+log = logging.getLogger('mkdocs.hooks.lazy_mermaid')
+
+MERMAID_URL = 'https://cdn.jsdelivr.net/npm/mermaid@11.4.1/dist/mermaid.min.js'
+
+# As emitted by the pymdownx.superfences mermaid custom fence
+MERMAID_BLOCK = re.compile(r'<pre class="mermaid"><code>(.*?)</code></pre>', re.DOTALL)
+
+# Placeholder height bounds in px; the rendered SVG replaces the estimate
+MIN_HEIGHT = 160
+MAX_HEIGHT = 800
+
+_state = {}
+
+
+def estimate_height(source: str) -> int:
+    """Rough rendered height of a diagram from its statement count and direction"""
+    lines = [line.strip() for line in source.splitlines()]
+    statements = [line for line in lines[1:] if line and not line.startswith('%%')]
+    header = lines[0] if lines else ''
+    if re.match(r'(?:graph|flowchart)\s+(?:LR|RL)\b', header):
+        height = 120 + 12 * len(statements)
+    else:
+        height = 80 + 40 * len(statements)
+    return max(MIN_HEIGHT, min(MAX_HEIGHT, height))
+
+
+def placeholder(source: str, library: dict) -> str:
+    """Container the loader renders into; the escaped source stays in a hidden <pre>"""
+    attributes = f'data-mermaid-src="{html.escape(library["src"])}"'
+    if library.get('integrity'):
+        attributes += f' data-mermaid-integrity="{library["integrity"]}"'
+    return (
+        f'<div class="druids-mermaid" {attributes} style="min-height: {estimate_height(html.unescape(source))}px">'
+        f'<pre class="druids-mermaid__source" hidden><code>{source}</code></pre></div>'
+    )
+
+
+def on_config(config):
+    root = Path(config['config_file_path']).parent if config.get('config_file_path') else Path.cwd()
+    run = vendor_scripts([MERMAID_URL], root)
+    vendored = run.scripts.get(MERMAID_URL)
+    if vendored is None:
+        log.warning(f"Not self-hosting {MERMAID_URL}: {run.errors[MERMAID_URL]}")
+        _state.update(library={'src': MERMAID_URL}, files={})
+    else:
+        _state.update(library={'src': vendored.src, 'integrity': vendored.integrity}, files=vendored.files)
+    return config
+
+
+def on_files(files, config):
+    for src_uri, content in _state.get('files', {}).items():
+        files.append(File.generated(config, src_uri, content=content))
+    return files
+
+
+def on_page_content(html_content, page, config, files):
+    if 'library' not in _state:
+        return html_content
+    html_content, count = MERMAID_BLOCK.subn(lambda match: placeholder(match.group(1), _state['library']), html_content)
+    if count:
+        page.meta['mermaid'] = count
+    return html_content
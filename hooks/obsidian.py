@@ -0,0 +1,43 @@
+"""
+MkDocs hook that renders Obsidian syntax in one pass per page.
+
+Wikilinks, embeds (transclusion, with cycle detection), callouts and
+%% comments %% are rewritten by validators/obsidian.py in a single
+tokenizing pass over each page's Markdown. Targets resolve by stem against
+an index of the docs files built once in on_files, the same resolution the
+link checks and backlinks use. It runs before every other on_page_markdown,
+so later hooks and plugins only see ordinary Markdown; the pub-obsidian
+link and callout conversions are turned off in mkdocs.yml.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+from mkdocs.plugins import event_priority
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.obsidian import ObsidianEngine
+
+log = logging.getLogger('mkdocs.hooks.obsidian')
+
+_state = {}
+
+
+def on_files(files, config):
+    sources = {file.src_uri: file for file in files if file.abs_src_path}
+    _state['engine'] = ObsidianEngine(sources, lambda path: sources[path].content_string)
+    return files
+
+
+@event_priority(110)  # Before pub-obsidian and the glossary rewrite the page
+def on_page_markdown(markdown, page, config, files):
+    engine = _state.get('engine')
+    if engine is None:
+        return markdown
+    converted = engine.convert(markdown, page.file.src_uri)
+    for problem in converted.problems:
+        log.warning(problem)
+    return converted.markdown
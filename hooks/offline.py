@@ -0,0 +1,99 @@
+"""
+MkDocs hook that generates the offline precache manifest.
+
+After the build every file matching PRECACHE_PATTERNS (the site shell, the
+search shards and the Start and Learn sections) is content-hashed into
+precache-manifest.json. The manifest version is stamped into sw.js, so any
+content change makes browsers install the new service worker, which diffs
+the new manifest against the one it applied last time and refetches only
+the files whose hash changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Optional
+
+log = logging.getLogger(f"mkdocs.hooks.{__name__}")
+
+MANIFEST_FILE = 'precache-manifest.json'
+SERVICE_WORKER_FILE = 'sw.js'
+VERSION_PLACEHOLDER = '__PRECACHE_VERSION__'
+
+# Site-relative paths precached on install; everything else is cached on first use
+PRECACHE_PATTERNS = [
+    'index.html',
+    '404.html',
+    'sitemap.xml',
+    'prefetch.json',
+    'assets/stylesheets/*',
+    'assets/javascripts/bundle.*',
+    'assets/javascripts/workers/*',
+    'assets/js/*',
+    'assets/css/*',
+    'assets/favicons/*',
+    'assets/images/logo.*',
+    'search/shards/*',
+    'start/*',
+    'learn/*',
+]
+EXCLUDE_PATTERNS = ['*.map']
+
+
+def cache_key(rel_path: str) -> str:
+    """URL a file is requested under: directory URLs for index.html pages"""
+    if rel_path == 'index.html':
+        return './'
+    if rel_path.endswith('/index.html'):
+        return rel_path[:-len('index.html')]
+    return rel_path
+
+
+def build_manifest(site_dir: Path) -> Dict:
+    """
+    Hash every precached file of a built site
+
+    Returns:
+        Dict with 'version' (hash over all entries) and 'files' (cache key ->
+        content hash), sorted by key
+    """
+    files = {}
+    for root, _, names in os.walk(site_dir):
+        for name in names:
+            rel_path = os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+            if not any(fnmatch(rel_path, pattern) for pattern in PRECACHE_PATTERNS):
+                continue
+            if any(fnmatch(rel_path, pattern) for pattern in EXCLUDE_PATTERNS):
+                continue
+            digest = hashlib.sha256(Path(root, name).read_bytes()).hexdigest()[:16]
+            files[cache_key(rel_path)] = digest
+
+    files = dict(sorted(files.items()))
+    version = hashlib.sha256(json.dumps(files).encode('utf-8')).hexdigest()[:16]
+    return {'version': version, 'files': files}
+
+
+def write_manifest(site_dir: Path, docs_dir: Optional[Path] = None) -> Dict:
+    """
+    Write the manifest and stamp its version into the service worker
+
+    The unstamped worker is read from docs_dir when given, so builds that
+    keep the previous site/ (--dirty, partial builds) stamp a fresh copy.
+    """
+    manifest = build_manifest(site_dir)
+    (site_dir / MANIFEST_FILE).write_text(json.dumps(manifest, separators=(',', ':')), encoding='utf-8')
+
+    service_worker = site_dir / SERVICE_WORKER_FILE
+    template = docs_dir / SERVICE_WORKER_FILE if docs_dir is not None else service_worker
+    if service_worker.exists() and template.exists():
+        source = template.read_text(encoding='utf-8')
+        service_worker.write_text(source.replace(VERSION_PLACEHOLDER, manifest['version']), encoding='utf-8')
+    return manifest
+
+
+def on_post_build(config):
+    manifest = write_manifest(Path(config['site_dir']), Path(config['docs_dir']))
+    log.info(f"Precache manifest: {len(manifest['files'])} files, version {manifest['version']}")
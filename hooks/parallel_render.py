@@ -0,0 +1,140 @@
+"""
+MkDocs hook that renders pages' Markdown in a process pool.
+
+MkDocs reads and renders every page serially. After on_nav this hook swaps
+in a populate step that still runs on_pre_page and on_page_markdown in
+order in this process, but hands the Markdown -> HTML conversion to forked
+workers (validators/render_pool.py). The results are collected in page
+order at the start of on_env, where on_page_content runs as before, so
+the built site is byte-identical to a serial build.
+
+The pool is opt-in: DRUIDS_RENDER_JOBS sets the number of workers, or
+"auto" for one per CPU; unset or 1 renders serially. `mkdocs serve` and
+platforms without fork always render serially, and so does an MkDocs whose
+private _populate_page no longer has the signature this hook replaces.
+"""
+
+import inspect
+import logging
+import os
+import sys
+from pathlib import Path
+
+from mkdocs.commands import build as mkdocs_build
+from mkdocs.exceptions import BuildError
+from mkdocs.plugins import event_priority
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.render_pool import RenderPool, apply_result, can_fork
+
+log = logging.getLogger('mkdocs.hooks.parallel_render')
+
+# Parameters of mkdocs.commands.build._populate_page (MkDocs 1.6) that _populate_page replaces
+POPULATE_PARAMETERS = ['page', 'config', 'files', 'dirty']
+
+_state = {}
+
+
+def render_jobs() -> int:
+    value = os.environ.get('DRUIDS_RENDER_JOBS', '').strip()
+    if value == 'auto':
+        return os.cpu_count() or 1
+    return max(1, int(value)) if value else 1
+
+
+def can_replace_populate() -> bool:
+    """Whether MkDocs still has the _populate_page this hook stands in for"""
+    populate = getattr(mkdocs_build, '_populate_page', None)
+    if populate is None:
+        return False
+    try:
+        return list(inspect.signature(populate).parameters) == POPULATE_PARAMETERS
+    except (TypeError, ValueError):
+        return False
+
+
+def _page_error(page, error: Exception, action: str) -> None:
+    # Same message as mkdocs.commands.build
+    message = f"Error {action} page '{page.file.src_uri}':"
+    if not isinstance(error, BuildError):
+        message += f" {error}"
+    mkdocs_build.log.error(message)
+
+
+def _populate_page(page, config, files, dirty: bool = False) -> None:
+    """mkdocs.commands.build._populate_page with render and on_page_content deferred to the pool"""
+    config._current_page = page
+    try:
+        if dirty and not page.file.is_modified():
+            return
+
+        page = config.plugins.on_pre_page(page, config=config, files=files)
+        page.read_source(config)
+        assert page.markdown is not None
+        page.markdown = config.plugins.on_page_markdown(
+            page.markdown, page=page, config=config, files=files
+        )
+        _state['pending'].append((page, _state['pool'].submit(page)))
+    except Exception as e:
+        _page_error(page, e, 'reading')
+        raise
+    finally:
+        config._current_page = None
+
+
+def _restore(cancel: bool) -> None:
+    pool = _state.pop('pool', None)
+    if pool is None:
+        return
+    mkdocs_build._populate_page = _state.pop('populate')
+    _state.pop('pending', None)
+    pool.close(cancel=cancel)
+
+
+def on_startup(command, dirty):
+    _state['command'] = command
+
+
+def on_nav(nav, config, files):
+    jobs = render_jobs()
+    if jobs < 2 or _state.get('command') == 'serve' or not can_fork():
+        return nav
+    if not can_replace_populate():
+        log.warning(
+            "DRUIDS_RENDER_JOBS is set, but this MkDocs version's page build step "
+            "is not the one parallel_render replaces; rendering serially"
+        )
+        return nav
+    _state.update(pool=RenderPool(config, files, jobs), pending=[], populate=mkdocs_build._populate_page)
+    mkdocs_build._populate_page = _populate_page
+    log.info(f"Rendering pages with {jobs} workers")
+    return nav
+
+
+@event_priority(200)  # Pages must be complete before any other on_env
+def on_env(env, config, files):
+    if 'pool' not in _state:
+        return env
+    pending = _state['pending']
+    try:
+        for page, future in pending:
+            config._current_page = page
+            try:
+                apply_result(page, future.result(), files)
+                page.content = config.plugins.on_page_content(
+                    page.content, page=page, config=config, files=files
+                )
+            except Exception as e:
+                _page_error(page, e, 'reading')
+                raise
+            finally:
+                config._current_page = None
+    finally:
+        _restore(cancel=True)
+    return env
+
+
+def on_build_error(error):
+    _restore(cancel=True)
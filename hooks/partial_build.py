@@ -0,0 +1,220 @@
+"""
+MkDocs hook that rebuilds only the pages a change affects.
+
+Every build saves a dependency graph (validators/build_graph.py) to
+.cache/druids/build-graph.json next to mkdocs.yml. With DRUIDS_PARTIAL_BUILD=1 and
+`mkdocs build --dirty`, the previous site/ is kept and the graph is diffed
+against the current inputs in on_files: only the changed pages, the pages
+linking to or embedding them and the pages whose backlinks they change are
+read and rendered, changed docs files are copied, and everything else is
+carried forward. Pages that are carried forward get their nav title, nav
+metadata and tags from the graph, and their search entries from the
+full search index of the last build, kept next to the graph because
+hooks/search_shards.py leaves only a stub in site/. A change to mkdocs.yml,
+overrides, hooks, the theme or the glossary (which every page links terms
+to), or an added, removed or renamed page, falls back to a full build.
+"""
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from mkdocs import utils
+from mkdocs.plugins import event_priority
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.build_graph import (
+    GRAPH_VERSION,
+    PAGE_META_KEYS,
+    content_hash,
+    global_hash,
+    load_graph,
+    merge_search_index,
+    nav_signature,
+    plan_rebuild,
+)
+from validators.corpus import build_corpus
+
+log = logging.getLogger('mkdocs.hooks.partial_build')
+
+GRAPH_FILE = Path('.cache') / 'druids' / 'build-graph.json'
+SEARCH_FILE = Path('.cache') / 'druids' / 'search-index.json'
+SEARCH_INDEX = Path('search') / 'search_index.json'
+TAGS_PLUGIN = 'material/tags'
+
+_state = {}
+
+
+def enabled() -> bool:
+    return os.environ.get('DRUIDS_PARTIAL_BUILD') == '1'
+
+
+def project_root(config) -> Path:
+    return Path(config['config_file_path']).parent if config.get('config_file_path') else Path.cwd()
+
+
+def current_graph(files, config) -> dict:
+    """Graph of the current inputs, without the rendered titles"""
+    docs_dir = os.path.abspath(config['docs_dir'])
+    corpus = build_corpus(files)
+    pages = {}
+    for file in files.documentation_pages():
+        text = file.content_string
+        record = corpus.pages[file.src_uri]
+        pages[file.src_uri] = {
+            'hash': content_hash(text.encode('utf-8')),
+            'signature': nav_signature(record.frontmatter, text),
+        }
+    for path, page in pages.items():
+        page['links'] = corpus.outgoing(path)
+        page['embeds'] = corpus.embeds(path)
+
+    other = {}
+    for file in files:
+        if file.src_uri in pages or not file.abs_src_path:
+            continue
+        if os.path.abspath(file.abs_src_path).startswith(docs_dir + os.sep):
+            other[file.src_uri] = content_hash(Path(file.abs_src_path).read_bytes())
+
+    return {
+        'version': GRAPH_VERSION,
+        'site_dir': os.path.abspath(config['site_dir']),
+        'global': global_hash(project_root(config), docs_dir=Path(docs_dir)),
+        'pages': pages,
+        'files': other,
+    }
+
+
+def _modified(file, rebuild: bool):
+    """Override File.is_modified, which --dirty builds consult for every file"""
+    file.is_modified = lambda: rebuild or not os.path.isfile(file.abs_dest_path)
+
+
+def _full_rebuild(files, config, reason: str):
+    log.info(f"Partial build: full rebuild ({reason})")
+    utils.clean_directory(config['site_dir'])
+    for file in files:
+        _modified(file, True)
+    return files
+
+
+def on_files(files, config):
+    global _state
+    graph = current_graph(files, config)
+    root = project_root(config)
+    previous = load_graph(root / GRAPH_FILE)
+    _state = {
+        'graph': graph, 'graph_file': root / GRAPH_FILE, 'search_file': root / SEARCH_FILE,
+        'previous': previous, 'files': files, 'rebuilt': None, 'search': None,
+    }
+    if not enabled():
+        return files
+
+    plan = plan_rebuild(previous, graph)
+    if plan.full:
+        return _full_rebuild(files, config, plan.reason)
+
+    try:
+        _state['search'] = json.loads(_state['search_file'].read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return _full_rebuild(files, config, 'no previous search index')
+
+    _state['rebuilt'] = plan.pages
+    for file in files:
+        if file.src_uri in graph['pages']:
+            _modified(file, file.src_uri in plan.pages)
+        elif file.src_uri in graph['files']:
+            _modified(file, file.src_uri in plan.files)
+        else:
+            # Theme assets are unchanged unless the global hash changed
+            _modified(file, file.generated_by is not None)
+    log.info(
+        f"Partial build: {plan.reason}, rendering {len(plan.pages)} of "
+        f"{len(graph['pages'])} pages, copying {len(plan.files)} changed file(s)"
+    )
+    return files
+
+
+def on_nav(nav, config, files):
+    rebuilt = _state.get('rebuilt')
+    if rebuilt is None:
+        return nav
+    previous = _state['previous']['pages']
+    for file in files.documentation_pages():
+        entry = previous[file.src_uri]
+        if file.page is not None and file.src_uri not in rebuilt and 'title' in entry:
+            # Carried forward: never read, so restore what other pages render of it
+            file.page.title = entry['title']
+            file.page.meta = dict(entry['meta'])
+    return nav
+
+
+@event_priority(110)  # Before the tags plugin exports tags.json
+def on_env(env, config, files):
+    rebuilt = _state.get('rebuilt')
+    tags = config.plugins.get(TAGS_PLUGIN)
+    if rebuilt is None or tags is None or not tags.config.enabled:
+        return env
+    pages = [file.page for file in files.documentation_pages() if file.page is not None]
+    for page in pages:
+        if page.file.src_uri not in rebuilt and tags.filter(page.file):
+            tags.mappings.add(page, '')
+    # Keep the build order of a full build
+    data = tags.mappings.data
+    tags.mappings.data = {page.url: data[page.url] for page in pages if page.url in data}
+    return env
+
+
+def on_page_context(context, page, config, nav):
+    entry = _state['graph']['pages'].get(page.file.src_uri)
+    if entry is not None:
+        entry['title'] = page.title
+        entry['meta'] = {key: page.meta[key] for key in PAGE_META_KEYS if key in page.meta}
+    return context
+
+
+def _write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(data, separators=(',', ':'), default=str), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def on_post_build(config):
+    graph = _state['graph']
+    rebuilt = _state.get('rebuilt')
+    if rebuilt is not None:
+        previous = _state['previous']['pages']
+        for path, page in graph['pages'].items():
+            if path not in rebuilt and 'title' in previous[path]:
+                page['title'], page['meta'] = previous[path]['title'], previous[path]['meta']
+
+    search_index = Path(config['site_dir']) / SEARCH_INDEX
+    if search_index.exists():
+        index = json.loads(search_index.read_text(encoding='utf-8'))
+        if rebuilt is not None:
+            urls = {
+                file.src_uri: file.page.url
+                for file in _state['files'].documentation_pages() if file.page is not None
+            }
+            index = merge_search_index(
+                _state['search'],
+                index,
+                [urls[path] for path in graph['pages'] if path in urls],
+                {urls[path] for path in rebuilt if path in urls},
+            )
+            search_index.write_text(json.dumps(index, separators=(',', ':'), default=str), encoding='utf-8')
+        _write_json(_state['search_file'], index)
+
+    _write_json(_state['graph_file'], graph)
+
+
+def on_build_error(error):
+    # site/ may be half written; the next partial build must start over
+    if 'graph_file' in _state:
+        _state['graph_file'].unlink(missing_ok=True)
+        _state['search_file'].unlink(missing_ok=True)
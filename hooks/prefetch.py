@@ -0,0 +1,66 @@
+"""
+MkDocs hook that writes the navigation prefetch manifest.
+
+For every page the most likely next pages are the nav successor, the most
+prominent outgoing internal links (from the same link graph the validation
+suite builds) and the nav predecessor. The manifest maps each page URL to
+those URLs; docs/assets/js/prefetch.js warms them during idle time so
+navigation.instant can swap pages without waiting on the network.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus, build_corpus
+
+PREFETCH_FILE = 'prefetch.json'
+
+# Outgoing links kept per page, after the nav successor
+LINK_LIMIT = 3
+
+_manifest: Dict[str, List[str]] = {}
+
+
+def build_manifest(pages, corpus: DocsCorpus, link_limit: int = LINK_LIMIT) -> Dict[str, List[str]]:
+    """
+    Likely next pages of every page
+
+    Args:
+        pages: MkDocs Page objects of all documentation pages
+        corpus: Corpus holding the same pages, keyed by src_uri
+        link_limit: Number of outgoing links to keep per page
+
+    Returns:
+        Page URL -> URLs to prefetch, in priority order: nav next, top
+        outgoing links, nav previous
+    """
+    urls = {page.file.src_uri: page.url for page in pages}
+    manifest = {}
+    for page in sorted(pages, key=lambda page: page.url):
+        targets = [page.next_page.url] if page.next_page is not None else []
+        links = [urls[target] for target in corpus.outgoing(page.file.src_uri) if target in urls]
+        targets.extend([url for url in links if url not in targets][:link_limit])
+        if page.previous_page is not None:
+            targets.append(page.previous_page.url)
+
+        targets = list(dict.fromkeys(url for url in targets if url != page.url))
+        if targets:
+            manifest[page.url] = targets
+    return manifest
+
+
+def on_nav(nav, config, files):
+    global _manifest
+    pages = [file.page for file in files.documentation_pages() if file.page is not None]
+    _manifest = build_manifest(pages, build_corpus(files))
+    return nav
+
+
+def on_post_build(config):
+    output = Path(config['site_dir']) / PREFETCH_FILE
+    output.write_text(json.dumps(_manifest, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
@@ -0,0 +1,30 @@
+"""
+MkDocs hook that adds font preload and preconnect hints to every page.
+
+The hints come from the built page itself (validators/resource_hints.py):
+fonts declared by the stylesheets it links and used by its styles are
+preloaded, and external origins its head loads from get a preconnect.
+Static files, theme CSS included, are copied before pages are written,
+so the stylesheets are read from site_dir.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.resource_hints import ResourceHints
+
+_hints = None
+
+
+def on_pre_build(config):
+    global _hints
+    _hints = ResourceHints(Path(config['site_dir']))
+
+
+def on_post_page(output, page, config):
+    if _hints is None:
+        return output
+    return _hints.inject(output, page.url)
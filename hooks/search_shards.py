@@ -0,0 +1,218 @@
+"""
+MkDocs hook that post-processes the search index into prefix shards.
+
+The search plugin writes one search_index.json that has to be downloaded in
+full before the first query. After the build this hook tokenizes and stems
+every entry once, groups the resulting postings by the first character of
+each term and writes small gzip-compressed shards, the document table
+(location, title and a short excerpt for the result snippet) in
+fixed-size chunks and a manifest to search/shards/.
+
+docs/assets/js/search.js is a search worker for Material's search UI: every
+page's configuration points the UI at it instead of the Lunr worker, and it
+answers queries from the manifest and only the shards their terms fall
+into. search_index.json is cut down to its config (which search
+highlighting still reads), so the UI no longer downloads the documents.
+"""
+
+import gzip
+import hashlib
+import html
+import json
+import logging
+import re
+import shutil
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+log = logging.getLogger(f"mkdocs.hooks.{__name__}")
+
+SHARD_DIR = 'search/shards'
+MANIFEST_FILE = 'manifest.json'
+FORMAT_VERSION = 3
+# Material's search worker, replaced in the page configuration by WORKER_SCRIPT
+MATERIAL_WORKER_PATTERN = re.compile(r'("search":\s*"[^"]*?)assets/javascripts/workers/search\.[0-9a-f]+\.min\.js"')
+WORKER_SCRIPT = 'assets/js/search.js'
+
+# Postings weights per occurrence, mirroring the search plugin's field boosts
+FIELD_WEIGHTS = {'title': 10, 'tags': 20, 'text': 1}
+MAX_WEIGHT = 255
+MAX_TERM_LENGTH = 32
+# Entries per document table chunk; results only load the chunks they hit
+DOCS_CHUNK = 512
+# Characters of text kept per entry for the snippet under each result
+EXCERPT_LENGTH = 160
+
+# Lunr's English stop words, as used by the search plugin's stopWordFilter
+STOP_WORDS = frozenset("""
+a able about across after all almost also am among an and any are as at be
+because been but by can cannot could dear did do does either else ever every
+for from get got had has have he her hers him his how however i if in into is
+it its just least let like likely may me might most must my neither no nor not
+of off often on only or other our own rather said say says she should since so
+some than that the their them then there these they this tis to too twas us
+wants was we were what when where which while who whom why will with would yet
+you your
+""".split())
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+ENTITY_PATTERN = re.compile(r'&(?:#\d+|#x[0-9a-f]+|[a-z]+);', re.IGNORECASE)
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+SPACE_PATTERN = re.compile(r'\s+')
+
+
+def stem(word: str) -> str:
+    """
+    Light suffix-stripping stemmer
+
+    Deliberately simple so docs/assets/js/search.js can apply exactly the same
+    rules to query terms: plurals, -ing and -ed forms collapse onto one stem.
+    """
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('sses'):
+        return word[:-2]
+    if word.endswith('ing') and len(word) > 5:
+        return word[:-3]
+    if word.endswith('ed') and len(word) > 4:
+        return word[:-2]
+    if word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+
+def terms(text: str) -> Iterator[str]:
+    """Stemmed, stop-word-filtered terms of a text that may contain HTML"""
+    text = ENTITY_PATTERN.sub(' ', HTML_TAG_PATTERN.sub(' ', text)).lower()
+    for word in WORD_PATTERN.findall(text):
+        if word not in STOP_WORDS and len(word) <= MAX_TERM_LENGTH:
+            yield stem(word)
+
+
+def excerpt(text: str) -> str:
+    """Start of an entry's text as escaped plain text, cut at a word boundary"""
+    plain = SPACE_PATTERN.sub(' ', html.unescape(HTML_TAG_PATTERN.sub(' ', text))).strip()
+    if len(plain) > EXCERPT_LENGTH:
+        plain = plain[:EXCERPT_LENGTH].rsplit(' ', 1)[0] + '…'
+    return html.escape(plain, quote=False)
+
+
+def shard_key(term: str) -> str:
+    """Shard a term belongs to: its first letter, or '0' for digits"""
+    first = term[0]
+    return '0' if first.isdigit() else first
+
+
+def build_shards(index: Dict) -> Tuple[List[List[str]], Dict[str, Dict[str, List[int]]]]:
+    """
+    Build the document table and sharded postings from a search index
+
+    Args:
+        index: Parsed search_index.json
+
+    Returns:
+        Tuple of (docs as [location, title, excerpt] rows, shards) where each shard
+        maps a term to a flat [doc, weight, doc, weight, ...] postings list
+    """
+    docs = []
+    postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+    for number, entry in enumerate(index.get('docs', [])):
+        docs.append([
+            entry['location'],
+            HTML_TAG_PATTERN.sub('', entry.get('title', '')),
+            excerpt(entry.get('text', '')),
+        ])
+        fields = {
+            'title': entry.get('title', ''),
+            'tags': ' '.join(entry.get('tags') or []),
+            'text': entry.get('text', ''),
+        }
+        for field, value in fields.items():
+            for term in terms(value):
+                weights = postings[term]
+                weights[number] = min(weights.get(number, 0) + FIELD_WEIGHTS[field], MAX_WEIGHT)
+
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        flat = []
+        for number, weight in sorted(postings[term].items()):
+            flat.extend((number, weight))
+        shards[shard_key(term)][term] = flat
+    return docs, dict(shards)
+
+
+def _write(directory: Path, name: str, data) -> Dict:
+    """Write compact JSON gzip-compressed under a content-hashed name"""
+    payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    digest = hashlib.sha256(payload).hexdigest()[:10]
+    file_name = f'{name}.{digest}.json.gz'
+    (directory / file_name).write_bytes(gzip.compress(payload, compresslevel=9, mtime=0))
+    return {'file': file_name, 'bytes': len(payload)}
+
+
+def write_shards(site_dir: Path) -> Dict:
+    """
+    Shard site_dir/search/search_index.json
+
+    Returns:
+        The manifest, or an empty dict when the build has no search index
+    """
+    index_file = site_dir / 'search' / 'search_index.json'
+    if not index_file.exists():
+        return {}
+    index = json.loads(index_file.read_text(encoding='utf-8'))
+    docs, shards = build_shards(index)
+
+    directory = site_dir / SHARD_DIR
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+    manifest = {
+        'version': FORMAT_VERSION,
+        'stopwords': sorted(STOP_WORDS),
+        'max_term_length': MAX_TERM_LENGTH,
+        'docs': {'entries': len(docs), 'chunk': DOCS_CHUNK, 'files': []},
+        'shards': {},
+    }
+    for start in range(0, len(docs), DOCS_CHUNK):
+        chunk = _write(directory, f'docs-{start // DOCS_CHUNK}', docs[start:start + DOCS_CHUNK])
+        manifest['docs']['files'].append(chunk['file'])
+    for key in sorted(shards):
+        manifest['shards'][key] = dict(_write(directory, key, shards[key]), terms=len(shards[key]))
+
+    (directory / MANIFEST_FILE).write_text(json.dumps(manifest, separators=(',', ':')), encoding='utf-8')
+    return manifest
+
+
+def strip_search_index(site_dir: Path) -> None:
+    """Drop the documents from search_index.json once they are sharded"""
+    index_file = site_dir / 'search' / 'search_index.json'
+    index = json.loads(index_file.read_text(encoding='utf-8'))
+    index_file.write_text(json.dumps({'config': index.get('config', {}), 'docs': []}), encoding='utf-8')
+
+
+def use_shard_worker(html: str) -> str:
+    """Point the page configuration's search worker at WORKER_SCRIPT"""
+    return MATERIAL_WORKER_PATTERN.sub(rf'\1{WORKER_SCRIPT}"', html, count=1)
+
+
+def on_post_page(output, page, config):
+    return use_shard_worker(output)
+
+
+def on_post_template(output_content, template_name, config):
+    return use_shard_worker(output_content)
+
+
+def on_post_build(config):
+    manifest = write_shards(Path(config['site_dir']))
+    if manifest:
+        strip_search_index(Path(config['site_dir']))
+        largest = max((shard['bytes'] for shard in manifest['shards'].values()), default=0)
+        log.info(
+            f"Search shards: {len(manifest['shards'])} shards for {manifest['docs']['entries']} entries, "
+            f"largest {largest / 1024:.0f} KiB uncompressed"
+        )
@@ -0,0 +1,87 @@
+"""
+MkDocs hook that self-hosts third-party scripts.
+
+Every extra_javascript entry that points at an npm CDN with an exact
+version is fetched once into .cache/druids/vendor (validators/vendor.py),
+emitted under site/assets/vendor with a content-hashed name, and its
+<script> tags get an integrity attribute. Set DRUIDS_VENDOR_DIR to a
+directory of npm tarballs to build without network access. A package must
+be pinned in vendor-lock.json: one without an entry, or that can't be
+fetched, stays on the CDN with a warning, which fails `mkdocs build
+--strict`. DRUIDS_VENDOR_UPDATE=1 records the missing entries.
+
+After the build, any page still loading a script from another origin is
+reported as a warning, which fails `mkdocs build --strict`.
+"""
+
+import logging
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from mkdocs.structure.files import File
+
+# Add the project root to Python path (MkDocs only adds this hooks directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.vendor import LOCK_FILE, vendor_scripts
+
+log = logging.getLogger('mkdocs.hooks.vendor')
+
+EXTERNAL_SCRIPT = re.compile(r'<script\b[^>]*?\ssrc="((?:https?:)?//[^"]+)"')
+
+_state = {}
+
+
+def on_config(config):
+    root = Path(config['config_file_path']).parent if config.get('config_file_path') else Path.cwd()
+    scripts = config['extra_javascript']
+    run = vendor_scripts([str(script) for script in scripts if urlsplit(str(script)).netloc], root)
+    for url, error in run.errors.items():
+        log.warning(f"Not self-hosting {url}: {error}")
+    if run.recorded:
+        log.info(f"Recorded new package integrity in {LOCK_FILE}; commit it to pin the download")
+
+    files, integrity = {}, {}
+    for position, script in enumerate(scripts):
+        vendored = run.scripts.get(str(script))
+        if vendored is None:
+            continue
+        if isinstance(script, str):
+            scripts[position] = vendored.src
+        else:
+            script.path = vendored.src
+        files.update(vendored.files)
+        integrity[vendored.src] = vendored.integrity
+
+    _state.update(files=files, integrity=integrity, external={})
+    _state['tag'] = re.compile(
+        r'(<script\b[^>]*?\ssrc="(?:[^"]*/)?(' + '|'.join(map(re.escape, integrity)) + r')")'
+    ) if integrity else None
+    return config
+
+
+def on_files(files, config):
+    for src_uri, content in _state.get('files', {}).items():
+        files.append(File.generated(config, src_uri, content=content))
+    return files
+
+
+def _add_integrity(match):
+    return f'{match.group(1)} integrity="{_state["integrity"][match.group(2)]}" crossorigin="anonymous"'
+
+
+def on_post_page(output, page, config):
+    if _state.get('tag') is not None:
+        output = _state['tag'].sub(_add_integrity, output)
+    for src in EXTERNAL_SCRIPT.findall(output):
+        _state['external'].setdefault(urlsplit(src).netloc, set()).add(page.file.src_uri)
+    return output
+
+
+def on_post_build(config):
+    for origin, pages in sorted(_state.get('external', {}).items()):
+        log.warning(f"{len(pages)} page(s) load scripts from the external origin {origin}, e.g. {min(pages)}")
+    if _state.get('files'):
+        log.info(f"Self-hosted {len(_state['integrity'])} third-party script(s)")
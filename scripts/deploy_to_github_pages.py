@@ -11,19 +11,29 @@ from pathlib import Path
 import shutil
 
 
-def build_site():
-    """Build the MkDocs site."""
+def build_site(partial=False):
+    """Build the MkDocs site.
+
+    With partial=True the previous site/ is kept and only the pages affected
+    by changes since the last build are re-rendered (hooks/partial_build.py).
+    """
     try:
-        # Clean existing site directory
         site_dir = Path("site")
-        if site_dir.exists():
+        command = ["mkdocs", "build"]
+        env = os.environ.copy()
+        if partial:
+            command.append("--dirty")
+            env["DRUIDS_PARTIAL_BUILD"] = "1"
+        elif site_dir.exists():
+            # Clean existing site directory
             shutil.rmtree(site_dir)
         
         # Build with MkDocs (without strict mode for now)
         result = subprocess.run(
-            ["mkdocs", "build"],
+            command,
             capture_output=True,
-            text=True
+            text=True,
+            env=env
         )
         
         if result.returncode != 0:
@@ -72,7 +82,7 @@ def prepare_deployment_branch():
         return False
 
 
-def deploy_to_github_pages(dry_run=False):
+def deploy_to_github_pages(dry_run=False, partial=False):
     """Deploy the built site to GitHub Pages."""
     try:
         if dry_run:
@@ -82,7 +92,7 @@ def deploy_to_github_pages(dry_run=False):
             }
             
         # Build the site
-        if not build_site():
+        if not build_site(partial=partial):
             return {
                 "success": False,
                 "message": "Build failed"
@@ -150,7 +160,7 @@ if __name__ == "__main__":
     # Main execution
     print("Starting GitHub Pages deployment...")
     
-    result = deploy_to_github_pages()
+    result = deploy_to_github_pages(partial="--partial" in sys.argv)
     
     if result["success"]:
         print(f"Success: {result['message']}")
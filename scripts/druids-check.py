@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+druids-check - Fast standalone docs validation for pre-commit runs
+
+Runs the static checks in-process without pytest. Each check imports what
+it needs only when it runs, and the content checks share one corpus index
+loaded from .cache/druids/corpus.pickle, so unchanged pages are not parsed
+again. The report ends with the time spent importing modules.
+
+Usage: python scripts/druids-check.py [check ...] [--file PATH ...] [--no-cache]
+"""
+
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CORPUS_CACHE = PROJECT_ROOT / '.cache' / 'druids' / 'corpus.pickle'
+
+# Make the project-level validators package importable
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class CheckContext:
+    """Options, the shared corpus and import timings of one run"""
+
+    def __init__(self, docs_dir: Path, cache: Optional[Path], files: Optional[List[str]] = None):
+        self.docs_dir = docs_dir
+        self.cache = cache
+        self.files = files
+        self.import_times: Dict[str, float] = {}
+        self._corpus = None
+
+    def require(self, name: str):
+        """Import a module the first time a check needs it, timing the import"""
+        if name in sys.modules:
+            return sys.modules[name]
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.import_times[name] = time.perf_counter() - start
+        return module
+
+    @property
+    def corpus(self):
+        if self._corpus is None:
+            corpus = self.require('validators.corpus')
+            self._corpus = corpus.DocsCorpus(self.docs_dir).load(self.cache)
+        return self._corpus
+
+    def pages(self) -> List[str]:
+        """Docs-relative pages to report on: the --file arguments, or every page"""
+        pages = self.corpus.pages
+        if self.files is None:
+            return sorted(pages)
+        return sorted(path for path in self.files if path in pages)
+
+
+def issue(path: str, line: int, rule: str, message: str, severity: str = 'error') -> Dict:
+    return {'path': path, 'line': line, 'rule': rule, 'message': message, 'severity': severity}
+
+
+def check_frontmatter(context: CheckContext) -> List[Dict]:
+    """Frontmatter parses as YAML"""
+    corpus = context.corpus
+    return [
+        issue(path, 1, 'frontmatter', f"Invalid YAML frontmatter: {corpus.pages[path].frontmatter_error}")
+        for path in context.pages() if corpus.pages[path].frontmatter_error
+    ]
+
+
+def check_links(context: CheckContext) -> List[Dict]:
+    """Markdown links, anchors and wikilinks resolve"""
+    corpus = context.corpus
+    return [
+        issue(path, found['line'], found['rule'], found['message'])
+        for path in context.pages() for found in corpus.link_issues(corpus.pages[path])
+    ]
+
+
+def check_lint(context: CheckContext) -> List[Dict]:
+    """DRUIDS markdown rules (validators/markdown_linter.py)"""
+    linter_module = context.require('validators.markdown_linter')
+    linter = linter_module.DRUIDSMarkdownLinter(str(PROJECT_ROOT), use_cache=context.cache is not None)
+    results = linter.lint_paths([context.docs_dir / path for path in context.pages()])
+    return [
+        issue(path, found.line, found.rule, found.message, found.severity)
+        for path, issues in results.items() for found in issues
+    ]
+
+
+def check_nav(context: CheckContext) -> List[Dict]:
+    """Nav entries exist; pages missing from the nav are warnings"""
+    yaml = context.require('yaml')
+    nav_index = context.require('validators.nav_index')
+    with open(PROJECT_ROOT / 'mkdocs.yml', encoding='utf-8') as f:
+        index = nav_index.NavIndex.from_config(yaml.safe_load(f) or {})
+    files = context.corpus.files
+    return [
+        issue('mkdocs.yml', 0, 'nav-missing', f"Nav entry not found: {entry.target}")
+        for entry in index.missing(files)
+    ] + [
+        issue(path, 0, 'nav-unlisted', "Page is not in the nav", 'warning')
+        for path in index.unlisted(files)
+    ]
+
+
+def check_config(context: CheckContext) -> List[Dict]:
+    """mkdocs.yml loads with every plugin and hook"""
+    config = context.require('mkdocs.config')
+    exceptions = context.require('mkdocs.exceptions')
+    try:
+        config.load_config(str(PROJECT_ROOT / 'mkdocs.yml'))
+    except (exceptions.ConfigurationError, exceptions.PluginError) as e:
+        return [issue('mkdocs.yml', 0, 'config', str(e))]
+    return []
+
+
+CHECKS: Dict[str, Callable[[CheckContext], List[Dict]]] = {
+    'frontmatter': check_frontmatter,
+    'links': check_links,
+    'lint': check_lint,
+    'nav': check_nav,
+    'config': check_config,
+}
+
+
+def docs_relative(paths: List[str], docs_dir: Path) -> List[str]:
+    relative = []
+    for path in paths:
+        try:
+            relative.append(Path(path).resolve().relative_to(docs_dir.resolve()).as_posix())
+        except ValueError:
+            continue  # Not a docs file (e.g. pre-commit passing mkdocs.yml)
+    return relative
+
+
+def run_checks(names: List[str], context: CheckContext) -> Dict[str, Dict]:
+    """Run checks in order; each result has 'issues' and 'seconds'"""
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        issues = CHECKS[name](context)
+        results[name] = {'issues': issues, 'seconds': time.perf_counter() - start}
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fast DRUIDS docs checks",
+        epilog="Checks: " + ", ".join(f"{name} ({check.__doc__})" for name, check in CHECKS.items()),
+    )
+    parser.add_argument("checks", nargs="*", metavar="check", help="Checks to run (default: all)")
+    parser.add_argument("--file", "-f", action="append", dest="files",
+                        help="Only report on this page (repeatable)")
+    parser.add_argument("--docs", type=Path, default=PROJECT_ROOT / "docs", help="Docs directory")
+    parser.add_argument("--cache", type=Path, default=CORPUS_CACHE, help="Corpus cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every page and write no caches")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)} (choose from {', '.join(CHECKS)})")
+    names = args.checks or list(CHECKS)
+    files = docs_relative(args.files, args.docs) if args.files else None
+    context = CheckContext(args.docs, None if args.no_cache else args.cache, files)
+    context.import_times['druids-check'] = time.perf_counter() - _STARTED
+
+    results = run_checks(names, context)
+
+    errors = 0
+    for name, result in results.items():
+        issues = result['issues']
+        failed = [found for found in issues if found['severity'] == 'error']
+        errors += len(failed)
+        status = "❌" if failed else "⚠️ " if issues else "✅"
+        print(f"{status} {name:<12} {len(issues):>4} issue(s) {result['seconds'] * 1000:8.1f} ms")
+        for found in issues:
+            location = f"{found['path']}:{found['line']}" if found['line'] else found['path']
+            print(f"     {location} [{found['rule']}] {found['message']}")
+
+    imports = sorted(context.import_times.items(), key=lambda item: -item[1])
+    total_imports = sum(seconds for _, seconds in imports)
+    print(f"\n📦 imports: {total_imports * 1000:.1f} ms ("
+          + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in imports) + ")")
+    print(f"⏱️  total: {(time.perf_counter() - _STARTED) * 1000:.1f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
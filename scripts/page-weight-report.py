@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+page-weight-report - Per-page download weight of the built site
+
+Sizes what every page of site/ loads (raw, gzip and brotli when the brotli
+module is installed), checks the per-section budgets in
+config/page-budgets.yml (a script on another origin, which can't be
+measured, fails the check) and appends the gzip totals to a JSON history,
+reporting pages that grew since the previous run.
+
+Usage: python scripts/page-weight-report.py [site_dir] [--json REPORT] [--no-history]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'druids'
+
+# Make the project-level validators package importable
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from validators.page_weight import (  # noqa: E402
+    SizeCache,
+    budget_violations,
+    history_entry,
+    load_budgets,
+    load_history,
+    regressions,
+    save_history,
+    weigh_site,
+)
+
+
+def kib(size: Optional[int]) -> str:
+    return '-' if size is None else f"{size / 1024:.1f}"
+
+
+def current_commit() -> Optional[str]:
+    if os.environ.get('GITHUB_SHA'):
+        return os.environ['GITHUB_SHA']
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Per-page weight and render-blocking budget report")
+    parser.add_argument("site_dir", nargs="?", type=Path, default=PROJECT_ROOT / "site", help="Built site")
+    parser.add_argument("--budgets", type=Path, default=PROJECT_ROOT / "config" / "page-budgets.yml")
+    parser.add_argument("--history", type=Path, default=CACHE_DIR / "page-weight-history.json")
+    parser.add_argument("--no-history", action="store_true", help="Don't record this run")
+    parser.add_argument("--json", type=Path, help="Write the per-page report to this file")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest pages to list")
+    args = parser.parse_args(argv)
+
+    if not (args.site_dir / "index.html").exists():
+        print(f"❌ No built site in {args.site_dir}; run mkdocs build first")
+        return 1
+
+    cache = SizeCache(CACHE_DIR / "asset-sizes.json")
+    weights = weigh_site(args.site_dir, cache)
+    cache.save()
+
+    print(f"📄 {len(weights)} pages          total (KiB)           blocking (KiB)")
+    print(f"{'section':<28} {'raw':>7} {'gzip':>7} {'br':>7} {'raw':>7} {'gzip':>7} {'br':>7}  (median)")
+    sections = sorted({weight.section for weight in weights})
+    for section in sections:
+        pages = [weight for weight in weights if weight.section == section]
+        median = sorted(pages, key=lambda w: w.total.gzip)[len(pages) // 2]
+        print(f"{section:<28} {kib(median.total.raw):>7} {kib(median.total.gzip):>7} {kib(median.total.brotli):>7} "
+              f"{kib(median.blocking.raw):>7} {kib(median.blocking.gzip):>7} {kib(median.blocking.brotli):>7}")
+
+    print(f"\n🏋️  Heaviest pages (gzip, median {kib(int(statistics.median(w.total.gzip for w in weights)))} KiB):")
+    for weight in sorted(weights, key=lambda w: -w.total.gzip)[:args.top]:
+        print(f"   {kib(weight.total.gzip):>7} KiB  ({kib(weight.blocking.gzip)} blocking)  {weight.page}")
+
+    missing = {reference for weight in weights for reference in weight.missing}
+    external = {reference for weight in weights for reference in weight.external}
+    if external:
+        print(f"\n🌐 Not measured, on other origins: {', '.join(sorted(external))}")
+    if missing:
+        print(f"\n⚠️  Referenced but not in the site: {', '.join(sorted(missing))}")
+
+    if args.json:
+        report = [{
+            'page': weight.page,
+            'section': weight.section,
+            'total': weight.total._asdict(),
+            'blocking': weight.blocking._asdict(),
+            'assets': [asset._asdict() for asset in weight.assets],
+            'external': weight.external,
+            'external_scripts': weight.external_scripts,
+            'missing': weight.missing,
+        } for weight in weights]
+        args.json.write_text(json.dumps(report, indent=1), encoding='utf-8')
+
+    if not args.no_history:
+        history = load_history(args.history)
+        entry = history_entry(weights, current_commit())
+        grown = regressions(history[-1], entry) if history else []
+        save_history(args.history, history + [entry])
+        if grown:
+            print(f"\n📈 Grown since {history[-1].get('commit') or history[-1]['timestamp']}:")
+            for line in grown:
+                print(f"   {line}")
+
+    violations = budget_violations(weights, load_budgets(args.budgets))
+    if violations:
+        print(f"\n❌ {len(violations)} budget violation(s):")
+        for line in violations:
+            print(f"   {line}")
+        return 1
+    print("\n✅ All pages within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,75 @@ runs Act-based workflow simulation, and generates actionable deployment checklis
 """
 
 import argparse
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+# Make the project-level validators package importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.build_log import CATEGORIES, CATEGORY_INFO, BuildLogStream, stream_build
+
+# Files and directories whose contents decide the outcome of the checks
+INPUT_PATHS = [
+    'dependencies/requirements.txt',
+    'mkdocs.yml',
+    'docs',
+    'overrides',
+    'hooks',
+    'validators',
+    'tests',
+    'run_tests.py',
+    '.github/workflows',
+]
+CACHE_FILE = Path('.cache') / 'druids' / 'deployment-ready.json'
+CACHE_VERSION = 1
+
+# Checks that inspect state outside the hashed inputs are always re-run
+UNCACHED_CHECKS = {'Git Repository'}
+
+# Checks that must finish before another starts in concurrent mode; the
+# dependency install can change what the other checks run against
+CHECK_PREREQUISITES = {
+    'MkDocs Configuration': ['Dependencies'],
+    'Build Process': ['Dependencies'],
+    'Deployment Workflow': ['Dependencies'],
+    'Comprehensive Tests': ['Dependencies'],
+}
+
+
+def compute_input_hash(project_root: Path, environment: str) -> str:
+    """
+    Hash the contents of every input of the readiness checks
+
+    Args:
+        project_root: Project root directory
+        environment: Target environment, part of the key
+
+    Returns:
+        Hex digest that changes whenever requirements, config, docs or tests change
+    """
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{environment}:{sys.version}".encode())
+    for input_path in INPUT_PATHS:
+        path = project_root / input_path
+        files = [path] if path.is_file() else sorted(p for p in path.rglob('*') if p.is_file())
+        for file_path in files:
+            if '__pycache__' in file_path.parts:
+                continue
+            digest.update(file_path.relative_to(project_root).as_posix().encode())
+            digest.update(b'\0')
+            digest.update(file_path.read_bytes())
+            digest.update(b'\0')
+    return digest.hexdigest()
+
 
 # Colors for output
 class Colors:
@@ -27,9 +90,17 @@ class Colors:
 class DeploymentReadinessChecker:
     """Comprehensive deployment readiness validation"""
     
-    def __init__(self, project_root: Optional[Path] = None, environment: str = "production"):
+    def __init__(self, project_root: Optional[Path] = None, environment: str = "production",
+                 concurrent: bool = False, use_cache: bool = True):
         self.project_root = project_root or Path.cwd()
         self.environment = environment
+        self.concurrent = concurrent
+        self.use_cache = use_cache
+        self.build_log: Optional[BuildLogStream] = None
+        # Concurrent runs build into a private directory so the test suite's builds don't collide
+        self.site_dir = self.project_root / (".cache/druids/readiness-site" if concurrent else "site")
+        self.cache_file = self.project_root / CACHE_FILE
+        self._local = threading.local()
         self.results = {
             'environment': environment,
             'timestamp': time.time(),
@@ -43,9 +114,9 @@ class DeploymentReadinessChecker:
     
     def print_header(self, title: str):
         """Print formatted section header"""
-        print(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
-        print(f"{Colors.BLUE}🚀 {title}{Colors.NC}")
-        print(f"{Colors.BLUE}{'=' * 60}{Colors.NC}")
+        self.emit(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
+        self.emit(f"{Colors.BLUE}🚀 {title}{Colors.NC}")
+        self.emit(f"{Colors.BLUE}{'=' * 60}{Colors.NC}")
     
     def print_status(self, status: str, message: str, details: str = ""):
         """Print formatted status message"""
@@ -65,9 +136,27 @@ class DeploymentReadinessChecker:
             'SKIP': '⏭️'
         }.get(status, '•')
         
-        print(f"{color}{icon} {message}{Colors.NC}")
+        self.emit(f"{color}{icon} {message}{Colors.NC}")
         if details:
-            print(f"   {details}")
+            self.emit(f"   {details}")
+    
+    def emit(self, line: str):
+        """Print a line, or buffer it for the running check when checks run concurrently"""
+        record = getattr(self._local, 'record', None)
+        if record is not None:
+            record['output'].append(line)
+        if record is None or not self.concurrent:
+            print(line)
+    
+    def add_blocking_issue(self, issue: str):
+        """Record a blocking issue against the running check"""
+        record = getattr(self._local, 'record', None)
+        (record['blocking_issues'] if record is not None else self.results['blocking_issues']).append(issue)
+    
+    def add_warning(self, warning: str):
+        """Record a warning against the running check"""
+        record = getattr(self._local, 'record', None)
+        (record['warnings'] if record is not None else self.results['warnings']).append(warning)
     
     def run_command(self, cmd: List[str], timeout: int = 60, cwd: Optional[Path] = None) -> Tuple[bool, str, str]:
         """Run command and return success, stdout, stderr"""
@@ -114,7 +203,7 @@ class DeploymentReadinessChecker:
                 self.print_status('FAIL', f"{description}", f"Missing: {file_path}")
                 results['required'][file_path] = False
                 results['all_required_present'] = False
-                self.results['blocking_issues'].append(f"Missing required file: {file_path}")
+                self.add_blocking_issue(f"Missing required file: {file_path}")
         
         # Check optional files
         for file_path, description in optional_files.items():
@@ -125,7 +214,7 @@ class DeploymentReadinessChecker:
             else:
                 self.print_status('WARN', f"{description}", f"Recommended: {file_path}")
                 results['optional'][file_path] = False
-                self.results['warnings'].append(f"Missing recommended file: {file_path}")
+                self.add_warning(f"Missing recommended file: {file_path}")
         
         return results
     
@@ -136,15 +225,9 @@ class DeploymentReadinessChecker:
         results = {'python_version': None, 'dependencies_installed': False, 'missing_packages': []}
         
         # Check Python version
-        success, stdout, stderr = self.run_command([sys.executable, "--version"])
-        if success:
-            python_version = stdout.strip()
-            results['python_version'] = python_version
-            self.print_status('PASS', f"Python available", python_version)
-        else:
-            self.print_status('FAIL', "Python not available", stderr)
-            self.results['blocking_issues'].append("Python interpreter not available")
-            return results
+        python_version = f"Python {sys.version.split()[0]}"
+        results['python_version'] = python_version
+        self.print_status('PASS', f"Python available", python_version)
         
         # Check if requirements.txt exists and install dependencies
         requirements_file = self.project_root / "dependencies" / "requirements.txt"
@@ -160,24 +243,19 @@ class DeploymentReadinessChecker:
                 results['dependencies_installed'] = True
             else:
                 self.print_status('WARN', "Dependency installation issues", stderr)
-                self.results['warnings'].append("Some dependencies may not be properly installed")
+                self.add_warning("Some dependencies may not be properly installed")
         
         # Check critical packages
         critical_packages = ['mkdocs', 'mkdocs-material', 'pytest']
         for package in critical_packages:
-            success, stdout, stderr = self.run_command([
-                sys.executable, "-m", "pip", "show", package
-            ])
-            
-            if success:
-                # Extract version from pip show output
-                version_line = [line for line in stdout.split('\n') if line.startswith('Version:')]
-                version = version_line[0].split(':')[1].strip() if version_line else 'unknown'
+            # Read versions in-process instead of spawning `pip show` per package
+            try:
+                version = metadata.version(package)
                 self.print_status('PASS', f"{package} installed", f"Version: {version}")
-            else:
+            except metadata.PackageNotFoundError:
                 self.print_status('FAIL', f"{package} not installed", "Required for deployment")
                 results['missing_packages'].append(package)
-                self.results['blocking_issues'].append(f"Missing critical package: {package}")
+                self.add_blocking_issue(f"Missing critical package: {package}")
         
         return results
     
@@ -190,7 +268,7 @@ class DeploymentReadinessChecker:
         config_file = self.project_root / "mkdocs.yml"
         if not config_file.exists():
             self.print_status('FAIL', "MkDocs config missing", "mkdocs.yml not found")
-            self.results['blocking_issues'].append("MkDocs configuration file missing")
+            self.add_blocking_issue("MkDocs configuration file missing")
             return results
         
         # Check if config can be loaded
@@ -201,7 +279,7 @@ class DeploymentReadinessChecker:
             results['config_valid'] = True
         else:
             self.print_status('FAIL', "MkDocs config has errors", stderr)
-            self.results['blocking_issues'].append("MkDocs configuration is invalid")
+            self.add_blocking_issue("MkDocs configuration is invalid")
             return results
         
         # Check required sections by parsing YAML
@@ -245,26 +323,50 @@ class DeploymentReadinessChecker:
         results = {'build_success': False, 'build_time': 0, 'warnings': [], 'site_created': False}
         
         # Clean any existing build
-        site_dir = self.project_root / "site"
+        site_dir = self.site_dir
         if site_dir.exists():
             import shutil
             shutil.rmtree(site_dir)
         
-        # Run build
+        # Run build, stopping at the first critical warning
+        self.build_log = BuildLogStream(abort_on_critical=True)
         start_time = time.time()
-        success, stdout, stderr = self.run_command(["mkdocs", "build", "--clean"], timeout=120)
+        build = stream_build(
+            ["mkdocs", "build", "--clean", "--site-dir", str(site_dir)],
+            cwd=self.project_root,
+            stream=self.build_log,
+            timeout=120
+        )
         build_time = time.time() - start_time
         
         results['build_time'] = build_time
+        results['log_summary'] = {
+            category: len(self.build_log.by_category(category))
+            for category in CATEGORIES if category != CATEGORY_INFO
+        }
         
-        if success:
+        if build.aborted:
+            critical = self.build_log.critical[0]
+            self.print_status('FAIL', "Build aborted on critical warning", critical.message)
+            self.add_blocking_issue(f"MkDocs build critical warning: {critical.message}")
+            return results
+        elif build.timed_out:
+            self.print_status('FAIL', "Build timed out", "Command timed out after 120 seconds")
+            self.add_blocking_issue("MkDocs build process fails")
+            return results
+        elif build.success:
             self.print_status('PASS', f"Build completed successfully", f"Duration: {build_time:.1f}s")
             results['build_success'] = True
         else:
-            self.print_status('FAIL', "Build failed", stderr)
-            self.results['blocking_issues'].append("MkDocs build process fails")
+            self.print_status('FAIL', "Build failed", build.output[-2000:])
+            self.add_blocking_issue("MkDocs build process fails")
             return results
         
+        link_warnings = results['log_summary']['link']
+        if link_warnings:
+            self.print_status('WARN', "Broken internal links", f"{link_warnings} reported during build")
+            results['warnings'].append(f"{link_warnings} broken internal links")
+        
         # Check if site directory was created
         if site_dir.exists():
             self.print_status('PASS', "Site directory created")
@@ -281,12 +383,12 @@ class DeploymentReadinessChecker:
                     results['warnings'].append(f"Missing essential file: {file_name}")
         else:
             self.print_status('FAIL', "Site directory not created", "Build may have failed silently")
-            self.results['blocking_issues'].append("Site directory not created during build")
+            self.add_blocking_issue("Site directory not created during build")
         
         # Performance check
         if build_time > 60:
             self.print_status('WARN', "Build time is slow", f"{build_time:.1f}s > 60s")
-            self.results['warnings'].append("Build process is slower than recommended")
+            self.add_warning("Build process is slower than recommended")
         
         return results
     
@@ -303,14 +405,14 @@ class DeploymentReadinessChecker:
             results['act_available'] = True
         else:
             self.print_status('WARN', "Act not available", "Cannot simulate workflow locally")
-            self.results['warnings'].append("Act not available for workflow simulation")
+            self.add_warning("Act not available for workflow simulation")
             return results
         
         # Check workflow file
         workflow_file = self.project_root / ".github" / "workflows" / "deploy.yml"
         if not workflow_file.exists():
             self.print_status('FAIL', "Deployment workflow missing", "No deploy.yml found")
-            self.results['blocking_issues'].append("Deployment workflow file missing")
+            self.add_blocking_issue("Deployment workflow file missing")
             return results
         
         # Validate workflow syntax with Act
@@ -323,7 +425,7 @@ class DeploymentReadinessChecker:
             results['workflow_valid'] = True
         else:
             self.print_status('FAIL', "Workflow syntax error", stderr)
-            self.results['blocking_issues'].append("Deployment workflow has syntax errors")
+            self.add_blocking_issue("Deployment workflow has syntax errors")
             return results
         
         # Simulate workflow execution
@@ -340,7 +442,7 @@ class DeploymentReadinessChecker:
             results['simulation_success'] = True
         else:
             self.print_status('WARN', "Workflow simulation issues", "Check configuration")
-            self.results['warnings'].append("Workflow simulation encountered issues")
+            self.add_warning("Workflow simulation encountered issues")
         
         return results
     
@@ -354,7 +456,7 @@ class DeploymentReadinessChecker:
         success, stdout, stderr = self.run_command(["git", "status"])
         if not success:
             self.print_status('FAIL', "Not a Git repository", "Initialize Git repository first")
-            self.results['blocking_issues'].append("Project is not a Git repository")
+            self.add_blocking_issue("Project is not a Git repository")
             return results
         
         results['is_git_repo'] = True
@@ -366,7 +468,7 @@ class DeploymentReadinessChecker:
             results['clean_working_tree'] = True
         else:
             self.print_status('WARN', "Working tree has changes", "Consider committing changes before deployment")
-            self.results['warnings'].append("Uncommitted changes in working tree")
+            self.add_warning("Uncommitted changes in working tree")
         
         # Check current branch
         success, stdout, stderr = self.run_command(["git", "branch", "--show-current"])
@@ -378,7 +480,7 @@ class DeploymentReadinessChecker:
             else:
                 self.print_status('WARN', f"Not on main branch", f"Current: {current_branch}")
                 if self.environment == "production":
-                    self.results['warnings'].append(f"Not on main branch for production deployment")
+                    self.add_warning(f"Not on main branch for production deployment")
         
         return results
     
@@ -392,7 +494,7 @@ class DeploymentReadinessChecker:
         test_runner = self.project_root / "run_tests.py"
         if not test_runner.exists():
             self.print_status('WARN', "Test runner not found", "Cannot run comprehensive tests")
-            self.results['warnings'].append("No comprehensive test runner available")
+            self.add_warning("No comprehensive test runner available")
             return results
         
         # Run comprehensive tests
@@ -406,7 +508,7 @@ class DeploymentReadinessChecker:
             results['tests_passed'] = True
         else:
             self.print_status('FAIL', "Some tests failed", "Review test output for details")
-            self.results['blocking_issues'].append("Comprehensive tests are failing")
+            self.add_blocking_issue("Comprehensive tests are failing")
         
         # Parse test results if possible
         if "passed" in stdout or "failed" in stdout:
@@ -511,6 +613,86 @@ class DeploymentReadinessChecker:
         
         return fixes
     
+    def load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached check records from earlier runs"""
+        try:
+            cache = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return cache if cache.get('version') == CACHE_VERSION else {}
+    
+    def save_cache(self, records: Dict[str, Dict[str, Any]], input_hash: str):
+        """
+        Persist check records for the current input hash
+        
+        Checks with blocking issues are not cached so failures such as
+        timeouts or network errors are retried on the next run.
+        """
+        cache = {'version': CACHE_VERSION, 'hash': input_hash, 'checks': {}}
+        for name, record in records.items():
+            if name in UNCACHED_CHECKS or record['blocking_issues'] or 'result' not in record:
+                continue
+            cache['checks'][name] = {key: record[key] for key in ('result', 'blocking_issues', 'warnings', 'output')}
+        
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_file.write_text(json.dumps(cache, default=str), encoding='utf-8')
+        os.replace(tmp_file, self.cache_file)
+    
+    def run_check(self, name: str, func: Callable[[], Dict[str, Any]],
+                  cache: Dict[str, Any], input_hash: Optional[str]) -> Dict[str, Any]:
+        """
+        Run one check, collecting its output and issues into a record
+        
+        Returns:
+            Record with result, blocking_issues, warnings, output and cached keys
+        """
+        cached = cache.get('checks', {}).get(name) if cache.get('hash') == input_hash else None
+        if cached is not None and name not in UNCACHED_CHECKS:
+            record = dict(cached, cached=True)
+            if not self.concurrent:
+                for line in record['output']:
+                    print(line)
+            return record
+        
+        record = {'blocking_issues': [], 'warnings': [], 'output': [], 'cached': False}
+        self._local.record = record
+        try:
+            record['result'] = func()
+        except Exception as e:
+            self.print_status('FAIL', f"{name} check failed", str(e))
+            self.add_blocking_issue(f"{name} check encountered an error: {str(e)}")
+        finally:
+            self._local.record = None
+        return record
+    
+    def run_checks_concurrently(self, checks: List[Tuple[str, Callable[[], Dict[str, Any]]]],
+                                cache: Dict[str, Any], input_hash: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run checks on a thread pool, starting each once its prerequisites finish
+        
+        Each check's output is buffered and printed as one block, in check
+        order, as soon as it and every check before it have completed.
+        """
+        futures = {}
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for name, func in checks:
+                prerequisites = [futures[dep] for dep in CHECK_PREREQUISITES.get(name, ()) if dep in futures]
+                
+                def task(name=name, func=func, prerequisites=prerequisites):
+                    for prerequisite in prerequisites:
+                        prerequisite.result()
+                    return self.run_check(name, func, cache, input_hash)
+                
+                futures[name] = executor.submit(task)
+            
+            records = {}
+            for name, _ in checks:
+                records[name] = futures[name].result()
+                for line in records[name]['output']:
+                    print(line)
+        return records
+    
     def run_full_check(self, auto_fix: bool = False) -> Dict[str, Any]:
         """Run complete deployment readiness check"""
         print(f"{Colors.CYAN}🔍 Deployment Readiness Check for {self.environment.upper()} environment{Colors.NC}")
@@ -527,13 +709,25 @@ class DeploymentReadinessChecker:
             ("Comprehensive Tests", self.run_comprehensive_tests),
         ]
         
-        for check_name, check_func in checks:
-            try:
-                result = check_func()
-                self.results['checks'][check_name] = result
-            except Exception as e:
-                self.print_status('FAIL', f"{check_name} check failed", str(e))
-                self.results['blocking_issues'].append(f"{check_name} check encountered an error: {str(e)}")
+        input_hash = compute_input_hash(self.project_root, self.environment) if self.use_cache else None
+        cache = self.load_cache() if self.use_cache else {}
+        
+        if self.concurrent:
+            records = self.run_checks_concurrently(checks, cache, input_hash)
+        else:
+            records = {name: self.run_check(name, func, cache, input_hash) for name, func in checks}
+        
+        # Merge per-check results in check order so reports are identical in both modes
+        for check_name, _ in checks:
+            record = records[check_name]
+            if 'result' in record:
+                self.results['checks'][check_name] = record['result']
+            self.results['blocking_issues'].extend(record['blocking_issues'])
+            self.results['warnings'].extend(record['warnings'])
+        self.results['cached_checks'] = [name for name, _ in checks if records[name].get('cached')]
+        
+        if self.use_cache:
+            self.save_cache(records, input_hash)
         
         # Auto-fix if requested
         if auto_fix:
@@ -578,6 +772,8 @@ Examples:
   python project-deployment-ready.py --env staging     # Check staging readiness
   python project-deployment-ready.py --auto-fix        # Check and attempt auto-fixes
   python project-deployment-ready.py --save-report     # Save detailed report
+  python project-deployment-ready.py --jobs            # Run independent checks in parallel
+  python project-deployment-ready.py --no-cache        # Ignore results cached for unchanged inputs
         """
     )
     
@@ -600,6 +796,19 @@ Examples:
         help="Save detailed report to specified file"
     )
     
+    parser.add_argument(
+        "--jobs", "--concurrent",
+        action="store_true",
+        dest="concurrent",
+        help="Run independent checks in parallel"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check even if its inputs are unchanged"
+    )
+    
     parser.add_argument(
         "--project-root",
         type=Path,
@@ -609,7 +818,9 @@ Examples:
     args = parser.parse_args()
     
     # Initialize checker
-    checker = DeploymentReadinessChecker(args.project_root, args.env)
+    checker = DeploymentReadinessChecker(
+        args.project_root, args.env, concurrent=args.concurrent, use_cache=not args.no_cache
+    )
     
     try:
         # Run full check
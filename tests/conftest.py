@@ -11,6 +11,8 @@ import pytest
 import yaml
 from mkdocs.config import load_config
 
+from test_utils import MicroSite
+
 
 @pytest.fixture(scope="session")
 def project_root():
@@ -46,6 +48,23 @@ def temp_dir():
     shutil.rmtree(temp_dir)
 
 
+@pytest.fixture(scope="session")
+def micro_site(tmp_path_factory):
+    """
+    Factory for in-process micro-site builds, one harness per mkdocs.yml text
+
+    Usage: micro_site(config_text).build({'index.md': '...'}) -> {'index.html': '...'}
+    """
+    sites = {}
+
+    def _micro_site(config_text):
+        if config_text not in sites:
+            sites[config_text] = MicroSite(tmp_path_factory.mktemp("micro-site"), config_text)
+        return sites[config_text]
+
+    return _micro_site
+
+
 @pytest.fixture
 def sample_markdown_content():
     """Sample markdown content for testing"""
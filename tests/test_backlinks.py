@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed backlinks index (hooks/backlinks.py)
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from mkdocs.structure.files import File, Files
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus, build_corpus
+
+spec = importlib.util.spec_from_file_location(
+    "backlinks_hook", Path(__file__).parent.parent / "hooks" / "backlinks.py"
+)
+backlinks_hook = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(backlinks_hook)
+
+
+@pytest.fixture
+def docs(create_test_file, temp_dir):
+    """index and guide link to the glossary; guide also links to itself"""
+    create_test_file("index.md", "# Home\n\n[Glossary](reference/glossary.md)\n![Logo](logo.png)\n")
+    create_test_file("guide.md", "---\ntitle: Guide\n---\nSee [[glossary]] and [top](#top) [self](guide.md)\n")
+    create_test_file("reference/glossary.md", "# Glossary\n\n[Back home](../index.md)\n")
+    create_test_file("logo.png", "")
+    return temp_dir
+
+
+def make_files(docs_dir):
+    return Files([
+        File(path.relative_to(docs_dir).as_posix(), str(docs_dir), str(docs_dir / "site"), use_directory_urls=True)
+        for path in sorted(docs_dir.rglob("*")) if path.is_file()
+    ])
+
+
+class TestBacklinksIndex:
+    """Test the reverse-link map and the emitted index"""
+
+    @pytest.mark.unit
+    def test_backlink_map(self, docs):
+        """Links and wikilinks resolve once; self-links and asset links are dropped"""
+        corpus = DocsCorpus(docs).load()
+
+        assert corpus.backlink_map() == {
+            "index.md": ["reference/glossary.md"],
+            "reference/glossary.md": ["guide.md", "index.md"],
+        }
+
+    @pytest.mark.unit
+    def test_index_uses_site_urls_and_titles(self, docs):
+        index = backlinks_hook.build_index(make_files(docs))
+
+        assert index["pages"] == {"guide/": "Guide", "./": "Home", "reference/glossary/": "Glossary"}
+        assert index["backlinks"]["reference/glossary/"] == ["guide/", "./"]
+
+    @pytest.mark.unit
+    def test_corpus_shared_within_a_build(self, docs):
+        """Hooks of one build share one parsed corpus; the next build parses again"""
+        files = make_files(docs)
+        corpus = build_corpus(files)
+
+        assert build_corpus(files) is corpus
+        assert corpus.resolve_wikilink("logo.png") == "logo.png"
+        assert build_corpus(make_files(docs)) is not corpus
+
+    @pytest.mark.unit
+    def test_page_context_and_json(self, docs, temp_dir):
+        files = make_files(docs)
+        backlinks_hook.on_nav(None, {}, files)
+
+        page = type("Page", (), {"url": "reference/glossary/"})()
+        context = backlinks_hook.on_page_context({}, page, {}, None)
+        assert context["backlinks"] == [
+            {"title": "Guide", "url": "guide/"},
+            {"title": "Home", "url": "./"},
+        ]
+
+        backlinks_hook.on_post_build({"site_dir": str(temp_dir)})
+        data = json.loads((temp_dir / "backlinks.json").read_text())
+        assert data["backlinks"]["./"] == ["reference/glossary/"]
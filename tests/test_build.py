@@ -11,7 +11,13 @@ from mkdocs.commands.build import build
 from mkdocs.config import load_config
 from mkdocs.exceptions import ConfigurationError
 
-from test_utils import check_command_available, run_command, validate_yaml_file
+from test_utils import (
+    check_command_available,
+    get_nav_index,
+    get_path_index,
+    run_command,
+    validate_yaml_file,
+)
 
 
 class TestMkDocsBuild:
@@ -140,25 +146,11 @@ class TestMkDocsBuild:
                 assert isinstance(plugin, str), f"Invalid plugin type: {type(plugin)}"
 
     @pytest.mark.unit
-    def test_navigation_files_exist(self, mkdocs_config, docs_dir):
+    def test_navigation_files_exist(self, mkdocs_config_path, docs_dir):
         """Test that all files referenced in navigation exist"""
-        nav = mkdocs_config.get("nav", [])
-        missing_files = []
-        
-        def check_nav_item(item):
-            if isinstance(item, dict):
-                for key, value in item.items():
-                    if isinstance(value, str) and not value.startswith("http"):
-                        file_path = docs_dir / value
-                        if not file_path.exists():
-                            missing_files.append(value)
-                    elif isinstance(value, list):
-                        for sub_item in value:
-                            check_nav_item(sub_item)
-        
-        for nav_item in nav:
-            check_nav_item(nav_item)
-        
+        nav_index = get_nav_index(mkdocs_config_path)
+        missing_files = [entry.target for entry in nav_index.missing(get_path_index(docs_dir).files)]
+
         # This is a warning, not a failure
         if missing_files:
             pytest.skip(f"Missing navigation files (optional): {missing_files}")
@@ -4,7 +4,6 @@ Tests for MkDocs build quality - parsing and analyzing build warnings/errors.
 This test module ensures that the build output is clean and catches all link issues.
 """
 
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Set
 
@@ -14,16 +13,106 @@ from test_utils import (
     categorize_warnings,
     format_warning_report,
     parse_mkdocs_output,
-    run_command,
 )
+from validators.build_log import (
+    CATEGORY_ABSOLUTE_LINK,
+    CATEGORY_CRITICAL,
+    CATEGORY_INFO,
+    CATEGORY_LINK,
+    CATEGORY_NAV,
+    BuildLogStream,
+    CriticalBuildWarning,
+    capture_build_log,
+    stream_build,
+)
+
+
+SAMPLE_BUILD_LOG = """INFO    -  Cleaning site directory
+INFO    -  Building documentation to directory: /tmp/site
+WARNING -  A reference to 'missing.md' is included in the 'nav' configuration, which is not found in the documentation files.
+WARNING -  Doc file 'index.md' contains a link 'gone.md', but the target is not found among documentation files.
+INFO    -  Doc file 'index.md' contains an absolute link '/learn/', it was left as is. Did you mean 'learn/index.md'?
+ERROR   -  Error reading page 'broken.md'
+INFO    -  Documentation built in 0.42 seconds
+"""
+
+
+class TestBuildLogStream:
+    """Unit tests for the streaming build-log parser"""
+
+    @pytest.mark.unit
+    def test_events_are_categorized_incrementally(self):
+        """Each line is categorized as soon as it is fed"""
+        stream = BuildLogStream()
+        categories = [event.category for event in stream.feed_lines(SAMPLE_BUILD_LOG.splitlines())]
+
+        assert categories == [
+            CATEGORY_INFO,
+            CATEGORY_INFO,
+            CATEGORY_NAV,
+            CATEGORY_LINK,
+            CATEGORY_ABSOLUTE_LINK,
+            CATEGORY_CRITICAL,
+            CATEGORY_INFO,
+        ]
+
+    @pytest.mark.unit
+    def test_stream_summary_matches_batch_parser(self):
+        """The stream summary is interchangeable with parse_mkdocs_output"""
+        stream = BuildLogStream()
+        stream.feed_text(SAMPLE_BUILD_LOG)
+
+        assert stream.parsed() == parse_mkdocs_output(SAMPLE_BUILD_LOG)
+        categorized = categorize_warnings(stream.parsed())
+        assert len(categorized['critical']) == 2
+        assert len(categorized['high']) == 1
+
+    @pytest.mark.unit
+    def test_subscribers_share_one_stream(self):
+        """Several consumers receive the same events from one log"""
+        stream = BuildLogStream()
+        seen_a, seen_b = [], []
+        stream.subscribe(seen_a.append)
+        stream.subscribe(seen_b.append)
+        stream.feed_text(SAMPLE_BUILD_LOG)
+
+        assert seen_a == seen_b == stream.events
+
+    @pytest.mark.unit
+    def test_abort_on_first_critical(self):
+        """An aborting stream stops at the first critical record"""
+        stream = BuildLogStream(abort_on_critical=True)
+
+        with pytest.raises(CriticalBuildWarning) as excinfo:
+            stream.feed_text(SAMPLE_BUILD_LOG)
+
+        assert excinfo.value.event.category == CATEGORY_NAV
+        assert len(stream.events) == 3
+
+    @pytest.mark.unit
+    def test_logging_handler_feeds_stream(self):
+        """In-process builds are parsed through the logging handler"""
+        import logging
+
+        stream = BuildLogStream()
+        with capture_build_log(stream, logger_name='mkdocs.test_build_log'):
+            logging.getLogger('mkdocs.test_build_log').warning(
+                "Doc file 'a.md' contains a link 'b.md', but the target is not found"
+            )
+
+        assert [event.category for event in stream.events] == [CATEGORY_LINK]
+        assert stream.events[0].issue['link'] == 'b.md'
 
 
 class TestBuildQuality:
     """Test MkDocs build output quality"""
 
+    # One build per (project, strict) pair, shared by every test in the class
+    _build_cache: Dict[tuple, tuple] = {}
+
     def run_mkdocs_build(self, project_root: Path, strict: bool = True) -> tuple[bool, str, Dict]:
         """
-        Run MkDocs build and parse output
+        Run MkDocs build and parse output as it streams
         
         Args:
             project_root: Project root directory
@@ -32,15 +121,16 @@ class TestBuildQuality:
         Returns:
             Tuple of (success, combined_output, parsed_output)
         """
-        cmd = "mkdocs build --clean"
-        if strict:
-            cmd += " --strict"
-        
-        success, stdout, stderr = run_command(cmd, cwd=project_root)
-        combined_output = stdout + "\n" + stderr
-        parsed_output = parse_mkdocs_output(combined_output)
-        
-        return success, combined_output, parsed_output
+        key = (str(project_root), strict)
+        if key not in self._build_cache:
+            cmd = ["mkdocs", "build", "--clean"]
+            if strict:
+                cmd.append("--strict")
+
+            build = stream_build(cmd, cwd=project_root)
+            self._build_cache[key] = (build.success, build.output, build.stream.parsed())
+
+        return self._build_cache[key]
 
     @pytest.mark.integration
     @pytest.mark.build_quality
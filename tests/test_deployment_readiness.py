@@ -306,5 +306,93 @@ class TestDeploymentReadiness:
         assert success1 and success2, "Builds are not reproducible"
 
 
+def load_readiness_script():
+    """Load scripts/project-deployment-ready.py, which is not an importable module name"""
+    import importlib.util
+    path = Path(__file__).parent.parent / "scripts" / "project-deployment-ready.py"
+    spec = importlib.util.spec_from_file_location("project_deployment_ready", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestConcurrentCachedReadiness:
+    """Test concurrent execution and input-hash caching of the readiness checker"""
+    
+    @pytest.fixture
+    def readiness(self):
+        return load_readiness_script()
+    
+    def make_checker(self, readiness, root, calls, **kwargs):
+        """Checker whose checks are replaced by fast stubs that record their calls"""
+        checker = readiness.DeploymentReadinessChecker(root, "staging", **kwargs)
+        
+        def stub(name, delay, blocking=None, warning=None):
+            def check():
+                calls.append(name)
+                time.sleep(delay)
+                checker.print_status('INFO', f"{name} ran")
+                if blocking:
+                    checker.add_blocking_issue(blocking)
+                if warning:
+                    checker.add_warning(warning)
+                return {'name': name}
+            return check
+        
+        checker.check_configuration_files = stub("config", 0.05, warning="config warning")
+        checker.check_dependencies = stub("deps", 0.1)
+        checker.check_mkdocs_configuration = stub("mkdocs", 0.0, warning="mkdocs warning")
+        checker.check_build_process = stub("build", 0.05, warning="build warning")
+        checker.check_git_repository = stub("git", 0.0, warning="git warning")
+        checker.check_deployment_workflow = stub("workflow", 0.0)
+        checker.run_comprehensive_tests = stub("tests", 0.0, blocking="tests failing")
+        return checker
+    
+    @pytest.mark.unit
+    def test_input_hash_tracks_docs(self, readiness, temp_dir, create_test_file):
+        create_test_file("docs/index.md", "# Home")
+        create_test_file("mkdocs.yml", "site_name: Test")
+        before = readiness.compute_input_hash(temp_dir, "production")
+        
+        assert readiness.compute_input_hash(temp_dir, "production") == before
+        assert readiness.compute_input_hash(temp_dir, "staging") != before
+        create_test_file("docs/index.md", "# Home page")
+        assert readiness.compute_input_hash(temp_dir, "production") != before
+    
+    @pytest.mark.unit
+    def test_concurrent_matches_sequential(self, readiness, temp_dir, capsys):
+        sequential = self.make_checker(readiness, temp_dir, [], use_cache=False).run_full_check()
+        concurrent = self.make_checker(readiness, temp_dir, [], use_cache=False, concurrent=True).run_full_check()
+        
+        assert concurrent['warnings'] == sequential['warnings'] == [
+            "config warning", "mkdocs warning", "build warning", "git warning"
+        ]
+        assert concurrent['blocking_issues'] == sequential['blocking_issues'] == ["tests failing"]
+        assert list(concurrent['checks']) == list(sequential['checks'])
+        
+        output = capsys.readouterr().out
+        concurrent_output = output[output.rindex("Deployment Readiness Check"):]
+        assert concurrent_output.index("config ran") < concurrent_output.index("deps ran") < concurrent_output.index("build ran")
+    
+    @pytest.mark.unit
+    def test_unchanged_inputs_reuse_results(self, readiness, temp_dir, create_test_file):
+        create_test_file("docs/index.md", "# Home")
+        first = self.make_checker(readiness, temp_dir, []).run_full_check()
+        
+        calls = []
+        second = self.make_checker(readiness, temp_dir, calls, concurrent=True).run_full_check()
+        
+        # Passing checks are replayed; git state and failing checks always re-run
+        assert sorted(calls) == ["git", "tests"]
+        assert second['warnings'] == first['warnings']
+        assert second['blocking_issues'] == first['blocking_issues']
+        assert "Build Process" in second['cached_checks']
+        
+        calls.clear()
+        create_test_file("docs/index.md", "# Changed")
+        self.make_checker(readiness, temp_dir, calls).run_full_check()
+        assert len(calls) == 7
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the standalone validation CLI (scripts/druids-check.py)
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "druids-check.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("druids_check", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def docs(temp_dir):
+    docs = temp_dir / "docs"
+    docs.mkdir()
+    (docs / "index.md").write_text("---\ntitle: Home\n---\n# Home\n\nSee [guide](guide.md) and [[missing]].\n")
+    (docs / "guide.md").write_text("# Guide\n\nBack to [home](index.md#home) or [nowhere](index.md#nope).\n")
+    return docs
+
+
+class TestDruidsCheck:
+    """Test the CLI checks and the corpus cache behind them"""
+
+    @pytest.mark.unit
+    def test_broken_links_fail_the_run(self, docs, temp_dir, capsys):
+        script = load_script()
+        cache = temp_dir / "corpus.pickle"
+
+        assert script.main(["frontmatter", "links", "--docs", str(docs), "--cache", str(cache)]) == 1
+        output = capsys.readouterr().out
+        assert "index.md:6 [broken-wikilink]" in output
+        assert "guide.md:3 [broken-anchor]" in output
+
+        # Only the requested files are reported
+        assert script.main(["links", "--docs", str(docs), "--cache", str(cache),
+                            "--file", str(docs / "guide.md")]) == 1
+        assert "broken-wikilink" not in capsys.readouterr().out
+
+    @pytest.mark.unit
+    def test_corpus_cache_skips_unchanged_pages(self, docs, temp_dir, monkeypatch):
+        cache = temp_dir / "corpus.pickle"
+        first = DocsCorpus(docs).load(cache)
+        assert cache.exists()
+
+        read = []
+        original = DocsCorpus._read
+        monkeypatch.setattr(DocsCorpus, "_read", lambda self, path: read.append(path) or original(self, path))
+        assert DocsCorpus(docs).load(cache).pages == first.pages
+        assert read == []
+
+        (docs / "guide.md").write_text("# Guide\n\nChanged.\n")
+        second = DocsCorpus(docs).load(cache)
+        assert read == ["guide.md"]
+        assert second.pages["guide.md"].links == []
+
+    @pytest.mark.unit
+    def test_warm_content_checks_skip_heavy_imports(self, docs, temp_dir):
+        cache = temp_dir / "corpus.pickle"
+        DocsCorpus(docs).load(cache)
+        code = (
+            "import runpy, sys\n"
+            f"sys.argv = ['druids-check', 'frontmatter', 'links', '--docs', {str(docs)!r}, '--cache', {str(cache)!r}]\n"
+            "try:\n"
+            f"    runpy.run_path({str(SCRIPT)!r}, run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(name for name in ('yaml', 'markdown', 'mkdocs') if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        assert result.stdout.strip().splitlines()[-1] == "[]", result.stdout + result.stderr
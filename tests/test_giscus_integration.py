@@ -25,6 +25,7 @@ class TestGiscusIntegration(unittest.TestCase):
         self.comments_file = self.partials_dir / "comments.html"
         self.mkdocs_yml = self.project_root / "mkdocs.yml"
         self.giscus_css = self.project_root / "docs" / "assets" / "stylesheets" / "giscus-druids.css"
+        self.giscus_js = self.project_root / "docs" / "assets" / "js" / "giscus.js"
         self.giscus_json = self.project_root / "giscus.json"
     
     def test_overrides_directory_structure_exists(self):
@@ -62,21 +63,73 @@ class TestGiscusIntegration(unittest.TestCase):
     
     def test_comments_partial_has_theme_synchronization(self):
         """Test that theme synchronization JavaScript is included"""
-        if not self.comments_file.exists():
-            self.skipTest("comments.html not yet created")
+        if not self.giscus_js.exists():
+            self.skipTest("giscus.js not yet created")
         
-        with open(self.comments_file, 'r') as f:
+        with open(self.giscus_js, 'r') as f:
             content = f.read()
         
-        # Check for theme sync script
-        self.assertIn('var giscus = document.querySelector("script[src*=giscus]")', content)
+        # Check for theme sync script, applied when the client is injected
         self.assertIn('__md_get("__palette")', content)
         self.assertIn('palette.color.scheme === "slate"', content)
-        self.assertIn('giscus.setAttribute("data-theme"', content)
+        self.assertIn("script.setAttribute('data-theme'", content)
         
         # Check for palette change listener
-        self.assertIn('ref.addEventListener("change"', content)
-        self.assertIn('frame.contentWindow.postMessage', content)
+        self.assertIn('[data-md-component=palette]', content)
+        self.assertIn('iframe.contentWindow.postMessage', content)
+    
+    def test_comments_partial_defers_giscus_script(self):
+        """Test that the partial renders a placeholder instead of the client script"""
+        if not self.comments_file.exists():
+            self.skipTest("comments.html not yet created")
+        
+        with open(self.comments_file, 'r') as f:
+            content = f.read()
+        
+        self.assertNotIn('<script', content, "giscus.app client must not load with the page")
+        self.assertIn('data-giscus-deferred', content)
+        self.assertIn('data-giscus-load', content, "Placeholder should offer an explicit load button")
+        
+        # The placeholder carries the full Giscus configuration for the injected script
+        for attribute in ['data-repo', 'data-repo-id', 'data-category', 'data-category-id',
+                          'data-mapping', 'data-reactions-enabled', 'data-input-position',
+                          'data-theme', 'data-lang', 'data-loading']:
+            self.assertIn(f'{attribute}="{{{{ config.extra.comments.', content)
+    
+    def test_giscus_js_loads_on_intersection_or_click(self):
+        """Test that the client is injected on viewport intersection or click"""
+        if not self.giscus_js.exists():
+            self.skipTest("giscus.js not yet created")
+        
+        with open(self.giscus_js, 'r') as f:
+            content = f.read()
+        
+        self.assertIn("'https://giscus.app'", content)
+        self.assertIn("GISCUS_ORIGIN + '/client.js'", content)
+        self.assertIn('new IntersectionObserver(', content)
+        self.assertIn('rootMargin', content)
+        self.assertIn("'IntersectionObserver' in window", content, "Browsers without it fall back to the button")
+        self.assertIn("button.addEventListener('click'", content)
+        
+        # Placeholder attributes are copied to the script, except the loader's own markers
+        self.assertIn("name.startsWith('data-giscus-')", content)
+        self.assertIn("container.hasAttribute('data-giscus-loaded')", content)
+    
+    def test_giscus_js_supports_instant_navigation(self):
+        """Test that deferred loading is re-armed after navigation.instant page swaps"""
+        if not self.giscus_js.exists():
+            self.skipTest("giscus.js not yet created")
+        
+        with open(self.giscus_js, 'r') as f:
+            content = f.read()
+        
+        self.assertIn('document$.subscribe(setupComments)', content)
+        self.assertIn("document.addEventListener('DOMContentLoaded', setupComments)", content)
+        self.assertIn('observer.disconnect()', content, "Observer of the previous page must be released")
+        
+        with open(self.mkdocs_yml, 'r') as f:
+            config = f.read()
+        self.assertIn('assets/js/giscus.js', config)
     
     def test_mkdocs_yml_has_custom_dir(self):
         """Test that mkdocs.yml is configured with custom_dir"""
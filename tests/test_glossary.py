@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for glossary auto-linking (hooks/glossary.py) and its term matcher
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.aho_corasick import AhoCorasick
+
+spec = importlib.util.spec_from_file_location(
+    "glossary_hook", Path(__file__).parent.parent / "hooks" / "glossary.py"
+)
+glossary_hook = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(glossary_hook)
+
+GLOSSARY = """# Glossary
+
+## Core Terms
+
+### Democratic Centralism
+Freedom of discussion, unity of action.
+
+### OpSec (Operational Security)
+Practices that protect sensitive information.
+
+### Push/Pull
+Sharing your changes (push) or getting "others'" changes (pull).
+
+### Three-Tier Security Model
+- **L0**: Public
+- **L1**: [Members](../members.md) only
+"""
+
+PAGE = """## Democratic Centralism in practice
+
+```bash
+git push  # Push/Pull and democratic centralism inside code
+```
+
+Read [democratic centralism](x.md) first. `OpSec` in code stays.
+<div class="card">
+Operational security inside raw HTML stays too.
+</div>
+
+We practice democratic centralism and DEMOCRATIC CENTRALISM again.
+Good opsec matters; so does the three-tier security model. Pushy people push.
+"""
+
+
+@pytest.fixture
+def glossary():
+    entries = glossary_hook.parse_glossary(GLOSSARY)
+    return entries, glossary_hook.build_matcher(entries)
+
+
+class TestTermMatcher:
+    """Test the Aho-Corasick automaton"""
+
+    @pytest.mark.unit
+    def test_all_overlapping_occurrences(self):
+        matcher = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+        assert sorted(matcher.iter("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+        assert len(matcher) == 4
+
+    @pytest.mark.unit
+    def test_whole_words_leftmost_longest(self):
+        matcher = AhoCorasick([("security", "s"), ("security culture", "sc"), ("culture", "c"), ("tor", "t")])
+
+        assert matcher.find_words("Security Culture beats a motor; Tor and culture.") == [
+            (0, 16, "sc"), (32, 35, "t"), (40, 47, "c")
+        ]
+
+
+class TestGlossaryLinking:
+    """Test glossary parsing and first-occurrence linking"""
+
+    @pytest.mark.unit
+    def test_parse_glossary(self, glossary):
+        entries, _ = glossary
+
+        assert [(entry.term, entry.anchor) for entry in entries] == [
+            ("Democratic Centralism", "democratic-centralism"),
+            ("OpSec (Operational Security)", "opsec-operational-security"),
+            ("Push/Pull", "pushpull"),
+            ("Three-Tier Security Model", "three-tier-security-model"),
+        ]
+        assert entries[2].definition == "Sharing your changes (push) or getting 'others'' changes (pull)."
+        assert entries[3].definition == "L0: Public; L1: Members only"
+        assert glossary_hook.term_aliases("Push/Pull") == ["Push/Pull", "Push", "Pull"]
+
+    @pytest.mark.unit
+    def test_first_occurrence_outside_code_links_and_headings(self, glossary):
+        entries, matcher = glossary
+        linked = glossary_hook.link_terms(PAGE, entries, matcher, "../reference/glossary.md")
+        lines = linked.split("\n")
+
+        assert lines[:10] == PAGE.split("\n")[:10]
+        assert lines[11] == (
+            'We practice [democratic centralism](../reference/glossary.md#democratic-centralism '
+            '"Freedom of discussion, unity of action.") and DEMOCRATIC CENTRALISM again.'
+        )
+        assert lines[12].startswith('Good [opsec](../reference/glossary.md#opsec-operational-security "')
+        assert "[three-tier security model](../reference/glossary.md#three-tier-security-model" in lines[12]
+        assert lines[12].endswith('Pushy people [push](../reference/glossary.md#pushpull '
+                                  '"Sharing your changes (push) or getting \'others\'\' changes (pull).").')
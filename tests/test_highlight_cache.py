@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the Pygments highlight cache (hooks/highlight_cache.py)
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pygments
+import pytest
+from pygments.lexers import get_lexer_by_name
+from pymdownx.highlight import BlockHtmlFormatter
+
+spec = importlib.util.spec_from_file_location(
+    "highlight_cache", Path(__file__).parent.parent / "hooks" / "highlight_cache.py"
+)
+highlight_cache = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(highlight_cache)
+
+SNIPPET = "git add .\ngit commit -m 'fix: typo'\ngit push\n"
+
+
+def formatter(block):
+    """Formatter configured like mkdocs.yml (linenums, anchor_linenums, line_spans)"""
+    return BlockHtmlFormatter(
+        cssclass="highlight", linenos="table", wrapcode=True, anchorlinenos=True,
+        linespans=f"__span-{block}", lineanchors=f"__codelineno-{block}",
+    )
+
+
+class TestHighlightCache:
+    """Test cache hits, output equivalence and persistence"""
+
+    @pytest.mark.unit
+    def test_identical_snippets_highlighted_once(self):
+        cache = highlight_cache.HighlightCache()
+        lexer = get_lexer_by_name("bash")
+
+        first = cache(SNIPPET, lexer, formatter(0))
+        second = cache(SNIPPET, lexer, formatter(7))
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+        assert first == pygments.highlight(SNIPPET, lexer, formatter(0))
+        assert second == pygments.highlight(SNIPPET, lexer, formatter(7))
+        assert 'id="__span-7-1"' in second
+
+    @pytest.mark.unit
+    def test_options_are_part_of_the_key(self):
+        cache = highlight_cache.HighlightCache()
+
+        cache(SNIPPET, get_lexer_by_name("bash"), formatter(0))
+        cache(SNIPPET, get_lexer_by_name("text"), formatter(0))
+        cache(SNIPPET, get_lexer_by_name("bash"), BlockHtmlFormatter(cssclass="highlight", hl_lines=[2]))
+
+        assert cache.misses == 3
+
+    @pytest.mark.unit
+    def test_persists_between_builds(self, temp_dir):
+        path = temp_dir / "highlight.json"
+        lexer = get_lexer_by_name("bash")
+
+        cache = highlight_cache.HighlightCache(path).load()
+        cache(SNIPPET, lexer, formatter(0))
+        cache.save()
+
+        cache = highlight_cache.HighlightCache(path).load()
+        assert cache(SNIPPET, lexer, formatter(3)) == pygments.highlight(SNIPPET, lexer, formatter(3))
+        assert cache.stats()["hits"] == 1
+
+        cache.version = "other"
+        assert highlight_cache.HighlightCache(path).load().entries
+        cache.save()
+        assert not highlight_cache.HighlightCache(path).load().entries
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass rendered HTML scanner (validators/html_scan.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.html_scan import HTMLScanner, Hit, ScanRule, hits_by_path
+
+
+class TestHTMLScanner:
+    """Test per-rule hits from one combined scan"""
+
+    @pytest.mark.unit
+    def test_hits_per_rule(self, temp_dir):
+        (temp_dir / "guide").mkdir()
+        (temp_dir / "index.html").write_text(
+            '<p>[[Raw link]]</p>\n'
+            '<a href="../a/#0123456789abcdef0123456789abcdef">A</a>\n'
+            '<pre class="highlight"><code>x</code></pre>\n'
+        )
+        (temp_dir / "guide" / "index.html").write_text('<pre><code>plain</code></pre>\n')
+        (temp_dir / "empty.html").write_text("")
+
+        hits = HTMLScanner().scan_site(temp_dir)
+        assert hits["raw-wikilink"] == [Hit("index.html", 1, "[[Raw link]]")]
+        assert [hit.line for hit in hits["wikilink-hash-in-href"]] == [2]
+        assert hits["wikilink-syntax-in-href"] == []
+        assert list(hits_by_path(hits["pre-block"])) == ["guide/index.html", "index.html"]
+        assert list(hits_by_path(hits["highlighted-code"])) == ["index.html"]
+
+    @pytest.mark.unit
+    def test_overlapping_rules_all_hit(self, temp_dir):
+        page = temp_dir / "page.html"
+        page.write_text("x\n[[note#ab]] and [[other]]\n")
+        scanner = HTMLScanner([
+            ScanRule("wikilink", rb"\[\[[^\]]*\]\]"),
+            ScanRule("wikilink-start", rb"\[\["),
+            ScanRule("hash", rb"#ab"),
+        ])
+
+        hits = scanner.scan_file(page, "page.html")
+        assert [hit.text for hit in hits["wikilink"]] == ["[[note#ab]]", "[[other]]"]
+        assert len(hits["wikilink-start"]) == 2
+        assert hits["hash"] == [Hit("page.html", 2, "#ab")]
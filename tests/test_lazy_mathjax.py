@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for loading MathJax only on pages with math (hooks/lazy_mathjax.py)
+"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "lazy_mathjax_hook", Path(__file__).parent.parent / "hooks" / "lazy_mathjax.py"
+)
+lazy_mathjax = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lazy_mathjax)
+
+MATH = '<p>Inline <span class="arithmatex">\\(E = mc^2\\)</span></p>\n<div class="arithmatex">\\[x^2\\]</div>'
+
+
+@pytest.fixture
+def library(monkeypatch):
+    library = {"src": "assets/vendor/mathjax@3.2.2/es5/tex-mml-chtml.abcd1234.js", "integrity": "sha384-x"}
+    monkeypatch.setitem(lazy_mathjax._state, "library", library)
+    return library
+
+
+class TestLazyMathJax:
+    """Test that only pages with math get the loader marker"""
+
+    @pytest.mark.unit
+    def test_math_pages_are_marked(self, library):
+        page = SimpleNamespace(meta={})
+        html = lazy_mathjax.on_page_content(MATH, page, {}, None)
+
+        assert page.meta["mathjax"] == 2
+        assert html.startswith(MATH)
+        assert html.count('<div class="druids-mathjax"') == 1
+        assert f'data-mathjax-src="{library["src"]}" data-mathjax-integrity="sha384-x" hidden' in html
+
+        plain = SimpleNamespace(meta={})
+        assert lazy_mathjax.on_page_content("<p>No math</p>", plain, {}, None) == "<p>No math</p>"
+        assert "mathjax" not in plain.meta
+
+    @pytest.mark.unit
+    def test_not_in_extra_javascript(self):
+        import yaml
+
+        config = yaml.safe_load((Path(__file__).parent.parent / "mkdocs.yml").read_text(encoding="utf-8"))
+        scripts = config["extra_javascript"]
+        assert lazy_mathjax.MATHJAX_URL not in scripts
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy Mermaid placeholders (hooks/lazy_mermaid.py)
+"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "lazy_mermaid_hook", Path(__file__).parent.parent / "hooks" / "lazy_mermaid.py"
+)
+lazy_mermaid = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lazy_mermaid)
+
+DIAGRAM = '<pre class="mermaid"><code>graph TD\n    A[Start] --&gt; B{Ready?}\n    B --&gt; C</code></pre>'
+
+
+@pytest.fixture
+def library(monkeypatch):
+    library = {"src": "assets/vendor/mermaid@11.4.1/dist/mermaid.min.abcd1234.js", "integrity": "sha384-x"}
+    monkeypatch.setitem(lazy_mermaid._state, "library", library)
+    return library
+
+
+class TestLazyMermaid:
+    """Test that diagram pages get placeholders and are marked"""
+
+    @pytest.mark.unit
+    def test_diagrams_become_placeholders(self, library):
+        page = SimpleNamespace(meta={})
+        html = lazy_mermaid.on_page_content(f"<p>Intro</p>\n{DIAGRAM}\n{DIAGRAM}", page, {}, None)
+
+        assert page.meta["mermaid"] == 2
+        assert 'class="mermaid"' not in html
+        assert html.count('<div class="druids-mermaid"') == 2
+        assert f'data-mermaid-src="{library["src"]}" data-mermaid-integrity="sha384-x"' in html
+        # The escaped source is kept as is for the loader to read back
+        assert '<pre class="druids-mermaid__source" hidden><code>graph TD\n    A[Start] --&gt; B{Ready?}' in html
+
+        plain = SimpleNamespace(meta={})
+        assert lazy_mermaid.on_page_content("<p>No diagrams</p>", plain, {}, None) == "<p>No diagrams</p>"
+        assert "mermaid" not in plain.meta
+
+    @pytest.mark.unit
+    def test_reserved_height(self):
+        top_down = "graph TD\n" + "\n".join(f"    N{i} --> N{i + 1}" for i in range(8))
+        left_right = top_down.replace("graph TD", "graph LR")
+        huge = "sequenceDiagram\n" + "\n".join(f"    A->>B: step {i}" for i in range(100))
+
+        assert lazy_mermaid.estimate_height(left_right) < lazy_mermaid.estimate_height(top_down)
+        assert lazy_mermaid.estimate_height("graph LR\n    A --> B") == lazy_mermaid.MIN_HEIGHT
+        assert lazy_mermaid.estimate_height(huge) == lazy_mermaid.MAX_HEIGHT
@@ -12,26 +12,10 @@ import subprocess
 import sys
 import os
 
-# Skip this test file as it depends on external modules not in this project
-pytest.skip("This test file depends on external modules not present in this project", allow_module_level=True)
-
-# The following imports are commented out as they reference non-existent paths
-# # Add the scripts directory to Python path
-# sys.path.insert(0, str(Path(__file__).parent.parent / 'repos' / 'shared' / 'scripts' / 'python'))
-# 
-# # Import with the correct module name (file uses hyphen, not underscore)
-# import importlib.util
-# spec = importlib.util.spec_from_file_location(
-#     "markdown_linter", 
-#     Path(__file__).parent.parent / 'repos' / 'shared' / 'scripts' / 'python' / 'markdown-linter.py'
-# )
-# markdown_linter = importlib.util.module_from_spec(spec)
-# spec.loader.exec_module(markdown_linter)
-# DRUIDSMarkdownLinter = markdown_linter.DRUIDSMarkdownLinter
-
-# Placeholder class to prevent syntax errors
-class DRUIDSMarkdownLinter:
-    pass
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.markdown_linter import DRUIDSMarkdownLinter, to_json, to_sarif
 
 class TestMarkdownLinter:
     """Test cases for DRUIDS Markdown Linter"""
@@ -341,6 +325,73 @@ document_id: TST-REF-2024-001-L0
         assert results['files_with_errors'] >= 1
         assert results['files_with_warnings'] >= 1
         
+    def test_code_fence_contents_are_not_scanned(self, linter, temp_dir):
+        """Test that admonition and link syntax inside code fences is ignored"""
+        content = """---
+title: Test Document
+type: guide
+security: L0
+document_id: TST-GUIDE-2024-001-L0
+---
+
+# Test Document
+
+```markdown
+!!! note
+Not an admonition here
+
+[Example](page.md)
+```
+"""
+        
+        file_path = self.create_test_file(temp_dir, "test.md", content)
+        errors, warnings = linter.lint_file(file_path)
+        
+        assert errors == []
+        assert warnings == []
+        
+    def test_unchanged_files_are_served_from_cache(self, linter, temp_dir):
+        """Test that re-linting only touches changed files"""
+        for index in range(3):
+            self.create_test_file(temp_dir, f"page-{index}.md", "# No Frontmatter\n")
+            
+        first = linter.lint_directory(temp_dir)
+        assert first['cache_hits'] == 0
+        
+        self.create_test_file(temp_dir, "page-0.md", "# Changed\n\n```\ncode\n```\n")
+        second = DRUIDSMarkdownLinter(str(temp_dir)).lint_directory(temp_dir)
+        
+        assert second['cache_hits'] == 2
+        assert second['total_warnings'] == first['total_warnings'] + 1
+        
+    def test_parallel_matches_serial(self, temp_dir):
+        """Test that the process pool produces the same results as a serial run"""
+        for index in range(40):
+            self.create_test_file(temp_dir, f"page-{index}.md", f"# Page {index}\n\n[Link](page-{index + 1}.md)\n")
+            
+        serial = DRUIDSMarkdownLinter(str(temp_dir), jobs=1, use_cache=False).lint_directory(temp_dir)
+        parallel = DRUIDSMarkdownLinter(str(temp_dir), jobs=2, use_cache=False).lint_directory(temp_dir)
+        
+        assert serial['results'] == parallel['results']
+        
+    def test_machine_readable_output(self, linter, temp_dir):
+        """Test JSON and SARIF reports"""
+        import json
+        
+        self.create_test_file(temp_dir, "invalid.md", "# No Frontmatter\n")
+        issues = linter.lint_directory(temp_dir)['issues']
+        
+        report = json.loads(to_json(issues))
+        assert report['summary']['errors'] == 1
+        assert report['files']['invalid.md'][0]['rule'] == 'DRU001'
+        
+        sarif = json.loads(to_sarif(issues))
+        assert sarif['version'] == '2.1.0'
+        result = sarif['runs'][0]['results'][0]
+        assert result['ruleId'] == 'DRU001'
+        assert result['level'] == 'error'
+        assert result['locations'][0]['physicalLocation']['artifactLocation']['uri'] == 'invalid.md'
+        
     def test_config_file_copy(self, linter, temp_dir):
         """Test copying configuration files"""
         linter.copy_config_files(temp_dir)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared markdown token stream
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.markdown_tokens import Callout, Fence, Heading, heading_slug, tokenize
+
+PAGE = """---
+title: Git Reference
+---
+
+# Git Reference
+
+```bash
+# Stage everything
+git add .
+```
+
+!!! warning "Before you push"
+    ## Check the remote
+    ```
+    # not a heading either
+    ```
+
+~~~~
+```
+# still inside the outer fence
+```
+~~~~
+
+> [!tip] Obsidian callout
+
+## See [the guide](guide.md) and `[not a link](x.md)` ![logo](logo.png) [[glossary#Cadre|cadre]]
+"""
+
+
+class TestMarkdownTokens:
+    """Test the single-pass tokenizer"""
+
+    @pytest.mark.unit
+    def test_headings_skip_fences(self):
+        page = tokenize(PAGE)
+
+        assert [(h.line, h.level, h.slug) for h in page.headings] == [
+            (5, 1, "git-reference"),
+            (13, 2, "check-the-remote"),
+            (26, 2, "see-the-guide-and-not-a-link-cadre"),
+        ]
+
+    @pytest.mark.unit
+    def test_fences_callouts_and_frontmatter(self):
+        page = tokenize(PAGE)
+
+        assert page.frontmatter == {"title": "Git Reference"}
+        assert page.body_start == 4
+        assert page.fences == [Fence(7, 10, "bash"), Fence(14, 16, ""), Fence(18, 22, "")]
+        assert page.callouts == [
+            Callout(12, "warning", "Before you push", "admonition"),
+            Callout(24, "tip", "Obsidian callout", "obsidian"),
+        ]
+        assert isinstance(page.tokens[0], Heading)
+
+    @pytest.mark.unit
+    def test_links_skip_inline_code(self):
+        page = tokenize(PAGE)
+
+        assert [link.url for link in page.links] == ["guide.md"]
+        assert [image.url for image in page.images] == ["logo.png"]
+        assert [(w.target, w.heading, w.alias) for w in page.wikilinks] == [("glossary", "Cadre", "cadre")]
+
+    @pytest.mark.unit
+    def test_fence_info_strings(self):
+        page = tokenize("``` { .python title=\"x.py\" }\npass\n```\n\n```yaml title=\"mkdocs.yml\"\na: 1\n```\n")
+
+        assert [fence.language for fence in page.fences] == ["python", "yaml"]
+
+    @pytest.mark.unit
+    def test_heading_slugs_match_toc(self):
+        """Slugs follow the rendered text like the toc extension"""
+        assert heading_slug("Step 1: `git add` **everything**") == ("step-1-git-add-everything", False)
+        assert heading_slug("Über [Links](x.md) & more :rocket:") == ("uber-links-more", False)
+        assert heading_slug("Custom { #my-Id .wide }") == ("my-Id", True)
+
+    @pytest.mark.unit
+    def test_anchor_ids_dedup_like_toc(self):
+        page = tokenize(
+            "# Setup\n\n## Setup\n\n## Setup\n\n## Setup_1 {#setup_1}\n\n"
+            "Para {#para-id}\n\n<a name=\"legacy\"></a>\n"
+        )
+
+        assert page.anchor_ids() == {"setup", "setup_1", "setup_2", "setup_3", "para-id", "legacy"}
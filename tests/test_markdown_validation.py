@@ -13,8 +13,10 @@ from test_utils import (
     find_markdown_images,
     find_markdown_links,
     get_all_markdown_files,
+    get_page_tokens,
     validate_internal_link,
 )
+from validators.markdown_tokens import tokenize
 
 
 class TestMarkdownValidation:
@@ -178,15 +180,7 @@ class TestMarkdownValidation:
         content = sample_markdown_content["valid"]
         
         # Find all headings
-        heading_pattern = r'^(#{1,6})\s+(.+)$'
-        headings = []
-        
-        for line in content.split('\n'):
-            match = re.match(heading_pattern, line)
-            if match:
-                level = len(match.group(1))
-                text = match.group(2)
-                headings.append((level, text))
+        headings = [(heading.level, heading.text) for heading in tokenize(content).headings]
         
         # Check that we have headings
         assert len(headings) > 0, "No headings found"
@@ -212,17 +206,9 @@ class TestMarkdownValidation:
         markdown_files = get_all_markdown_files(docs_dir)
         files_with_issues = {}
         
-        # Pattern for code blocks without language
-        code_block_pattern = r'^```\s*$'
-        
         for md_file in markdown_files:
-            content = md_file.read_text(encoding='utf-8')
-            lines = content.split('\n')
-            
-            issues = []
-            for i, line in enumerate(lines):
-                if re.match(code_block_pattern, line):
-                    issues.append(i + 1)  # Line numbers are 1-based
+            # Only opening fences count; closing fences carry no language
+            issues = [fence.line for fence in get_page_tokens(md_file).fences if not fence.language]
             
             if issues:
                 files_with_issues[str(md_file.relative_to(docs_dir))] = issues
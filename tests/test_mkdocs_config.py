@@ -18,6 +18,9 @@ from mkdocs.exceptions import ConfigurationError
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from test_utils import get_path_index
+from validators.nav_index import NavIndex
+
 
 class TestMkDocsConfig:
     """Test MkDocs configuration validity"""
@@ -43,29 +46,8 @@ class TestMkDocsConfig:
     def test_required_files_exist(self, config):
         """Test that all referenced files in nav exist"""
         docs_dir = Path(config["docs_dir"])
-        nav = config.get("nav", [])
-
-        missing_files = []
-
-        def check_nav_item(item, path_prefix=""):
-            if isinstance(item, dict):
-                for key, value in item.items():
-                    if isinstance(value, str):
-                        # This is a file reference
-                        file_path = docs_dir / value
-                        if not file_path.exists() and not value.startswith("http"):
-                            missing_files.append(value)
-                    elif isinstance(value, list):
-                        # This is a nested section
-                        for sub_item in value:
-                            check_nav_item(sub_item, path_prefix)
-            elif isinstance(item, str):
-                file_path = docs_dir / item
-                if not file_path.exists() and not item.startswith("http"):
-                    missing_files.append(item)
-
-        for nav_item in nav:
-            check_nav_item(nav_item)
+        nav_index = NavIndex.from_config(config)
+        missing_files = [entry.target for entry in nav_index.missing(get_path_index(docs_dir).files)]
 
         if missing_files:
             print(f"Missing files: {missing_files}")
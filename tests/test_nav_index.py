@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the flattened nav index (validators/nav_index.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.nav_index import NavIndex
+
+NAV = [
+    {"Home": "index.md"},
+    {"Learn": [
+        "learn/index.md",
+        {"Git": [
+            {"Basics": "learn/git/basics.md"},
+            {"Cheat Sheet": "reference/cheat-sheet.md"},
+        ]},
+    ]},
+    {"Reference": [
+        {"Cheat Sheet": "reference/cheat-sheet.md"},
+        {"Missing": "reference/missing.md"},
+        {"GitHub": "https://github.com/ks-sbc/DRUIDS"},
+    ]},
+]
+
+FILES = {
+    "index.md",
+    "learn/index.md",
+    "learn/git/basics.md",
+    "learn/git/draft.md",
+    "reference/cheat-sheet.md",
+    "reference/images/diagram.png",
+    "_templates/page.md",
+    ".obsidian/notes.md",
+    "blog/posts/hello.md",
+}
+
+
+class TestNavIndex:
+    """Test flattening and the missing/unlisted/duplicate diffs"""
+
+    @pytest.mark.unit
+    def test_flattened_in_order_with_breadcrumbs(self):
+        index = NavIndex(NAV)
+
+        assert [(entry.title, entry.target, entry.breadcrumb) for entry in index][:4] == [
+            ("Home", "index.md", ()),
+            (None, "learn/index.md", ("Learn",)),
+            ("Basics", "learn/git/basics.md", ("Learn", "Git")),
+            ("Cheat Sheet", "reference/cheat-sheet.md", ("Learn", "Git")),
+        ]
+        assert [entry.position for entry in index] == list(range(7))
+        assert index.entries[-1].external
+        assert "https://github.com/ks-sbc/DRUIDS" not in index.targets
+
+    @pytest.mark.unit
+    def test_missing_and_duplicates(self):
+        index = NavIndex(NAV)
+
+        assert [entry.target for entry in index.missing(FILES)] == ["reference/missing.md"]
+        duplicates = index.duplicates()
+        assert list(duplicates) == ["reference/cheat-sheet.md"]
+        assert [entry.breadcrumb for entry in duplicates["reference/cheat-sheet.md"]] == [
+            ("Learn", "Git"), ("Reference",)
+        ]
+
+    @pytest.mark.unit
+    def test_unlisted_honours_exclusions(self):
+        assert NavIndex(NAV).unlisted(FILES) == [
+            "_templates/page.md", "blog/posts/hello.md", "learn/git/draft.md"
+        ]
+
+        index = NavIndex.from_config({"nav": NAV, "exclude_docs": "_templates/\n", "not_in_nav": "/blog/\n"})
+        assert index.unlisted(FILES) == ["learn/git/draft.md"]
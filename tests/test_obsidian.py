@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the one-pass Obsidian syntax engine
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.obsidian import ObsidianEngine, build_index, resolve_wikilink
+
+PAGES = {
+    "index.md": "# Home",
+    "guide/setup.md": "---\ntitle: Setup\n---\n# Setup\n\nIntro\n\n## Install\n\nSee [config](../reference/config.md)\n\n## Next\n\nLater",
+    "guide/loop-a.md": "# A\n\n![[loop-b]]",
+    "guide/loop-b.md": "# B\n\n![[loop-a]]",
+    "reference/config.md": "# Config",
+    "reference/setup.md": "# Other setup",
+    "img/diagram.png": "",
+}
+
+
+@pytest.fixture
+def engine():
+    return ObsidianEngine(PAGES, lambda path: PAGES[path])
+
+
+class TestObsidianEngine:
+    """Test wikilink resolution and the rewritten Markdown"""
+
+    @pytest.mark.unit
+    def test_resolution(self):
+        index = build_index(PAGES)
+
+        # Ambiguous stems go to the first path in sorted order unless folders narrow them down
+        assert resolve_wikilink(index, "setup") == "guide/setup.md"
+        assert resolve_wikilink(index, "reference/setup") == "reference/setup.md"
+        assert resolve_wikilink(index, "Config.md") == "reference/config.md"
+        assert resolve_wikilink(index, "diagram.png") == "img/diagram.png"
+        assert resolve_wikilink(index, "../index", "guide/setup.md") == "index.md"
+        assert resolve_wikilink(index, "other/setup") is None
+        assert resolve_wikilink(index, "missing") is None
+
+    @pytest.mark.unit
+    def test_links(self, engine):
+        markdown = (
+            "[[config]] [[guide/setup#Install|install it]] [[#Local Heading]] [[missing]]\n"
+            "| cell | [[config\\|table alias]] |\n"
+            "[Text]([[config]])"
+        )
+        converted = engine.convert(markdown, "guide/setup.md")
+
+        assert converted.markdown == (
+            "[config](../reference/config.md) [install it](setup.md#install) [Local Heading](#local-heading) missing\n"
+            "| cell | [table alias](../reference/config.md) |\n"
+            "[Text](../reference/config.md)"
+        )
+        assert len(converted.problems) == 1
+        assert "[[missing]]" in converted.problems[0]
+
+    @pytest.mark.unit
+    def test_code_and_comments(self, engine):
+        markdown = "Keep `[[config]]` %% drop [[missing]] %%\n\n```\n[[config]]\n> [!note]\n```\n<!-- [[missing]] -->"
+        converted = engine.convert(markdown, "index.md")
+
+        assert converted.markdown == "Keep `[[config]]` \n\n```\n[[config]]\n> [!note]\n```\n<!-- [[missing]] -->"
+        assert converted.problems == []
+
+    @pytest.mark.unit
+    def test_callouts(self, engine):
+        markdown = "> [!faq]- Why [[config]]?\n> Because\n> > [!tip] Nested\n> > Inner\n\nAfter"
+        converted = engine.convert(markdown, "index.md")
+
+        assert converted.markdown == (
+            '??? question "Why [config](reference/config.md)?"\n'
+            "    Because\n"
+            '    !!! tip "Nested"\n'
+            "        Inner\n"
+            "\nAfter"
+        )
+
+    @pytest.mark.unit
+    def test_embeds(self, engine):
+        converted = engine.convert("![[setup#Install]]\n\n![[diagram.png|300]]\n\nInline ![[config]]", "index.md")
+
+        assert converted.markdown == (
+            '<div class="druids-embed" markdown>\n\n'
+            # Links inside the section are rebased onto the embedding page
+            "## Install\n\nSee [config](reference/config.md)\n\n"
+            "</div>\n\n"
+            '![diagram.png](img/diagram.png){ width="300" }\n\n'
+            "Inline [config](reference/config.md)"
+        )
+
+        whole = engine.convert("![[setup]]", "index.md").markdown
+        assert "title: Setup" not in whole and "## Next" in whole
+
+    @pytest.mark.unit
+    def test_embed_cycles(self, engine):
+        converted = engine.convert("![[loop-a]]", "index.md")
+
+        # loop-a embeds loop-b, whose embed of loop-a becomes a link
+        assert "# A" in converted.markdown and "# B" in converted.markdown
+        assert "[loop-a](guide/loop-a.md)" in converted.markdown
+        assert len(converted.problems) == 1
+        assert "index.md -> guide/loop-a.md -> guide/loop-b.md -> guide/loop-a.md" in converted.problems[0]
+
+    @pytest.mark.unit
+    def test_indented_code(self, engine):
+        markdown = (
+            "Text\n\n    [[config]] %% kept %%\n\n"
+            "- Item\n\n    [[config]]\n\n"
+            '!!! note\n\n    > [!tip]\n    > [[config]]\n\n        [[config]]'
+        )
+        converted = engine.convert(markdown, "index.md")
+
+        # Code after a paragraph is kept; list and admonition bodies are converted
+        assert converted.markdown == (
+            "Text\n\n    [[config]] %% kept %%\n\n"
+            "- Item\n\n    [config](reference/config.md)\n\n"
+            '!!! note\n\n    !!! tip\n        [config](reference/config.md)\n\n        [[config]]'
+        )
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline precache manifest (hooks/offline.py)
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "offline_hook", Path(__file__).parent.parent / "hooks" / "offline.py"
+)
+offline_hook = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(offline_hook)
+
+
+@pytest.fixture
+def site(create_test_file, temp_dir):
+    """A built site with shell assets, precached sections and other pages"""
+    create_test_file("index.html", "<h1>Home</h1>")
+    create_test_file("404.html", "<h1>Not found</h1>")
+    create_test_file("assets/javascripts/bundle.d7400e89.min.js", "bundle")
+    create_test_file("assets/javascripts/bundle.d7400e89.min.js.map", "map")
+    create_test_file("assets/javascripts/lunr/min/lunr.de.min.js", "lunr")
+    create_test_file("learn/index.html", "<h1>Learn</h1>")
+    create_test_file("learn/git-basics/index.html", "<h1>Git</h1>")
+    create_test_file("teach/index.html", "<h1>Teach</h1>")
+    create_test_file("sw.js", 'const VERSION = "__PRECACHE_VERSION__";\n')
+    return temp_dir
+
+
+class TestPrecacheManifest:
+    """Test manifest contents, versioning and the service worker stamp"""
+
+    @pytest.mark.unit
+    def test_manifest_covers_shell_and_sections(self, site):
+        manifest = offline_hook.build_manifest(site)
+
+        assert list(manifest["files"]) == [
+            "./", "404.html", "assets/javascripts/bundle.d7400e89.min.js", "learn/", "learn/git-basics/"
+        ]
+        assert all(len(digest) == 16 for digest in manifest["files"].values())
+
+    @pytest.mark.unit
+    def test_version_follows_content(self, site, create_test_file):
+        first = offline_hook.build_manifest(site)
+        assert offline_hook.build_manifest(site) == first
+
+        create_test_file("teach/index.html", "<h1>Teaching</h1>")
+        assert offline_hook.build_manifest(site) == first
+
+        create_test_file("learn/git-basics/index.html", "<h1>Git basics</h1>")
+        second = offline_hook.build_manifest(site)
+        assert second["version"] != first["version"]
+        changed = [key for key in second["files"] if second["files"][key] != first["files"][key]]
+        assert changed == ["learn/git-basics/"]
+
+    @pytest.mark.unit
+    def test_service_worker_stamped(self, site):
+        manifest = offline_hook.write_manifest(site)
+
+        assert json.loads((site / offline_hook.MANIFEST_FILE).read_text()) == manifest
+        assert (site / "sw.js").read_text() == f'const VERSION = "{manifest["version"]}";\n'
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-page weight analyzer (validators/page_weight.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.page_weight import (
+    SizeCache,
+    budget_violations,
+    history_entry,
+    measure,
+    regressions,
+    weigh_site,
+)
+
+PAGE = """<!doctype html>
+<html><head>
+<link rel="stylesheet" href="../assets/site.css">
+<link rel="stylesheet" href="../assets/print.css" media="print">
+<script src="../assets/head.js"></script>
+<script src="../assets/late.js" defer></script>
+</head><body>
+<img src="../img/photo.png"><img src="../img/photo.png"><img src="../img/gone.png">
+<script src="https://cdn.example.com/lib.js"></script>
+<script src="../assets/bundle.js"></script>
+</body></html>
+"""
+
+ASSETS = {
+    "assets/site.css": b"body { color: red; }" * 50,
+    "assets/print.css": b"@page { margin: 0; }" * 10,
+    "assets/head.js": b"var head = 1;" * 40,
+    "assets/late.js": b"var late = 1;" * 40,
+    "assets/bundle.js": b"var bundle = 1;" * 400,
+    "img/photo.png": bytes(range(256)) * 8,
+}
+
+
+@pytest.fixture
+def site(temp_dir):
+    for path, content in ASSETS.items():
+        (temp_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (temp_dir / path).write_bytes(content)
+    (temp_dir / "guide").mkdir()
+    (temp_dir / "guide" / "index.html").write_text(PAGE)
+    return temp_dir
+
+
+class TestPageWeight:
+    """Test page resolution, size totals and budgets"""
+
+    @pytest.mark.unit
+    def test_total_and_blocking_bytes(self, site):
+        [weight] = weigh_site(site)
+        kinds = {asset.path: (asset.kind, asset.blocking) for asset in weight.assets}
+
+        assert kinds == {
+            "guide/index.html": ("document", True),
+            "assets/site.css": ("stylesheet", True),
+            "assets/print.css": ("stylesheet", False),
+            "assets/head.js": ("script", True),
+            "assets/late.js": ("script", False),
+            "assets/bundle.js": ("script", False),
+            "img/photo.png": ("image", False),
+        }
+        assert weight.section == "guide"
+        assert weight.external == ["https://cdn.example.com/lib.js"]
+        assert weight.external_scripts == ["https://cdn.example.com/lib.js"]
+        assert weight.missing == ["../img/gone.png"]
+
+        page = (site / "guide" / "index.html").read_bytes()
+        blocking = [page, ASSETS["assets/site.css"], ASSETS["assets/head.js"]]
+        assert weight.blocking.raw == sum(len(data) for data in blocking)
+        assert weight.blocking.gzip == sum(measure(data).gzip for data in blocking)
+        assert weight.total.raw == len(page) + sum(len(data) for data in ASSETS.values())
+
+    @pytest.mark.unit
+    def test_size_cache_shared_and_persisted(self, site, temp_dir):
+        cache = SizeCache(temp_dir / "sizes.json")
+        first = weigh_site(site, cache)
+        cache.save()
+
+        reloaded = SizeCache(temp_dir / "sizes.json")
+        assert reloaded.entries == cache.entries
+        (site / "assets" / "bundle.js").write_bytes(b"var bundle = 2;" * 800)
+        second = weigh_site(site, reloaded)
+        assert second[0].total.raw == first[0].total.raw + 15 * 400
+
+    @pytest.mark.unit
+    def test_budgets_and_regressions(self, site):
+        weights = weigh_site(site)
+        total = weights[0].total.gzip
+        budgets = {"default": {"total": 1000}, "guide": {"total": 0.5, "blocking": 1000}}
+        assert budget_violations(weights, budgets) == [
+            "guide/index.html: https://cdn.example.com/lib.js is on another origin, so the page weight is not measured",
+            f"guide/index.html: total {total / 1024:.1f} KiB gzip exceeds the guide budget of 0.5 KiB"
+        ]
+
+        before = history_entry(weights, "abc")
+        after = {"pages": {"guide/index.html": [total + 10 * 1024, 0]}}
+        assert regressions(before, after) == [
+            f"guide/index.html: {total / 1024:.1f} -> {(total + 10 * 1024) / 1024:.1f} KiB gzip"
+        ]
+        assert regressions(before, history_entry(weights)) == []
+
+    @pytest.mark.unit
+    def test_external_images_are_not_violations(self, site):
+        image = '<img src="https://cdn.example.com/a.png">'
+        (site / "guide" / "index.html").write_text(PAGE.replace('<script src="https://cdn.example.com/lib.js"></script>', image))
+        [weight] = weigh_site(site)
+
+        assert weight.external == ["https://cdn.example.com/a.png"]
+        assert weight.external_scripts == []
+        assert budget_violations([weight], {"default": {}}) == []
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for multiprocess page rendering (hooks/parallel_render.py)
+"""
+
+import filecmp
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+from mkdocs.commands import build as mkdocs_build
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators import render_pool
+from validators.render_pool import RenderResult, apply_result
+
+spec = importlib.util.spec_from_file_location(
+    "parallel_render_hook", Path(__file__).parent.parent / "hooks" / "parallel_render.py"
+)
+parallel_render_hook = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(parallel_render_hook)
+
+
+def differing_files(left: Path, right: Path):
+    """Relative paths that differ between two directory trees, recursively"""
+    comparison = filecmp.dircmp(left, right)
+    different = comparison.left_only + comparison.right_only
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    different += mismatch + errors
+    for name in comparison.common_dirs:
+        different += [f"{name}/{path}" for path in differing_files(left / name, right / name)]
+    return sorted(different)
+
+
+class TestParallelRender:
+    """Test the render pool against a serial build"""
+
+    @pytest.mark.unit
+    def test_result_applied_to_page(self, caplog, monkeypatch):
+        files = Files([File(name, "docs", "site", False) for name in ("a.md", "b.md")])
+        page = Page("A", files.get_file_from_path("a.md"), {})
+        merged = []
+
+        class Shared:
+            def merge(self, changes):
+                merged.append(changes)
+
+        monkeypatch.setitem(render_pool._shared, "test", Shared())
+        result = RenderResult(
+            "<p>A</p>", [], "A", {"top"}, {"b.md": {"x": "b.md#x"}},
+            [("mkdocs.structure.pages", logging.WARNING, "broken link")], {"test": {"hits": 1}},
+        )
+
+        with caplog.at_level(logging.INFO, logger="mkdocs"):
+            apply_result(page, result, files)
+
+        assert (page.content, page.present_anchor_ids) == ("<p>A</p>", {"top"})
+        assert page.links_to_anchors == {files.get_file_from_path("b.md"): {"x": "b.md#x"}}
+        assert ("mkdocs.structure.pages", logging.WARNING, "broken link") in caplog.record_tuples
+        assert merged == [{"hits": 1}]
+
+    @pytest.mark.unit
+    def test_opt_in(self, monkeypatch):
+        monkeypatch.delenv("DRUIDS_RENDER_JOBS", raising=False)
+        assert parallel_render_hook.render_jobs() == 1
+        monkeypatch.setenv("DRUIDS_RENDER_JOBS", "3")
+        assert parallel_render_hook.render_jobs() == 3
+        monkeypatch.setenv("DRUIDS_RENDER_JOBS", "auto")
+        assert parallel_render_hook.render_jobs() >= 1
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not render_pool.can_fork(), reason="render pool needs fork")
+    def test_serial_when_mkdocs_changed(self, caplog, monkeypatch):
+        """A _populate_page with another signature is left alone, with a warning"""
+        assert parallel_render_hook.can_replace_populate()
+
+        def populate(page, config, files, dirty=False, extra=None):
+            pass
+
+        monkeypatch.setenv("DRUIDS_RENDER_JOBS", "2")
+        monkeypatch.setattr(mkdocs_build, "_populate_page", populate)
+        parallel_render_hook.on_startup("build", dirty=False)
+        with caplog.at_level(logging.WARNING, logger="mkdocs"):
+            parallel_render_hook.on_nav(None, {}, None)
+
+        assert mkdocs_build._populate_page is populate
+        assert "pool" not in parallel_render_hook._state
+        assert "rendering serially" in caplog.text
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    @pytest.mark.skipif(not render_pool.can_fork(), reason="render pool needs fork")
+    def test_output_identical_to_serial_build(self, mkdocs_config_path, temp_dir, monkeypatch):
+        for jobs, site in (("1", "serial"), ("2", "parallel")):
+            monkeypatch.setenv("DRUIDS_RENDER_JOBS", jobs)
+            config = load_config(str(mkdocs_config_path))
+            config["site_dir"] = str(temp_dir / site)
+            build(config, dirty=False)
+
+        assert (temp_dir / "parallel" / "index.html").exists()
+        assert differing_files(temp_dir / "serial", temp_dir / "parallel") == []
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for partial rebuild planning (validators/build_graph.py)
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.build_graph import GRAPH_VERSION, global_hash, merge_search_index, nav_signature, plan_rebuild
+
+
+def page(digest, links=(), signature="s", embeds=()):
+    return {"hash": digest, "links": list(links) + list(embeds), "embeds": list(embeds), "signature": signature}
+
+
+@pytest.fixture
+def graph():
+    """index links to a and b, a links to b, c links to nothing"""
+    return {
+        "version": GRAPH_VERSION,
+        "site_dir": "/site",
+        "global": "g1",
+        "pages": {
+            "index.md": page("1", ["a.md", "b.md"]),
+            "a.md": page("2", ["b.md"]),
+            "b.md": page("3"),
+            "c.md": page("4"),
+        },
+        "files": {"img/logo.png": "5", "sw.js": "6"},
+    }
+
+
+class TestRebuildPlan:
+    """Test which pages a change re-renders"""
+
+    @pytest.mark.unit
+    def test_changed_page_and_its_dependents(self, graph):
+        current = copy.deepcopy(graph)
+        current["pages"]["b.md"]["hash"] = "3b"
+        current["files"]["img/logo.png"] = "5b"
+
+        plan = plan_rebuild(graph, current)
+        assert not plan.full
+        assert plan.pages == {"b.md", "a.md", "index.md"}
+        assert plan.files == {"img/logo.png"}
+
+        # a.md now links to c.md instead of b.md: both lose or gain a backlink
+        current = copy.deepcopy(graph)
+        current["pages"]["a.md"] = page("2b", ["c.md"])
+        assert plan_rebuild(graph, current).pages == {"a.md", "b.md", "c.md", "index.md"}
+
+    @pytest.mark.unit
+    def test_nested_embeds(self, graph):
+        """A change reaches every page that embeds it through other embeds"""
+        graph["pages"]["c.md"] = page("4", embeds=["d.md"])
+        graph["pages"]["d.md"] = page("7", embeds=["e.md"])
+        graph["pages"]["e.md"] = page("8")
+        current = copy.deepcopy(graph)
+        current["pages"]["e.md"]["hash"] = "8b"
+
+        assert plan_rebuild(graph, current).pages == {"c.md", "d.md", "e.md"}
+
+    @pytest.mark.unit
+    def test_full_rebuild_fallbacks(self, graph):
+        assert plan_rebuild(None, graph).full
+        assert not plan_rebuild(graph, copy.deepcopy(graph)).full
+
+        changes = {
+            "global": lambda g: g.update({"global": "g2"}),
+            "site_dir": lambda g: g.update({"site_dir": "/elsewhere"}),
+            "added": lambda g: g["pages"].update({"d.md": page("7")}),
+            "title": lambda g: g["pages"]["c.md"].update({"hash": "4b", "signature": "t"}),
+        }
+        for name, change in changes.items():
+            current = copy.deepcopy(graph)
+            change(current)
+            assert plan_rebuild(graph, current).full, name
+
+        body = "---\ntitle: Page\n---\n# Heading\n\nText"
+        assert nav_signature({"title": "Page"}, body) == nav_signature({"title": "Page"}, body + " more")
+        assert nav_signature({"title": "Page"}, body) != nav_signature({"title": "Page"}, body.replace("Heading", "H"))
+
+
+    @pytest.mark.unit
+    def test_glossary_is_a_global_input(self, create_test_file, temp_dir):
+        """Every page links glossary terms, so a glossary edit rebuilds them all"""
+        create_test_file("mkdocs.yml", "site_name: Test\n")
+        create_test_file("docs/reference/glossary.md", "# Glossary\n\n## Term\n\nOld")
+        create_test_file("docs/index.md", "# Home")
+        before = global_hash(temp_dir, [], docs_dir=temp_dir / "docs")
+
+        (temp_dir / "docs" / "index.md").write_text("# Home, edited")
+        assert global_hash(temp_dir, [], docs_dir=temp_dir / "docs") == before
+        (temp_dir / "docs" / "reference" / "glossary.md").write_text("# Glossary\n\n## Term\n\nNew")
+        assert global_hash(temp_dir, [], docs_dir=temp_dir / "docs") != before
+
+
+class TestSearchIndexMerge:
+    """Test carrying search entries forward"""
+
+    @pytest.mark.unit
+    def test_entries_kept_in_build_order(self):
+        previous = {"config": {"lang": ["en"]}, "docs": [
+            {"location": "", "title": "Home"},
+            {"location": "#intro", "title": "Intro"},
+            {"location": "a/", "title": "A (old)"},
+            {"location": "b/", "title": "B"},
+        ]}
+        current = {"config": {"lang": ["en"]}, "docs": [
+            {"location": "a/", "title": "A"},
+            {"location": "a/#new", "title": "New section"},
+        ]}
+
+        merged = merge_search_index(previous, current, ["", "a/", "b/"], {"a/"})
+        assert [entry["title"] for entry in merged["docs"]] == ["Home", "Intro", "A", "New section", "B"]
+        assert merged["config"] == current["config"]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the case-insensitive docs path index
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus
+from validators.path_index import VARIANT_CASE, VARIANT_EXTENSION, VARIANT_INDEX, PathIndex
+
+
+@pytest.fixture
+def index(create_test_file, temp_dir):
+    create_test_file("index.md", "# Home")
+    create_test_file("Guides/Setup.md", "# Setup")
+    create_test_file("reference/index.md", "# Reference")
+    create_test_file("notes/agenda.txt", "agenda")
+    return PathIndex(temp_dir)
+
+
+class TestPathIndex:
+    """Test link resolution and near-miss lookups"""
+
+    @pytest.mark.unit
+    def test_resolution(self, index):
+        assert index.resolve("Guides/Setup.md#step-1", "index.md") == "Guides/Setup.md"
+        assert index.resolve("../Guides/Setup", "reference/index.md") == "Guides/Setup.md"
+        assert index.resolve("/reference/", "Guides/Setup.md") == "reference/index.md"
+        assert index.resolve("reference", "index.md") == "reference/index.md"
+        assert index.resolve("guides/setup.md", "index.md") is None
+        assert index.target("../../outside.md", "index.md") is None
+
+    @pytest.mark.unit
+    def test_corpus_resolves_the_same(self, index, temp_dir):
+        corpus = DocsCorpus(temp_dir).load()
+        for link, source in [
+            ("Guides/Setup.md#step-1", "index.md"),
+            ("../Guides/Setup", "reference/index.md"),
+            ("/reference/", "Guides/Setup.md"),
+            ("reference", "index.md"),
+            ("../notes/agenda.txt", "Guides/Setup.md"),
+            ("missing", "index.md"),
+            ("../../outside.md", "index.md"),
+        ]:
+            assert corpus.resolve_link(source, link) == index.resolve(link, source), link
+
+    @pytest.mark.unit
+    def test_variants(self, index):
+        assert index.variant("guides/setup.md") == (VARIANT_CASE, "Guides/Setup.md")
+        assert index.variant("notes/agenda.md") == (VARIANT_EXTENSION, "notes/agenda.txt")
+        assert index.variant("Reference.md") == (VARIANT_INDEX, "reference/index.md")
+        assert index.variant("missing.md") is None
+        assert index.variant("index.md") is None
+        assert index.with_stem("SETUP") == ["Guides/Setup.md"]
+
+    @pytest.mark.unit
+    def test_membership(self, index, temp_dir):
+        assert "Guides/Setup.md" in index
+        assert temp_dir / "Guides" / "Setup.md" in index
+        assert temp_dir / "guides" / "setup.md" not in index
+        assert index.rel(temp_dir.parent / "elsewhere.md") is None
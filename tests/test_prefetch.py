@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the navigation prefetch manifest (hooks/prefetch.py)
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus
+
+spec = importlib.util.spec_from_file_location(
+    "prefetch_hook", Path(__file__).parent.parent / "hooks" / "prefetch.py"
+)
+prefetch_hook = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(prefetch_hook)
+
+SOURCES = {
+    "index.md": "# Home\n\n[Start](learn/start.md)\n",
+    "learn/start.md": (
+        "# Start\n\n[Git](git.md) then [[glossary]]\n\n"
+        "More on [git](git.md#basics) and [security](../implement/security.md)\n\n"
+        "[self](start.md) ![diagram](diagram.png) [home](../index.md)\n"
+    ),
+    "learn/git.md": "# Git\n",
+    "reference/glossary.md": "# Glossary\n",
+    "implement/security.md": "# Security\n",
+}
+
+
+@pytest.fixture
+def corpus():
+    corpus = DocsCorpus(Path("."))
+    for rel_path, text in SOURCES.items():
+        corpus.add_page(rel_path, text)
+    corpus.files.update(list(SOURCES) + ["learn/diagram.png"])
+    return corpus
+
+
+def make_pages(nav_order):
+    """Page stand-ins with nav links; pages not in nav_order have none"""
+    pages = {}
+    for rel_path in SOURCES:
+        url = "" if rel_path == "index.md" else rel_path[:-len(".md")] + "/"
+        pages[rel_path] = SimpleNamespace(file=SimpleNamespace(src_uri=rel_path), url=url,
+                                          next_page=None, previous_page=None)
+    for previous, following in zip(nav_order, nav_order[1:]):
+        pages[previous].next_page = pages[following]
+        pages[following].previous_page = pages[previous]
+    return list(pages.values())
+
+
+class TestPrefetchManifest:
+    """Test link prominence and the emitted manifest"""
+
+    @pytest.mark.unit
+    def test_outgoing_links_by_prominence(self, corpus):
+        """Repeated links rank first, then document order; self and asset links are dropped"""
+        assert corpus.outgoing("learn/start.md") == [
+            "learn/git.md", "reference/glossary.md", "implement/security.md", "index.md"
+        ]
+        assert corpus.outgoing("learn/git.md") == []
+
+    @pytest.mark.unit
+    def test_manifest_order(self, corpus):
+        pages = make_pages(["index.md", "learn/start.md", "implement/security.md"])
+        manifest = prefetch_hook.build_manifest(pages, corpus, link_limit=2)
+
+        # nav next first, then the top links not already listed, then nav previous
+        assert manifest["learn/start/"] == ["implement/security/", "learn/git/", "reference/glossary/", ""]
+        assert manifest[""] == ["learn/start/"]
+        assert manifest["implement/security/"] == ["learn/start/"]
+        assert "learn/git/" not in manifest
+
+    @pytest.mark.unit
+    def test_manifest_written(self, corpus, temp_dir):
+        prefetch_hook._manifest = prefetch_hook.build_manifest(make_pages(["index.md", "learn/git.md"]), corpus)
+        prefetch_hook.on_post_build({"site_dir": str(temp_dir)})
+
+        data = json.loads((temp_dir / prefetch_hook.PREFETCH_FILE).read_text())
+        assert data[""] == ["learn/git/", "learn/start/"]
+        assert data["learn/git/"] == [""]
@@ -4,13 +4,20 @@ Tests for rendered HTML output to catch issues that configuration tests miss.
 These tests build the site and check the actual generated HTML.
 """
 
-import re
 import shutil
+import sys
 from pathlib import Path
 import pytest
 from bs4 import BeautifulSoup
 from test_utils import run_command
 
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.html_scan import HTMLScanner, hits_by_path
+from validators.page_weight import budget_violations, load_budgets, weigh_site
+from validators.resource_hints import preload_problems
+
 
 def get_project_root():
     """Get the project root directory"""
@@ -50,76 +57,59 @@ class TestRenderedOutput:
         with open(file_path, 'r', encoding='utf-8') as f:
             return BeautifulSoup(f.read(), 'html.parser')
     
+    @pytest.fixture(scope="class")
+    def site_scan(self, built_site):
+        """Hits of every rendered-output rule, from one pass over each page"""
+        return HTMLScanner().scan_site(built_site)
+    
     @pytest.mark.integration
-    def test_no_broken_wikilink_syntax(self, built_site):
+    def test_no_broken_wikilink_syntax(self, site_scan):
         """Test that wikilinks don't have mixed syntax in rendered output"""
-        # Check tutorials page which had the issue
-        soup = self.read_html(built_site, "tutorials/index.html")
-        
-        # Find all links
-        links = soup.find_all('a', href=True)
-        
-        broken_patterns = []
-        for link in links:
-            href = link.get('href', '')
-            # Check for the broken pattern: [../path](../path.md){#hash}
-            if re.search(r'\[.*\]\(.*\)\{#[a-f0-9]+\}', href):
-                broken_patterns.append({
-                    'href': href,
-                    'text': link.get_text(strip=True)
-                })
+        # The broken pattern: href="[../path](../path.md){#hash}"
+        broken_patterns = site_scan['wikilink-syntax-in-href']
         
         assert len(broken_patterns) == 0, \
             f"Found broken wikilink patterns: {broken_patterns}"
     
     @pytest.mark.integration
-    def test_no_wikilink_hashes_in_urls(self, built_site):
+    def test_no_wikilink_hashes_in_urls(self, site_scan):
         """Test that URLs don't contain Obsidian hash anchors"""
-        pages_to_check = [
-            "tutorials/index.html",
-            "index.html",
-            "blog/index.html"
-        ]
-        
-        hash_pattern = re.compile(r'#[a-f0-9]{32}')
-        problematic_links = []
-        
-        for page in pages_to_check:
-            soup = self.read_html(built_site, page)
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link.get('href', '')
-                if hash_pattern.search(href):
-                    problematic_links.append({
-                        'page': page,
-                        'href': href,
-                        'text': link.get_text(strip=True)
-                    })
+        problematic_links = site_scan['wikilink-hash-in-href']
         
         assert len(problematic_links) == 0, \
             f"Found URLs with hash anchors: {problematic_links}"
     
     @pytest.mark.integration
-    def test_code_blocks_have_syntax_highlighting(self, built_site):
+    def test_code_blocks_have_syntax_highlighting(self, site_scan):
         """Test that code blocks have proper syntax highlighting"""
-        # Check customization guide which has code examples
-        soup = self.read_html(built_site, "customization-guide/index.html")
+        highlighted = hits_by_path(site_scan['highlighted-code'])
         
-        # Look for code blocks
-        code_blocks = soup.find_all('pre')
+        # Every page with code blocks should have at least some highlighting
+        unhighlighted = [
+            f"{page} ({len(blocks)} code blocks)"
+            for page, blocks in hits_by_path(site_scan['pre-block']).items()
+            if page not in highlighted
+        ]
         
-        if len(code_blocks) > 0:
-            # At least some code blocks should have highlighting
-            highlighted_blocks = [
-                block for block in code_blocks
-                if 'highlight' in block.get('class', []) or
-                   block.find('code', class_=re.compile(r'language-\w+')) or
-                   block.find(class_=re.compile(r'highlight|codehilite'))
-            ]
-            
-            assert len(highlighted_blocks) > 0, \
-                f"No syntax highlighting found in {len(code_blocks)} code blocks"
+        assert len(unhighlighted) == 0, \
+            f"No syntax highlighting found in: {unhighlighted}"
+    
+    @pytest.mark.integration
+    def test_preloaded_fonts_exist_and_are_used(self, built_site):
+        """Test that every font preload hint points at a font the page uses"""
+        problems = preload_problems(built_site)
+        
+        assert len(problems) == 0, \
+            f"Found bad font preloads: {problems}"
+    
+    @pytest.mark.integration
+    def test_pages_within_weight_budgets(self, built_site):
+        """Test every page's download size against config/page-budgets.yml"""
+        budgets = load_budgets(get_project_root() / "config" / "page-budgets.yml")
+        violations = budget_violations(weigh_site(built_site), budgets)
+        
+        assert len(violations) == 0, \
+            f"Pages over their weight budget: {violations}"
     
     @pytest.mark.integration
     def test_all_internal_links_resolve(self, built_site):
@@ -191,40 +181,10 @@ class TestRenderedOutput:
             f"Tags link should point to '../tags/' but points to '{tags_href}'"
     
     @pytest.mark.integration
-    def test_no_mixed_link_syntax(self, built_site):
+    def test_no_mixed_link_syntax(self, site_scan):
         """Test that no mixed Markdown/Wikilink syntax appears in output"""
-        pages_to_check = [
-            "tutorials/index.html",
-            "blog/index.html",
-            "index.html"
-        ]
-        
-        mixed_syntax_pattern = re.compile(r'\[\[.*\]\]')
-        problems = []
-        
-        for page in pages_to_check:
-            soup = self.read_html(built_site, page)
-            
-            # Check link hrefs
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                if mixed_syntax_pattern.search(href):
-                    problems.append({
-                        'page': page,
-                        'element': 'href',
-                        'value': href
-                    })
-            
-            # Check visible text (shouldn't see raw wikilinks)
-            page_text = soup.get_text()
-            if mixed_syntax_pattern.search(page_text):
-                # Find specific instances
-                for match in mixed_syntax_pattern.finditer(page_text):
-                    problems.append({
-                        'page': page,
-                        'element': 'text',
-                        'value': match.group()
-                    })
+        # Raw [[wikilinks]] in hrefs or visible text
+        problems = site_scan['raw-wikilink']
         
         assert len(problems) == 0, \
             f"Found mixed link syntax in rendered output: {problems}"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for font preload and preconnect hints (validators/resource_hints.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.resource_hints import ResourceHints, preload_problems
+
+CSS = """
+@font-face { font-family: "Inter"; font-weight: 700; src: url("../fonts/inter-700.woff2") format("woff2"); }
+@font-face { font-family: "Inter"; font-weight: 400;
+             src: url("../fonts/inter-400.woff") format("woff"), url("../fonts/inter-400.woff2") format("woff2"); }
+@font-face { font-family: "Oswald"; src: url("../fonts/oswald.woff2") format("woff2"); }
+body { font-family: "Inter", sans-serif; }
+"""
+
+PAGE = """<!doctype html>
+<html><head>
+<meta charset="utf-8">
+<link rel="canonical" href="https://example.org/guide/">
+<link rel="stylesheet" href="../assets/css/site.css">
+<style>:root{--md-code-font:"JetBrains Mono"}</style>
+</head><body>
+<script src="https://cdn.example.com/lib.js"></script>
+</body></html>
+"""
+
+
+@pytest.fixture
+def site(temp_dir):
+    for path in ("assets/css", "assets/fonts", "guide"):
+        (temp_dir / path).mkdir(parents=True)
+    (temp_dir / "assets/css/site.css").write_text(CSS)
+    for name in ("inter-400.woff", "inter-400.woff2", "inter-700.woff2", "oswald.woff2"):
+        (temp_dir / "assets/fonts" / name).write_bytes(b"font")
+    return temp_dir
+
+
+class TestResourceHints:
+    """Test hints generated from a built page and its stylesheets"""
+
+    @pytest.mark.unit
+    def test_used_fonts_preloaded_and_origins_preconnected(self, site):
+        html = ResourceHints(site).inject(PAGE, "guide/")
+        head = html.split("</head>")[0]
+
+        assert head.count('rel="preload"') == 1
+        assert '<link rel="preload" href="../assets/fonts/inter-400.woff2" as="font" type="font/woff2" crossorigin>' in head
+        assert '<link rel="preconnect" href="https://cdn.example.com">' in head
+        assert "example.org" not in head.split('<link rel="canonical"')[0]
+        # Hints go after the charset declaration, before the first stylesheet
+        assert head.index("<meta charset") < head.index("preload") < head.index('rel="stylesheet"')
+
+    @pytest.mark.unit
+    def test_preloads_exist_and_are_used(self, site):
+        page = site / "guide" / "index.html"
+        page.write_text(ResourceHints(site).inject(PAGE, "guide/"))
+        assert preload_problems(site) == []
+
+        page.write_text(page.read_text().replace(
+            "<meta charset=\"utf-8\">",
+            '<meta charset="utf-8">\n'
+            '<link rel="preload" href="../assets/fonts/oswald.woff2" as="font" type="font/woff2" crossorigin>\n'
+            '<link rel="preload" href="../assets/fonts/gone.woff2" as="font" type="font/woff2" crossorigin>',
+        ))
+        assert preload_problems(site) == [
+            "guide/index.html: preloaded font ../assets/fonts/oswald.woff2 is not used by the page",
+            "guide/index.html: preloaded font ../assets/fonts/gone.woff2 does not exist",
+        ]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the sharded search index (hooks/search_shards.py)
+"""
+
+import gzip
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "search_shards", Path(__file__).parent.parent / "hooks" / "search_shards.py"
+)
+search_shards = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(search_shards)
+
+INDEX = {
+    "config": {"lang": ["en"]},
+    "docs": [
+        {"location": "learn/", "title": "Learning Paths", "text": "<p>Organizers studying <code>git</code> together</p>", "tags": ["git"]},
+        {"location": "learn/#cadres", "title": "Cadres", "text": "<p>The cadre organizes study groups &amp; classes</p>"},
+        {"location": "teach/", "title": "Teaching 101", "text": "<p>Run classes for 10 organizers</p>"},
+    ],
+}
+
+
+class TestSearchShards:
+    """Test build-time tokenizing, sharding and the written output"""
+
+    @pytest.mark.unit
+    def test_terms_are_stemmed_and_filtered(self):
+        assert list(search_shards.terms("<p>The Organizers are studying &amp; classes</p>")) == [
+            "organizer", "study", "class"
+        ]
+        assert [search_shards.stem(word) for word in ("notes", "focus", "passed", "running")] == [
+            "note", "focus", "pass", "runn"
+        ]
+
+    @pytest.mark.unit
+    def test_postings_grouped_by_prefix(self):
+        docs, shards = search_shards.build_shards(INDEX)
+
+        assert docs == [
+            ["learn/", "Learning Paths", "Organizers studying git together"],
+            ["learn/#cadres", "Cadres", "The cadre organizes study groups &amp; classes"],
+            ["teach/", "Teaching 101", "Run classes for 10 organizers"],
+        ]
+        assert set(shards) == {"0", "c", "g", "l", "o", "p", "r", "s", "t"}
+        assert shards["c"]["cadre"] == [1, 11]  # title weight 10 plus one text hit
+        assert shards["c"]["class"] == [1, 1, 2, 1]
+        assert shards["g"]["git"] == [0, 21]  # tag weight 20 plus one text hit
+        assert "101" in shards["0"]
+        assert all(search_shards.shard_key(term) == key for key, shard in shards.items() for term in shard)
+
+    @pytest.mark.unit
+    def test_excerpts(self):
+        long_text = "<p>" + "word " * 100 + "</p>"
+        short = search_shards.excerpt(long_text)
+
+        assert short.endswith("word…") and len(short) <= search_shards.EXCERPT_LENGTH + 1
+        # Text is re-escaped, so markup in the source can't reach the result list
+        assert search_shards.excerpt("<p>Use &lt;b&gt; and &amp;</p>") == "Use &lt;b&gt; and &amp;"
+
+    @pytest.mark.unit
+    def test_written_shards_and_manifest(self, temp_dir):
+        (temp_dir / "search").mkdir()
+        (temp_dir / "search" / "search_index.json").write_text(json.dumps(INDEX))
+        (temp_dir / search_shards.SHARD_DIR).mkdir(parents=True)
+        (temp_dir / search_shards.SHARD_DIR / "c.stale.json.gz").write_bytes(b"")
+
+        manifest = search_shards.write_shards(temp_dir)
+        directory = temp_dir / search_shards.SHARD_DIR
+
+        assert json.loads((directory / "manifest.json").read_text()) == manifest
+        assert manifest["docs"]["entries"] == 3
+        shard = json.loads(gzip.decompress((directory / manifest["shards"]["c"]["file"]).read_bytes()))
+        assert shard["cadre"] == [1, 11]
+        assert not (directory / "c.stale.json.gz").exists()
+        # Content-hashed names are stable between identical builds
+        assert search_shards.write_shards(temp_dir) == manifest
+        assert search_shards.write_shards(temp_dir / "missing") == {}
+
+    @pytest.mark.unit
+    def test_material_search_uses_the_shards(self, temp_dir):
+        """Pages point the search UI at the shard worker; the index keeps only its config"""
+        html = '<script id="__config">{"base": "..", "search": "../assets/javascripts/workers/search.2c215733.min.js"}</script>'
+        assert search_shards.use_shard_worker(html) == (
+            '<script id="__config">{"base": "..", "search": "../assets/js/search.js"}</script>'
+        )
+
+        (temp_dir / "search").mkdir()
+        (temp_dir / "search" / "search_index.json").write_text(json.dumps(INDEX))
+        search_shards.on_post_build({"site_dir": str(temp_dir)})
+        assert json.loads((temp_dir / "search" / "search_index.json").read_text()) == {
+            "config": {"lang": ["en"]}, "docs": []
+        }
+        manifest = json.loads((temp_dir / search_shards.SHARD_DIR / "manifest.json").read_text())
+        assert manifest["docs"]["entries"] == 3
+        assert manifest["max_term_length"] == search_shards.MAX_TERM_LENGTH
@@ -15,6 +15,7 @@ from test_utils import (
     extract_frontmatter,
     find_markdown_links,
     get_all_markdown_files,
+    get_page_tokens,
 )
 
 
@@ -121,16 +122,8 @@ class TestStaticAnalysis:
             if body is None:
                 body = content
             
-            lines = body.split('\n')
-            
-            # Check for proper heading structure
-            headings = []
-            for i, line in enumerate(lines):
-                heading_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-                if heading_match:
-                    level = len(heading_match.group(1))
-                    text = heading_match.group(2)
-                    headings.append((level, text, i + 1))
+            # Headings come from the shared token stream, which skips code fences
+            headings = [(h.level, h.text, h.line) for h in get_page_tokens(md_file).headings]
             
             # Validate heading hierarchy
             if headings:
@@ -151,17 +144,6 @@ class TestStaticAnalysis:
                             f"{rel_path}:L{line_num}: Heading level jumped from H{previous_level} to H{current_level}"
                         )
             
-            # Check for empty sections
-            current_section_lines = 0
-            for line in lines:
-                if re.match(r'^#{1,6}\s+', line.strip()):
-                    if current_section_lines < 2:  # Heading + at least one content line
-                        # Find the line number (approximate)
-                        pass  # This would need more complex tracking
-                    current_section_lines = 0
-                elif line.strip():
-                    current_section_lines += 1
-            
             # Check for broken markdown syntax
             # Unmatched brackets
             if '[' in body and ']' in body:
@@ -321,7 +303,8 @@ class TestStaticAnalysis:
                 if 'title' not in frontmatter:
                     quality_stats['files_without_title'] += 1
             
-            if re.search(r'^#{1,6}\s+', body, re.MULTILINE):
+            has_headings = bool(get_page_tokens(md_file).headings)
+            if has_headings:
                 quality_stats['files_with_headings'] += 1
             
             if find_markdown_links(content):
@@ -340,7 +323,7 @@ class TestStaticAnalysis:
             if not frontmatter and rel_path.name != 'index.md':
                 quality_issues.append(f"{rel_path}: No frontmatter")
             
-            if word_count > 50 and not re.search(r'^#{1,6}\s+', body, re.MULTILINE):
+            if word_count > 50 and not has_headings:
                 quality_issues.append(f"{rel_path}: No headings in substantial content")
         
         # Print statistics
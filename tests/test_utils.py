@@ -3,12 +3,36 @@
 Shared utility functions for MkDocs tests
 """
 
+import copy
+import logging
+import os
 import re
+import shutil
 import subprocess
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import yaml
+from mkdocs.commands.build import build as mkdocs_build
+from mkdocs.config import load_config
+from mkdocs.plugins import BasePlugin
+from mkdocs.structure.files import Files
+
+# Make the project-level validators package importable from tests
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.build_log import BuildLogStream, classify_info, classify_warning
+from validators.markdown_tokens import PageTokens, tokenize
+from validators.nav_index import NavIndex
+from validators.path_index import PathIndex
+
+# (path, mtime_ns) -> PageTokens, shared by every structural check in the session
+_token_cache: Dict[Tuple[str, int], PageTokens] = {}
+# resolved docs dir -> PathIndex, so link checks walk the tree once
+_path_index_cache: Dict[str, PathIndex] = {}
+# mkdocs.yml path -> NavIndex, so nav checks walk the nav once
+_nav_index_cache: Dict[str, NavIndex] = {}
 
 
 def run_command(cmd: str, cwd: Optional[Path] = None) -> Tuple[bool, str, str]:
@@ -104,6 +128,39 @@ def find_markdown_images(content: str) -> List[Dict[str, str]]:
     return images
 
 
+def get_path_index(docs_dir: Path) -> PathIndex:
+    """
+    Path index of a docs directory, built with one walk per session
+
+    Args:
+        docs_dir: Documentation root directory
+
+    Returns:
+        Shared PathIndex for docs_dir
+    """
+    key = os.path.abspath(docs_dir)
+    if key not in _path_index_cache:
+        _path_index_cache[key] = PathIndex(Path(key))
+    return _path_index_cache[key]
+
+
+def get_nav_index(config_path: Path) -> NavIndex:
+    """
+    Flattened nav of an mkdocs.yml, walked once per session
+
+    Args:
+        config_path: Path to mkdocs.yml
+
+    Returns:
+        Shared NavIndex for the config's nav
+    """
+    key = os.path.abspath(config_path)
+    if key not in _nav_index_cache:
+        with open(key, 'r', encoding='utf-8') as f:
+            _nav_index_cache[key] = NavIndex.from_config(yaml.safe_load(f) or {})
+    return _nav_index_cache[key]
+
+
 def validate_internal_link(link: str, current_file: Path, docs_dir: Path) -> bool:
     """
     Validate an internal link
@@ -120,27 +177,14 @@ def validate_internal_link(link: str, current_file: Path, docs_dir: Path) -> boo
     if link.startswith(('http://', 'https://', 'mailto:', '#')):
         return True
     
-    # Remove anchor if present
-    if '#' in link:
-        link = link.split('#')[0]
-    
     # Skip empty links
-    if not link:
+    if not link.split('#')[0]:
         return True
     
-    # Resolve the link relative to the current file
-    link_path = (current_file.parent / link).resolve()
-    
-    # Check if it's a directory (should have index.md)
-    if link_path.is_dir():
-        link_path = link_path / "index.md"
-    
-    # Add .md extension if not present
-    if not link_path.suffix and not link_path.exists():
-        link_path = link_path.with_suffix('.md')
-    
-    # Check if the file exists
-    return link_path.exists()
+    # Directories resolve to index.md, extensionless links to .md
+    index = get_path_index(docs_dir)
+    source = index.rel(current_file)
+    return source is not None and index.resolve(link, source) is not None
 
 
 def check_command_available(command: str) -> bool:
@@ -193,6 +237,36 @@ def get_all_markdown_files(directory: Path, exclude_patterns: Optional[List[str]
     return markdown_files
 
 
+def get_page_tokens(md_file: Path) -> PageTokens:
+    """
+    Tokenize a markdown file once per session
+
+    Args:
+        md_file: Path to the markdown file
+
+    Returns:
+        PageTokens with headings, fences, links and callouts
+    """
+    key = (str(md_file.resolve()), md_file.stat().st_mtime_ns)
+    if key not in _token_cache:
+        _token_cache[key] = tokenize(md_file.read_text(encoding='utf-8'))
+    return _token_cache[key]
+
+
+def build_anchor_index(markdown_files: List[Path]) -> Dict[Path, Set[str]]:
+    """
+    Index the anchor ids of every page once
+
+    Args:
+        markdown_files: Markdown files to index
+
+    Returns:
+        Dict mapping each absolute file path to the ids its rendered page
+        contains (toc heading slugs with duplicate suffixes, explicit ids)
+    """
+    return {Path(os.path.abspath(md_file)): get_page_tokens(md_file).anchor_ids() for md_file in markdown_files}
+
+
 def validate_yaml_file(yaml_path: Path) -> Tuple[bool, Optional[str]]:
     """
     Validate a YAML file
@@ -223,48 +297,9 @@ def parse_mkdocs_output(output: str) -> Dict[str, List[Dict[str, str]]]:
     Returns:
         Dict with 'warnings', 'errors', 'info' keys containing parsed messages
     """
-    result = {
-        'warnings': [],
-        'errors': [],
-        'info': []
-    }
-    
-    lines = output.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Parse WARNING messages
-        if line.startswith('WARNING'):
-            # Extract the warning message after "WARNING - "
-            match = re.match(r'WARNING\s*-\s*(.+)', line)
-            if match:
-                warning_text = match.group(1)
-                parsed_warning = parse_warning_message(warning_text)
-                if parsed_warning:
-                    result['warnings'].append(parsed_warning)
-                    
-        # Parse ERROR messages
-        elif line.startswith('ERROR'):
-            match = re.match(r'ERROR\s*-\s*(.+)', line)
-            if match:
-                result['errors'].append({
-                    'type': 'error',
-                    'message': match.group(1)
-                })
-                
-        # Parse INFO messages (especially for absolute links)
-        elif line.startswith('INFO') and 'absolute link' in line:
-            match = re.match(r'INFO\s*-\s*(.+)', line)
-            if match:
-                info_text = match.group(1)
-                parsed_info = parse_info_message(info_text)
-                if parsed_info:
-                    result['info'].append(parsed_info)
-    
-    return result
+    stream = BuildLogStream()
+    stream.feed_text(output)
+    return stream.parsed()
 
 
 def parse_warning_message(warning_text: str) -> Optional[Dict[str, str]]:
@@ -277,50 +312,7 @@ def parse_warning_message(warning_text: str) -> Optional[Dict[str, str]]:
     Returns:
         Dict with warning details or None if not parseable
     """
-    # Pattern: "A reference to 'X' is included in the 'nav' configuration, which is not found"
-    nav_pattern = r"A reference to '([^']+)' is included in the 'nav' configuration, which is not found"
-    match = re.match(nav_pattern, warning_text)
-    if match:
-        return {
-            'type': 'nav_reference_not_found',
-            'severity': 'critical',
-            'file': match.group(1),
-            'message': warning_text
-        }
-    
-    # Pattern: "Doc file 'X' contains a link 'Y', but the target is not found"
-    link_pattern = r"Doc file '([^']+)' contains a link '([^']+)', but the target (?:'([^']+)' )?is not found"
-    match = re.match(link_pattern, warning_text)
-    if match:
-        return {
-            'type': 'broken_link',
-            'severity': 'high',
-            'source_file': match.group(1),
-            'link': match.group(2),
-            'target': match.group(3) or match.group(2),
-            'message': warning_text
-        }
-    
-    # Pattern: "Doc file 'X' contains a link 'Y', but the target 'Z' is not found. Did you mean 'W'?"
-    suggestion_pattern = r"Doc file '([^']+)' contains a link '([^']+)', but the target '([^']+)' is not found.*Did you mean '([^']+)'\?"
-    match = re.match(suggestion_pattern, warning_text)
-    if match:
-        return {
-            'type': 'broken_link_with_suggestion',
-            'severity': 'high',
-            'source_file': match.group(1),
-            'link': match.group(2),
-            'target': match.group(3),
-            'suggestion': match.group(4),
-            'message': warning_text
-        }
-    
-    # Generic warning
-    return {
-        'type': 'generic',
-        'severity': 'medium',
-        'message': warning_text
-    }
+    return classify_warning(warning_text)
 
 
 def parse_info_message(info_text: str) -> Optional[Dict[str, str]]:
@@ -333,20 +325,7 @@ def parse_info_message(info_text: str) -> Optional[Dict[str, str]]:
     Returns:
         Dict with info details or None if not parseable
     """
-    # Pattern: "Doc file 'X' contains an absolute link 'Y', it was left as is. Did you mean 'Z'?"
-    absolute_pattern = r"Doc file '([^']+)' contains an absolute link '([^']+)', it was left as is\.(?:\s*Did you mean '([^']+)'\?)?"
-    match = re.match(absolute_pattern, info_text)
-    if match:
-        return {
-            'type': 'absolute_link',
-            'severity': 'medium',
-            'source_file': match.group(1),
-            'link': match.group(2),
-            'suggestion': match.group(3) if match.group(3) else None,
-            'message': info_text
-        }
-    
-    return None
+    return classify_info(info_text)
 
 
 def categorize_warnings(parsed_output: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str, str]]]:
@@ -450,4 +429,100 @@ def format_warning_report(categorized_warnings: Dict[str, List[Dict[str, str]]])
                 if len(items) > 5:
                     report_lines.append(f"    ... and {len(items) - 5} more")
     
-    return "\n".join(report_lines)
\ No newline at end of file
+    return "\n".join(report_lines)
+
+class _MicroSitePlugin(BasePlugin):
+    """Keeps micro-site builds cheap: no theme assets, one Jinja environment"""
+
+    def __init__(self):
+        super().__init__()
+        self.env = None
+
+    def on_files(self, files, config):
+        # Tests read the rendered pages; copying the theme's assets is most of a build
+        return Files([f for f in files if f.abs_src_path is None or f.abs_src_path.startswith(config['docs_dir'])])
+
+    def on_env(self, env, config, files):
+        # Template compilation is the other big cost, so it's done on the first build only
+        if self.env is None:
+            self.env = env
+        return self.env
+
+
+class MicroSite:
+    """
+    In-process MkDocs builds of small sites for rendering tests
+
+    The config (theme, plugins, Markdown extensions) is loaded once; each
+    build() replaces the docs, runs mkdocs.commands.build with the same
+    config object and returns the rendered pages, so a case costs a few
+    milliseconds of Markdown and template rendering instead of a
+    subprocess.
+    """
+
+    def __init__(self, root: Path, config_text: str):
+        self.root = Path(root)
+        self.docs_dir = self.root / "docs"
+        self.site_dir = self.root / "site"
+        self.docs_dir.mkdir(parents=True, exist_ok=True)
+        config_path = self.root / "mkdocs.yml"
+        config_path.write_text(config_text, encoding="utf-8")
+        self.config = load_config(str(config_path), site_dir=str(self.site_dir))
+        self.config.plugins["druids-micro-site"] = _MicroSitePlugin()
+        # Plugins expect a fresh instance per build (pub-obsidian accumulates
+        # backlinks), so their state is put back before each build. Hooks are
+        # modules and reset their own state in their events.
+        self._plugin_state = {
+            name: copy.deepcopy(vars(plugin))
+            for name, plugin in self.config.plugins.items()
+            if isinstance(plugin, BasePlugin) and name != "druids-micro-site"
+        }
+        # (level name, message) of the warnings and errors logged by the last build
+        self.messages: List[Tuple[str, str]] = []
+
+    def build(self, pages: Dict[str, str]) -> Dict[str, str]:
+        """
+        Build a site from pages and return its HTML
+
+        Args:
+            pages: Markdown source keyed by path under docs/
+
+        Returns:
+            Rendered HTML keyed by path under site/, e.g. 'subdir/page/index.html'
+        """
+        shutil.rmtree(self.docs_dir)
+        for path, content in pages.items():
+            file_path = self.docs_dir / path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content, encoding="utf-8")
+        for name, state in self._plugin_state.items():
+            plugin_vars = vars(self.config.plugins[name])
+            plugin_vars.clear()
+            plugin_vars.update(copy.deepcopy(state))
+
+        handler = _MessageHandler()
+        logger = logging.getLogger("mkdocs")
+        logger.addHandler(handler)
+        try:
+            mkdocs_build(self.config)
+        finally:
+            logger.removeHandler(handler)
+        self.messages = handler.messages
+
+        return {
+            path.relative_to(self.site_dir).as_posix(): path.read_text(encoding="utf-8")
+            for path in sorted(self.site_dir.rglob("*.html"))
+        }
+
+    def warnings(self) -> List[str]:
+        """Warnings logged during the last build"""
+        return [message for level, message in self.messages if level == "WARNING"]
+
+
+class _MessageHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages: List[Tuple[str, str]] = []
+
+    def emit(self, record):
+        self.messages.append((record.levelname, record.getMessage()))
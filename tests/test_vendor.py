@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for self-hosting third-party scripts (validators/vendor.py)
+"""
+
+import io
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.vendor import VendorError, parse_cdn_url, subresource_integrity, vendor_script
+
+URL = "https://cdn.jsdelivr.net/npm/mathjax@3.2.2/es5/tex-mml-chtml.js"
+
+
+def write_tarball(path: Path, files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"package/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    path.write_bytes(buffer.getvalue())
+
+
+@pytest.fixture
+def local_dir(temp_dir):
+    local = temp_dir / "tarballs"
+    local.mkdir()
+    write_tarball(local / "mathjax-3.2.2.tgz", {
+        "es5/tex-mml-chtml.js": b"window.MathJax = window.MathJax || {};",
+        "es5/output/chtml/fonts/woff-v2/MathJax_Zero.woff": b"font",
+        "es5/sre/mathmaps/en.json": b"{}",
+    })
+    return local
+
+
+class TestVendor:
+    """Test fetching, pinning and laying out vendored scripts"""
+
+    @pytest.mark.unit
+    def test_cdn_urls(self):
+        assert parse_cdn_url(URL) == ("mathjax", "3.2.2", "es5/tex-mml-chtml.js")
+        assert parse_cdn_url("https://unpkg.com/@scope/pkg@1.0.0/dist/x.js").tarball_url == \
+            "https://registry.npmjs.org/@scope/pkg/-/pkg-1.0.0.tgz"
+        assert not parse_cdn_url("https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js").pinned
+        assert parse_cdn_url("https://polyfill.io/v3/polyfill.min.js?features=es6") is None
+
+    @pytest.mark.unit
+    def test_script_self_hosted_from_local_tarballs(self, temp_dir, local_dir):
+        cache, lock = temp_dir / "cache", {}
+        # Packages are only recorded in the lock when asked to
+        with pytest.raises(VendorError, match="no entry in vendor-lock.json"):
+            vendor_script(URL, cache, lock, local_dir)
+        assert lock == {}
+        vendored = vendor_script(URL, cache, lock, local_dir, update=True)
+
+        script = b"window.MathJax = window.MathJax || {};"
+        assert vendored.src.startswith("assets/vendor/mathjax@3.2.2/es5/tex-mml-chtml.")
+        assert vendored.integrity == subresource_integrity(script)
+        assert sorted(vendored.files) == [
+            "assets/vendor/mathjax@3.2.2/es5/output/chtml/fonts/woff-v2/MathJax_Zero.woff",
+            vendored.src,
+        ]
+        assert (cache / "mathjax-3.2.2.tgz").exists()
+        assert lock["mathjax@3.2.2"]["integrity"].startswith("sha512-")
+
+        # The cached tarball is reused; a different download fails the lock check
+        assert vendor_script(URL, cache, lock, temp_dir / "missing") == vendored
+        write_tarball(cache / "mathjax-3.2.2.tgz", {"es5/tex-mml-chtml.js": b"tampered"})
+        with pytest.raises(VendorError, match="integrity"):
+            vendor_script(URL, cache, lock, local_dir)
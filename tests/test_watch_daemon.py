@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the watch-mode validation daemon and the in-memory corpus index
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.corpus import DocsCorpus
+from validators.watch import PollingWatcher, ValidationDaemon
+
+FRONTMATTER = """---
+title: Page
+type: guide
+security: L0
+document_id: TST-GUIDE-2024-001-L0
+---
+"""
+
+
+@pytest.fixture
+def docs(create_test_file, temp_dir):
+    """Small docs tree: index links to guide, guide wikilinks to glossary"""
+    create_test_file("index.md", FRONTMATTER + "\n[Guide](guide.md)\n")
+    create_test_file("guide.md", FRONTMATTER + "\nSee [[glossary]] and [Home](index.md).\n")
+    create_test_file("reference/glossary.md", FRONTMATTER + "\n# Glossary\n")
+    create_test_file("unrelated.md", FRONTMATTER + "\n# Unrelated\n")
+    return temp_dir
+
+
+class TestDocsCorpus:
+    """Test the incremental corpus index"""
+
+    @pytest.mark.unit
+    def test_reverse_link_graph(self, docs):
+        """Pages linking by path or by wikilink stem are dependents"""
+        corpus = DocsCorpus(docs).load()
+
+        assert corpus.dependents("guide.md") == {"index.md"}
+        assert corpus.dependents("reference/glossary.md") == {"guide.md"}
+        assert corpus.dependents("unrelated.md") == set()
+
+    @pytest.mark.unit
+    def test_links_in_code_fences_are_ignored(self, docs, create_test_file):
+        """Example links inside fences are not part of the link graph"""
+        create_test_file("example.md", "```markdown\n[Example](missing.md)\n```\n")
+        corpus = DocsCorpus(docs).load()
+
+        assert corpus.pages["example.md"].links == []
+
+    @pytest.mark.unit
+    def test_resolution(self, docs):
+        """Links resolve like MkDocs; wikilinks resolve by stem"""
+        corpus = DocsCorpus(docs).load()
+
+        assert corpus.resolve_link("guide.md", "index.md#top") == "index.md"
+        assert corpus.resolve_link("guide.md", "reference/") is None
+        assert corpus.resolve_link("guide.md", "reference/glossary") == "reference/glossary.md"
+        assert corpus.resolve_wikilink("glossary") == "reference/glossary.md"
+        assert corpus.resolve_wikilink("reference/glossary") == "reference/glossary.md"
+        assert corpus.resolve_wikilink("other/glossary") is None
+
+    @pytest.mark.unit
+    def test_attachments_resolve_as_wikilinks(self, docs, create_test_file):
+        """[[image.png]] finds non-page files, which stay indexed as they come and go"""
+        create_test_file("img/diagram.png", "")
+        corpus = DocsCorpus(docs).load()
+
+        assert corpus.resolve_wikilink("diagram.png") == "img/diagram.png"
+        corpus.remove("img/diagram.png")
+        assert corpus.resolve_wikilink("diagram.png") is None
+        corpus.update("img/diagram.png")
+        assert corpus.resolve_wikilink("diagram.png") == "img/diagram.png"
+
+
+class TestValidationDaemon:
+    """Test incremental re-validation"""
+
+    @pytest.mark.unit
+    def test_initial_scan_is_clean(self, docs):
+        daemon = ValidationDaemon(docs, quiet=True)
+        event = daemon.start()
+
+        assert len(event["checked"]) == 4
+        assert event["total_issues"] == 0
+
+    @pytest.mark.unit
+    def test_edit_rechecks_page_and_linking_pages_only(self, docs):
+        daemon = ValidationDaemon(docs, quiet=True)
+        daemon.start()
+
+        (docs / "guide.md").write_text(FRONTMATTER + "\n[Broken](nowhere.md)\n")
+        event = daemon.handle_changes(["guide.md"])
+
+        assert event["checked"] == ["guide.md", "index.md"]
+        assert [issue["rule"] for issue in event["issues"]["guide.md"]] == ["broken-link"]
+
+    @pytest.mark.unit
+    def test_deleting_a_target_flags_its_backlinks(self, docs):
+        daemon = ValidationDaemon(docs, quiet=True)
+        daemon.start()
+
+        (docs / "reference" / "glossary.md").unlink()
+        event = daemon.handle_changes([], removed=["reference/glossary.md"])
+
+        assert event["checked"] == ["guide.md"]
+        assert event["issues"]["guide.md"][0]["rule"] == "broken-wikilink"
+
+        # Recreating it clears the issue again
+        (docs / "reference" / "glossary.md").write_text(FRONTMATTER)
+        event = daemon.handle_changes(["reference/glossary.md"])
+        assert "guide.md" in event["checked"]
+        assert event["total_issues"] == 0
+
+    @pytest.mark.unit
+    def test_anchor_links_use_the_heading_index(self, docs):
+        daemon = ValidationDaemon(docs, quiet=True)
+        daemon.start()
+
+        (docs / "index.md").write_text(FRONTMATTER + "\n[Term](reference/glossary.md#glossary) [Bad](guide.md#nope)\n")
+        event = daemon.handle_changes(["index.md"])
+
+        assert [issue["rule"] for issue in event["issues"]["index.md"]] == ["broken-anchor"]
+
+    @pytest.mark.unit
+    def test_json_output(self, docs, temp_dir):
+        output = temp_dir / "results.json"
+        daemon = ValidationDaemon(docs, json_file=output, quiet=True)
+        daemon.start()
+
+        data = json.loads(output.read_text())
+        assert data["last_event"]["total_issues"] == 0
+
+    @pytest.mark.unit
+    def test_polling_watcher_detects_changes(self, docs):
+        watcher = PollingWatcher(docs, interval=0)
+
+        (docs / "guide.md").write_text("changed")
+        os.utime(docs / "guide.md", (0, 0))
+        (docs / "unrelated.md").unlink()
+
+        changed, removed = watcher.collect()
+        assert changed == ["guide.md"]
+        assert removed == ["unrelated.md"]
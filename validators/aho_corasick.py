@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick multi-pattern matcher.
+All patterns are compiled into one automaton, so scanning a text costs one
+pass over its characters no matter how many patterns there are, instead of
+one regex search per pattern.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class AhoCorasick:
+    """Case-insensitive automaton over a set of (pattern, value) pairs"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # (pattern length, value) of every pattern ending at a node
+        self.output: List[List[Tuple[int, Any]]] = [[]]
+        self.patterns: Dict[str, Any] = {}
+
+        for pattern, value in patterns:
+            self._add(pattern.lower(), value)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _add(self, pattern: str, value: Any) -> None:
+        node = 0
+        for char in pattern:
+            following = self.goto[node].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[node][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = following
+        if pattern:
+            self.patterns[pattern] = value
+            self.output[node] = [(length, v) for length, v in self.output[node] if length != len(pattern)]
+            self.output[node].append((len(pattern), value))
+
+    def _build(self) -> None:
+        """Breadth-first failure links; outputs of suffix nodes are inherited"""
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, following in self.goto[node].items():
+                queue.append(following)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(char, 0)
+                self.fail[following] = target if target != following else 0
+                self.output[following] = self.output[following] + self.output[self.fail[following]]
+
+    def _lower(self, text: str) -> str:
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # A few characters lowercase to several; keep offsets aligned
+        return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Every (start, end, value) occurrence, overlapping ones included"""
+        goto, fail, output = self.goto, self.fail, self.output
+        node = 0
+        for index, char in enumerate(self._lower(text)):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in output[node]:
+                yield index + 1 - length, index + 1, value
+
+    def find_words(self, text: str) -> List[Tuple[int, int, Any]]:
+        """
+        Whole-word, non-overlapping occurrences, leftmost-longest first
+
+        Returns:
+            Sorted list of (start, end, value)
+        """
+        candidates = [
+            (start, end, value) for start, end, value in self.iter(text)
+            if (start == 0 or not _is_word(text[start - 1])) and (end == len(text) or not _is_word(text[end]))
+        ]
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+
+        matches = []
+        position = 0
+        for start, end, value in candidates:
+            if start >= position:
+                matches.append((start, end, value))
+                position = end
+        return matches
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Dependency graph of a site build, for partial rebuilds.
+Records a hash of every docs file, the pages each page links to or embeds,
+and the title and nav metadata other pages render for it, plus one hash of
+the global inputs (mkdocs.yml, overrides, hooks, plugin versions, the
+glossary). Diffing
+the graph of the last build against the current inputs gives the pages that
+must be re-rendered; everything else can be carried forward from site/.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+GRAPH_VERSION = '2'
+
+# Inputs shared by every page: a change to any of them is a full rebuild
+GLOBAL_INPUTS = ['mkdocs.yml', 'vendor-lock.json', 'overrides', 'hooks', 'validators']
+# Docs pages rendered into every page: the glossary terms and tooltips of hooks/glossary.py
+GLOBAL_DOCS = ['reference/glossary.md']
+GLOBAL_PACKAGES = [
+    'mkdocs',
+    'mkdocs-material',
+    'pub-obsidian',
+    'mkdocs-exclude',
+    'mkdocs-git-revision-date-localized-plugin',
+    'pymdown-extensions',
+]
+
+# Frontmatter keys rendered into other pages' nav, footer and backlinks
+NAV_META_KEYS = ('title', 'icon', 'subtitle', 'status')
+# Frontmatter kept for pages that are carried forward without being read
+PAGE_META_KEYS = NAV_META_KEYS + ('tags',)
+
+H1_PATTERN = re.compile(r'^#\s+(.+?)\s*#*\s*$', re.MULTILINE)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def global_hash(project_root: Path, packages: Iterable[str] = GLOBAL_PACKAGES,
+                docs_dir: Optional[Path] = None) -> str:
+    """
+    Hash of the templates, theme, hooks and configuration every page is built with
+
+    Args:
+        project_root: Directory of mkdocs.yml; GLOBAL_INPUTS are relative to it
+        packages: Distributions whose versions are part of the hash
+        docs_dir: Docs directory; GLOBAL_DOCS are relative to it
+    """
+    digest = hashlib.sha1(GRAPH_VERSION.encode())
+    inputs = [(project_root, name) for name in GLOBAL_INPUTS]
+    if docs_dir is not None:
+        inputs += [(docs_dir, name) for name in GLOBAL_DOCS]
+    for root, name in inputs:
+        path = root / name
+        paths = sorted(p for p in path.rglob('*') if p.is_file() and '__pycache__' not in p.parts) \
+            if path.is_dir() else [path]
+        for item in paths:
+            if item.is_file():
+                digest.update(item.relative_to(root).as_posix().encode())
+                digest.update(item.read_bytes())
+    for package in packages:
+        try:
+            version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            version = ''
+        digest.update(f'{package}=={version}'.encode())
+    return digest.hexdigest()
+
+
+def nav_signature(frontmatter: Optional[Dict], text: str) -> str:
+    """
+    What other pages show of a page: nav frontmatter and the first H1
+
+    Computed from the source, so a changed page can be compared with its
+    previous build before it is rendered.
+    """
+    meta = {key: (frontmatter or {}).get(key) for key in NAV_META_KEYS}
+    match = H1_PATTERN.search(text)
+    meta['h1'] = match.group(1) if match else None
+    return content_hash(json.dumps(meta, sort_keys=True, default=str).encode())
+
+
+@dataclass
+class BuildPlan:
+    """Pages and files to rebuild, or a full build with its reason"""
+
+    full: bool
+    reason: str
+    pages: Set[str] = field(default_factory=set)
+    files: Set[str] = field(default_factory=set)
+
+
+def plan_rebuild(previous: Optional[Dict], current: Dict) -> BuildPlan:
+    """
+    Diff the graph of the last build against the current inputs
+
+    Args:
+        previous: Saved graph of the last build, or None
+        current: Graph of the current inputs; 'pages' entries need 'hash',
+            'links', 'embeds' and 'signature', 'files' maps other docs files
+            to hashes
+
+    Returns:
+        Full build when the global inputs, the set of pages or a page's nav
+        signature changed; otherwise the changed pages, the pages linking to
+        them, the pages embedding them through any number of embeds, and the
+        pages whose backlinks they changed
+    """
+    if not previous or previous.get('version') != GRAPH_VERSION:
+        return BuildPlan(True, 'no previous build graph')
+    if previous.get('site_dir') != current.get('site_dir'):
+        return BuildPlan(True, 'site directory changed')
+    if previous.get('global') != current.get('global'):
+        return BuildPlan(True, 'templates, theme, hooks, glossary or mkdocs.yml changed')
+
+    old_pages, new_pages = previous['pages'], current['pages']
+    if set(old_pages) != set(new_pages):
+        return BuildPlan(True, 'pages added or removed')
+
+    changed = {path for path in new_pages if new_pages[path]['hash'] != old_pages[path]['hash']}
+    for path in sorted(changed):
+        if new_pages[path]['signature'] != old_pages[path]['signature']:
+            return BuildPlan(True, f'title or nav metadata of {path} changed')
+
+    pages = set(changed)
+    for path in changed:
+        # Backlinks of pages it stopped or started linking to
+        pages |= set(old_pages[path]['links']) ^ set(new_pages[path]['links'])
+    for path, page in new_pages.items():
+        # Links and embeds of a changed page
+        if changed.intersection(page['links']):
+            pages.add(path)
+
+    # An embedded page renders inside every page that embeds it, directly or not
+    embedded_by: Dict[str, Set[str]] = {}
+    for path, page in new_pages.items():
+        for target in page['embeds']:
+            embedded_by.setdefault(target, set()).add(path)
+    embedding, stack = set(changed), list(changed)
+    while stack:
+        for path in embedded_by.get(stack.pop(), set()) - embedding:
+            embedding.add(path)
+            stack.append(path)
+    pages |= embedding
+
+    old_files = previous.get('files', {})
+    files = {path for path, digest in current.get('files', {}).items() if old_files.get(path) != digest}
+    return BuildPlan(False, f'{len(changed)} changed page(s)', pages & set(new_pages), files)
+
+
+def load_graph(path: Path) -> Optional[Dict]:
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def merge_search_index(previous: Dict, current: Dict, order: List[str], rebuilt: Set[str]) -> Dict:
+    """
+    Search index with carried-forward entries for pages that were not rebuilt
+
+    Args:
+        previous: Search index of the last build
+        current: Search index of this build (rebuilt pages only)
+        order: Page URLs in build order
+        rebuilt: URLs of the pages rendered in this build
+
+    Returns:
+        Index with every page's entries, in build order
+    """
+    def by_page(index: Dict) -> Dict[str, List[Dict]]:
+        groups: Dict[str, List[Dict]] = {}
+        for entry in index.get('docs', []):
+            groups.setdefault(entry['location'].split('#', 1)[0], []).append(entry)
+        return groups
+
+    old, new = by_page(previous), by_page(current)
+    docs = []
+    for url in order:
+        docs.extend((new if url in rebuilt else old).get(url, []))
+    return {**current, 'docs': docs}
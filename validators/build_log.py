@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for MkDocs build logs.
+Categorizes log records as the build emits them, so failing builds can stop at
+the first critical warning and several consumers can share one build's log.
+"""
+
+import logging
+import re
+import subprocess
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+
+# Event categories, in the order reports list them
+CATEGORY_CRITICAL = 'critical'
+CATEGORY_NAV = 'nav'
+CATEGORY_LINK = 'link'
+CATEGORY_ABSOLUTE_LINK = 'absolute_link'
+CATEGORY_WARNING = 'warning'
+CATEGORY_INFO = 'info'
+
+CATEGORIES = (
+    CATEGORY_CRITICAL,
+    CATEGORY_NAV,
+    CATEGORY_LINK,
+    CATEGORY_ABSOLUTE_LINK,
+    CATEGORY_WARNING,
+    CATEGORY_INFO,
+)
+
+LOG_LINE_PATTERN = re.compile(r'^(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*-\s*(.+)$')
+
+NAV_PATTERN = re.compile(
+    r"A reference to '([^']+)' is included in the 'nav' configuration, which is not found"
+)
+LINK_PATTERN = re.compile(
+    r"Doc file '([^']+)' contains a link '([^']+)', but the target (?:'([^']+)' )?is not found"
+)
+SUGGESTION_PATTERN = re.compile(
+    r"Doc file '([^']+)' contains a link '([^']+)', but the target '([^']+)' is not found"
+    r".*Did you mean '([^']+)'\?"
+)
+ABSOLUTE_PATTERN = re.compile(
+    r"Doc file '([^']+)' contains an absolute link '([^']+)', it was left as is\."
+    r"(?:\s*Did you mean '([^']+)'\?)?"
+)
+
+
+def classify_warning(warning_text: str) -> Dict[str, str]:
+    """
+    Turn a WARNING message into a structured issue
+
+    Args:
+        warning_text: The warning text after "WARNING - "
+
+    Returns:
+        Dict with 'type', 'severity', 'message' and pattern-specific keys
+    """
+    match = NAV_PATTERN.match(warning_text)
+    if match:
+        return {
+            'type': 'nav_reference_not_found',
+            'severity': 'critical',
+            'file': match.group(1),
+            'message': warning_text
+        }
+
+    match = LINK_PATTERN.match(warning_text)
+    if match:
+        return {
+            'type': 'broken_link',
+            'severity': 'high',
+            'source_file': match.group(1),
+            'link': match.group(2),
+            'target': match.group(3) or match.group(2),
+            'message': warning_text
+        }
+
+    match = SUGGESTION_PATTERN.match(warning_text)
+    if match:
+        return {
+            'type': 'broken_link_with_suggestion',
+            'severity': 'high',
+            'source_file': match.group(1),
+            'link': match.group(2),
+            'target': match.group(3),
+            'suggestion': match.group(4),
+            'message': warning_text
+        }
+
+    return {
+        'type': 'generic',
+        'severity': 'medium',
+        'message': warning_text
+    }
+
+
+def classify_info(info_text: str) -> Optional[Dict[str, str]]:
+    """
+    Turn an INFO message into a structured issue, if it reports one
+
+    Args:
+        info_text: The info text after "INFO - "
+
+    Returns:
+        Dict with issue details, or None for purely informational messages
+    """
+    match = ABSOLUTE_PATTERN.match(info_text)
+    if match:
+        return {
+            'type': 'absolute_link',
+            'severity': 'medium',
+            'source_file': match.group(1),
+            'link': match.group(2),
+            'suggestion': match.group(3) if match.group(3) else None,
+            'message': info_text
+        }
+
+    return None
+
+
+@dataclass
+class BuildLogEvent:
+    """A single categorized record from the build log"""
+
+    level: str
+    category: str
+    message: str
+    issue: Optional[Dict[str, str]] = None
+
+    @property
+    def severity(self) -> str:
+        """Severity of the underlying issue ('low' for plain info records)"""
+        if self.issue:
+            return self.issue.get('severity', 'medium')
+        return 'low'
+
+    @property
+    def is_critical(self) -> bool:
+        return self.severity == 'critical'
+
+
+class CriticalBuildWarning(Exception):
+    """Raised by an aborting stream when the first critical record arrives"""
+
+    def __init__(self, event: BuildLogEvent):
+        super().__init__(event.message)
+        self.event = event
+
+
+@dataclass
+class BuildLogStream:
+    """
+    Incremental consumer of MkDocs log records
+
+    Feed it lines (subprocess output) or records (logging handler) while the
+    build runs. Every record becomes a BuildLogEvent which is stored and pushed
+    to all subscribers, so one build can serve several checks.
+    """
+
+    abort_on_critical: bool = False
+    events: List[BuildLogEvent] = field(default_factory=list)
+    _subscribers: List[Callable[[BuildLogEvent], None]] = field(default_factory=list, repr=False)
+
+    def subscribe(self, callback: Callable[[BuildLogEvent], None]) -> None:
+        """Register a callback that receives every event as it is parsed"""
+        self._subscribers.append(callback)
+
+    def feed_record(self, level: str, message: str) -> BuildLogEvent:
+        """
+        Categorize one log record
+
+        Args:
+            level: Log level name (INFO, WARNING, ERROR...)
+            message: Log message without the level prefix
+
+        Returns:
+            The emitted event
+
+        Raises:
+            CriticalBuildWarning: If abort_on_critical is set and the record is critical
+        """
+        message = message.strip()
+        issue = None
+
+        if level in ('ERROR', 'CRITICAL'):
+            category = CATEGORY_CRITICAL
+            issue = {'type': 'error', 'severity': 'critical', 'message': message}
+        elif level == 'WARNING':
+            issue = classify_warning(message)
+            category = {
+                'nav_reference_not_found': CATEGORY_NAV,
+                'broken_link': CATEGORY_LINK,
+                'broken_link_with_suggestion': CATEGORY_LINK,
+            }.get(issue['type'], CATEGORY_WARNING)
+        else:
+            issue = classify_info(message)
+            category = CATEGORY_ABSOLUTE_LINK if issue else CATEGORY_INFO
+
+        event = BuildLogEvent(level=level, category=category, message=message, issue=issue)
+        self.events.append(event)
+        for callback in self._subscribers:
+            callback(event)
+
+        if self.abort_on_critical and event.is_critical:
+            raise CriticalBuildWarning(event)
+
+        return event
+
+    def feed_line(self, line: str) -> Optional[BuildLogEvent]:
+        """
+        Categorize one line of CLI output
+
+        Lines that are not log records (continuation lines, blank lines) are ignored.
+        """
+        match = LOG_LINE_PATTERN.match(line.strip())
+        if not match:
+            return None
+        return self.feed_record(match.group(1), match.group(2))
+
+    def feed_lines(self, lines: Iterable[str]) -> Iterator[BuildLogEvent]:
+        """Categorize lines lazily, yielding events as they are produced"""
+        for line in lines:
+            event = self.feed_line(line)
+            if event is not None:
+                yield event
+
+    def feed_text(self, text: str) -> List[BuildLogEvent]:
+        """Categorize a complete captured log"""
+        return list(self.feed_lines(text.split('\n')))
+
+    def by_category(self, category: str) -> List[BuildLogEvent]:
+        return [event for event in self.events if event.category == category]
+
+    @property
+    def critical(self) -> List[BuildLogEvent]:
+        return [event for event in self.events if event.is_critical]
+
+    def parsed(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Summarize the stream in the shape returned by parse_mkdocs_output
+
+        Returns:
+            Dict with 'warnings', 'errors', 'info' keys
+        """
+        result = {'warnings': [], 'errors': [], 'info': []}
+        for event in self.events:
+            if event.level in ('ERROR', 'CRITICAL'):
+                result['errors'].append({'type': 'error', 'message': event.message})
+            elif event.level == 'WARNING':
+                result['warnings'].append(event.issue)
+            elif event.category == CATEGORY_ABSOLUTE_LINK:
+                result['info'].append(event.issue)
+        return result
+
+
+class BuildLogHandler(logging.Handler):
+    """
+    Logging handler that feeds an in-process MkDocs build into a BuildLogStream
+
+    With an aborting stream, CriticalBuildWarning propagates out of the logging
+    call, which stops the build at the point the critical record was emitted.
+    """
+
+    def __init__(self, stream: BuildLogStream, level: int = logging.INFO):
+        super().__init__(level)
+        self.stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.stream.feed_record(record.levelname, record.getMessage())
+
+
+@contextmanager
+def capture_build_log(stream: BuildLogStream, logger_name: str = 'mkdocs') -> Iterator[BuildLogStream]:
+    """Attach a BuildLogHandler to the MkDocs logger for the duration of the block"""
+    logger = logging.getLogger(logger_name)
+    handler = BuildLogHandler(stream)
+    logger.addHandler(handler)
+    try:
+        yield stream
+    finally:
+        logger.removeHandler(handler)
+
+
+@dataclass
+class StreamedBuild:
+    """Outcome of a subprocess build parsed through a BuildLogStream"""
+
+    success: bool
+    output: str
+    stream: BuildLogStream
+    aborted: bool = False
+    timed_out: bool = False
+
+
+def stream_build(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    stream: Optional[BuildLogStream] = None,
+    timeout: Optional[float] = None,
+) -> StreamedBuild:
+    """
+    Run a build command and categorize its output line by line as it arrives
+
+    Args:
+        cmd: Command to run, e.g. ["mkdocs", "build", "--strict"]
+        cwd: Working directory
+        stream: Stream to feed; pass one with abort_on_critical=True to kill
+            the build on the first critical record
+        timeout: Seconds before the build is killed
+
+    Returns:
+        StreamedBuild with the combined output and the populated stream
+    """
+    stream = stream if stream is not None else BuildLogStream()
+    output_lines = []
+    aborted = False
+
+    try:
+        process = subprocess.Popen(
+            cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    except OSError as e:
+        return StreamedBuild(success=False, output=str(e), stream=stream)
+
+    timer = threading.Timer(timeout, process.kill) if timeout else None
+    if timer:
+        timer.start()
+
+    try:
+        for line in process.stdout:
+            output_lines.append(line)
+            try:
+                stream.feed_line(line)
+            except CriticalBuildWarning:
+                aborted = True
+                process.kill()
+                break
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+        if timer:
+            timer.cancel()
+
+    timed_out = bool(timer) and not aborted and returncode < 0
+    return StreamedBuild(
+        success=returncode == 0 and not aborted,
+        output=''.join(output_lines),
+        stream=stream,
+        aborted=aborted,
+        timed_out=timed_out,
+    )
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+In-memory index of the documentation corpus.
+Holds per-page frontmatter, outgoing links and wikilinks plus the reverse link
+graph, and can be updated one page at a time so long-running tools only
+re-parse what changed.
+"""
+
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from validators.markdown_tokens import tokenize
+from validators.obsidian import build_index, index_key, resolve_wikilink
+from validators.path_index import link_candidates
+
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'ftp://', 'tel:', '//')
+# Bumped when PageRecord or parse_page() output changes
+CACHE_VERSION = '2'
+
+
+@dataclass
+class PageRecord:
+    """Parsed view of one markdown page"""
+
+    path: str
+    mtime: float = 0.0
+    frontmatter: Optional[Dict] = None
+    frontmatter_error: Optional[str] = None
+    links: List[Tuple[int, str]] = field(default_factory=list)
+    wikilinks: List[Tuple[int, str, Optional[str]]] = field(default_factory=list)
+    embeds: List[str] = field(default_factory=list)  # ![[target]] targets, also in wikilinks
+    anchors: Set[str] = field(default_factory=set)
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.path).stem.lower()
+
+
+def is_external(url: str) -> bool:
+    return url.startswith(EXTERNAL_PREFIXES)
+
+
+def parse_page(rel_path: str, text: str, mtime: float = 0.0) -> PageRecord:
+    """
+    Parse frontmatter, markdown links and wikilinks from page source
+
+    Links inside fenced code blocks and inline code are ignored.
+    """
+    page = tokenize(text)
+    return PageRecord(
+        path=rel_path,
+        mtime=mtime,
+        frontmatter=page.frontmatter,
+        frontmatter_error=page.frontmatter_error,
+        links=[(link.line, link.url) for link in page.links],
+        wikilinks=[(link.line, link.target, link.heading) for link in page.wikilinks],
+        embeds=[link.target for link in page.wikilinks if link.embed],
+        anchors=page.anchor_ids(),
+    )
+
+
+class DocsCorpus:
+    """
+    Link graph, frontmatter table and wikilink index for a docs directory
+
+    Link targets are tracked by their resolved candidate path even when the
+    target does not exist yet, so creating a missing page re-checks the pages
+    that were pointing at it.
+    """
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = Path(docs_dir)
+        self.pages: Dict[str, PageRecord] = {}
+        self.files: Set[str] = set()
+        # index_key -> files, pages and attachments alike, as wikilinks resolve
+        self.stems: Dict[str, Set[str]] = {}
+        # target key -> pages linking to it ("path:<rel>" or "stem:<name>")
+        self.backlinks: Dict[str, Set[str]] = {}
+
+    # -- loading ---------------------------------------------------------
+
+    def load(self, cache: Optional[Path] = None) -> 'DocsCorpus':
+        """
+        Scan the whole docs directory
+
+        Args:
+            cache: Pickle of the parsed records of a previous load; pages whose
+                mtime is unchanged are not re-read, and the file is rewritten
+                when anything changed. Pickle rather than JSON because
+                frontmatter holds dates.
+        """
+        cached = self._load_cache(cache) if cache else {}
+        for root, dirs, files in os.walk(self.docs_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                if name.startswith('.'):
+                    continue
+                rel_path = (Path(root) / name).relative_to(self.docs_dir).as_posix()
+                self.files.add(rel_path)
+                if name.endswith('.md'):
+                    record = cached.get(rel_path)
+                    if record is None or record.mtime != (Path(root) / name).stat().st_mtime:
+                        record = self._read(rel_path)
+                    self._index_page(record)
+        self.stems = build_index(self.files)
+        if cache and cached != self.pages:
+            self._save_cache(cache)
+        return self
+
+    def _load_cache(self, cache: Path) -> Dict[str, PageRecord]:
+        try:
+            with open(cache, 'rb') as f:
+                version, docs_dir, pages = pickle.load(f)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return {}
+        if version != CACHE_VERSION or docs_dir != os.path.abspath(self.docs_dir):
+            return {}
+        return pages
+
+    def _save_cache(self, cache: Path) -> None:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump((CACHE_VERSION, os.path.abspath(self.docs_dir), self.pages), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+
+    def add_page(self, rel_path: str, text: str, mtime: float = 0.0) -> PageRecord:
+        """
+        Index page source that is already in memory (e.g. an MkDocs File)
+
+        Args:
+            rel_path: Docs-relative path of the page
+            text: Markdown source
+            mtime: Modification time to record
+
+        Returns:
+            The indexed PageRecord
+        """
+        self.add_file(rel_path)
+        self._unindex_page(rel_path)
+        record = parse_page(rel_path, text, mtime)
+        self._index_page(record)
+        return record
+
+    def add_file(self, rel_path: str) -> None:
+        """Index a file wikilinks and links may point at, without parsing it"""
+        self.files.add(rel_path)
+        self.stems.setdefault(index_key(rel_path), set()).add(rel_path)
+
+    def _read(self, rel_path: str) -> PageRecord:
+        path = self.docs_dir / rel_path
+        text = path.read_text(encoding='utf-8', errors='replace')
+        return parse_page(rel_path, text, path.stat().st_mtime)
+
+    def _index_page(self, record: PageRecord) -> None:
+        self.pages[record.path] = record
+        for key in self._target_keys(record):
+            self.backlinks.setdefault(key, set()).add(record.path)
+
+    def _unindex_page(self, rel_path: str) -> Optional[PageRecord]:
+        record = self.pages.pop(rel_path, None)
+        if record is None:
+            return None
+        for key in self._target_keys(record):
+            sources = self.backlinks.get(key)
+            if sources:
+                sources.discard(rel_path)
+        return record
+
+    def _target_keys(self, record: PageRecord) -> Set[str]:
+        keys = set()
+        for _, url in record.links:
+            keys.update(f'path:{candidate}' for candidate in self.link_candidates(record.path, url))
+        for _, target, _ in record.wikilinks:
+            keys.add(f'stem:{index_key(target)}')
+        return keys
+
+    @staticmethod
+    def _page_keys(rel_path: str) -> Set[str]:
+        return {f'path:{rel_path}', f'stem:{index_key(rel_path)}'}
+
+    # -- incremental updates ---------------------------------------------
+
+    def update(self, rel_path: str) -> Set[str]:
+        """
+        Re-read one file after it was created or modified
+
+        Returns:
+            Pages whose validation may have changed: the page itself plus
+            every page linking to it
+        """
+        self.add_file(rel_path)
+        if not rel_path.endswith('.md'):
+            return self.dependents(rel_path)
+
+        self._unindex_page(rel_path)
+        self._index_page(self._read(rel_path))
+        return {rel_path} | self.dependents(rel_path)
+
+    def remove(self, rel_path: str) -> Set[str]:
+        """Drop a deleted file and return the pages that linked to it"""
+        self.files.discard(rel_path)
+        self.stems.get(index_key(rel_path), set()).discard(rel_path)
+        self._unindex_page(rel_path)
+        return self.dependents(rel_path)
+
+    def dependents(self, rel_path: str) -> Set[str]:
+        """Pages that link to rel_path by path or by wikilink stem"""
+        sources = set()
+        for key in self._page_keys(rel_path):
+            sources |= self.backlinks.get(key, set())
+        return sources & set(self.pages)
+
+    # -- resolution ------------------------------------------------------
+
+    def link_candidates(self, source: str, url: str) -> List[str]:
+        """
+        Docs-relative paths a markdown link may refer to, most specific first
+
+        The same candidates PathIndex resolves (validators/path_index.py);
+        empty for external, anchor-only and out-of-tree links.
+        """
+        if is_external(url) or url.startswith('#'):
+            return []
+        return link_candidates(url, source)
+
+    def resolve_link(self, source: str, url: str) -> Optional[str]:
+        """Resolve a markdown link to an existing docs file, or None"""
+        for candidate in self.link_candidates(source, url):
+            if candidate in self.files:
+                return candidate
+        return None
+
+    def has_anchor(self, source: str, url: str) -> bool:
+        """
+        Whether the #fragment of a link exists on its target page
+
+        Links without a fragment, to non-page files or to missing pages are
+        reported as valid here; broken targets are the link check's job.
+        """
+        if is_external(url) or '#' not in url:
+            return True
+        target, anchor = url.split('#', 1)
+        anchor = unquote(anchor)
+        page = self.pages.get(self.resolve_link(source, target) if target else source)
+        return not anchor or page is None or anchor in page.anchors
+
+    def link_issues(self, record: PageRecord) -> List[Dict]:
+        """Broken links, anchors and wikilinks of one page, as issue dicts"""
+        issues = []
+        for line, url in record.links:
+            if self.link_candidates(record.path, url) and self.resolve_link(record.path, url) is None:
+                issues.append({'rule': 'broken-link', 'line': line, 'message': f"Link target not found: {url}"})
+            elif not self.has_anchor(record.path, url):
+                issues.append({'rule': 'broken-anchor', 'line': line, 'message': f"Anchor not found: {url}"})
+
+        for line, target, _ in record.wikilinks:
+            if self.resolve_wikilink(target, record.path) is None:
+                issues.append({'rule': 'broken-wikilink', 'line': line, 'message': f"Wikilink target not found: [[{target}]]"})
+        return issues
+
+    def resolve_wikilink(self, target: str, source: Optional[str] = None) -> Optional[str]:
+        """Resolve a wikilink target by stem, as the site build does (validators/obsidian.py)"""
+        return resolve_wikilink(self.stems, target, source)
+
+    def backlink_map(self) -> Dict[str, List[str]]:
+        """
+        Resolved reverse-link map of the whole corpus
+
+        Every markdown link and wikilink is resolved once, so the cost is
+        proportional to the number of links rather than pages squared.
+
+        Returns:
+            Target path -> sorted docs-relative paths of the pages linking to
+            it, excluding self-links and links to non-page files
+        """
+        reverse: Dict[str, Set[str]] = {}
+        for record in self.pages.values():
+            targets = {self.resolve_link(record.path, url) for _, url in record.links}
+            targets |= {self.resolve_wikilink(target, record.path) for _, target, _ in record.wikilinks}
+            for target in targets:
+                if target in self.pages and target != record.path:
+                    reverse.setdefault(target, set()).add(record.path)
+        return {target: sorted(sources) for target, sources in sorted(reverse.items())}
+
+    def outgoing(self, source: str) -> List[str]:
+        """
+        Pages a page links to, most prominent first
+
+        Prominence is the number of links to a target, then how early the
+        first of them appears. Self-links and links to non-page files are
+        dropped.
+        """
+        record = self.pages.get(source)
+        if record is None:
+            return []
+        links = [(line, self.resolve_link(source, url)) for line, url in record.links]
+        links += [(line, self.resolve_wikilink(target, source)) for line, target, _ in record.wikilinks]
+
+        prominence: Dict[str, Tuple[int, int]] = {}
+        for line, target in links:
+            if target in self.pages and target != source:
+                count, first = prominence.get(target, (0, line))
+                prominence[target] = (count + 1, min(first, line))
+        return sorted(prominence, key=lambda target: (-prominence[target][0], prominence[target][1], target))
+
+    def embeds(self, source: str) -> List[str]:
+        """Pages a page transcludes with ![[target]], sorted"""
+        record = self.pages.get(source)
+        if record is None:
+            return []
+        targets = {self.resolve_wikilink(target, source) for target in record.embeds}
+        return sorted(target for target in targets if target in self.pages and target != source)
+
+    def iter_pages(self, paths: Optional[Iterable[str]] = None) -> Iterable[PageRecord]:
+        for rel_path in sorted(paths if paths is not None else self.pages):
+            if rel_path in self.pages:
+                yield self.pages[rel_path]
+
+
+# Corpus of the current MkDocs build and the Files it was built from; see build_corpus()
+_build: Dict[str, Any] = {}
+
+
+def build_corpus(files) -> DocsCorpus:
+    """
+    Corpus of the documentation pages of an MkDocs build
+
+    Parsed once per Files collection and shared by the hooks that need the
+    link graph (partial_build, backlinks, prefetch); a new build, or a
+    plugin replacing the collection, parses it again.
+
+    Args:
+        files: MkDocs Files
+    """
+    if _build.get('files') is not files:
+        corpus = DocsCorpus(Path('.'))
+        for file in files.documentation_pages():
+            corpus.add_page(file.src_uri, file.content_string)
+        for file in files:
+            corpus.add_file(file.src_uri)
+        _build.update(files=files, corpus=corpus)
+    return _build['corpus']
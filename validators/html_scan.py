@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Single-pass pattern scan of the rendered site.
+Each HTML file is memory-mapped and searched once with one combined
+regular expression covering every rule, so adding a rendered-output check
+costs no extra read and memory stays at one mapped page at a time.
+"""
+
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+
+class ScanRule(NamedTuple):
+    name: str
+    # Bytes regex; start it with a literal so the combined scan stays fast
+    pattern: bytes
+    description: str = ''
+
+
+class Hit(NamedTuple):
+    path: str  # relative to the scanned site
+    line: int
+    text: str
+
+
+# Longest hit text kept, so a runaway match doesn't fill a report
+MAX_HIT_TEXT = 200
+
+RENDERED_RULES = [
+    ScanRule('wikilink-syntax-in-href', rb'href="[^"]*\[[^"]*\]\([^"]*\)\{#[a-f0-9]+\}',
+             "Markdown link with an Obsidian hash left inside an href"),
+    ScanRule('wikilink-hash-in-href', rb'href="[^"]*#[a-f0-9]{32}',
+             "Obsidian block hash used as a URL anchor"),
+    ScanRule('raw-wikilink', rb'\[\[[^\]\n]*\]\]',
+             "Unconverted [[wikilink]]"),
+    ScanRule('pre-block', rb'<pre\b',
+             "Code block"),
+    ScanRule('highlighted-code', rb'class="(?:[^"]*\s)?(?:highlight|codehilite|language-[\w-]+)["\s]',
+             "Code with syntax highlighting classes"),
+]
+
+
+class HTMLScanner:
+    """Run a set of byte-pattern rules over HTML files in one pass each"""
+
+    def __init__(self, rules: Iterable[ScanRule] = RENDERED_RULES):
+        self.rules = list(rules)
+        self._patterns = [(rule.name, re.compile(rule.pattern)) for rule in self.rules]
+        # Zero-width, so hits of different rules may overlap or nest
+        self._combined = re.compile(
+            b'(?=' + b'|'.join(b'(?:' + rule.pattern + b')' for rule in self.rules) + b')'
+        )
+
+    def scan_file(self, path: Path, name: Optional[str] = None) -> Dict[str, List[Hit]]:
+        """Hits per rule name in one file; name is the path reported in hits"""
+        hits: Dict[str, List[Hit]] = {rule.name: [] for rule in self.rules}
+        name = name or str(path)
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return hits
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                line, counted = 1, 0
+                for found in self._combined.finditer(data):
+                    start = found.start()
+                    line += data[counted:start].count(b'\n')
+                    counted = start
+                    for rule_name, pattern in self._patterns:
+                        match = pattern.match(data, start)
+                        if match:
+                            text = match.group()[:MAX_HIT_TEXT].decode('utf-8', errors='replace')
+                            hits[rule_name].append(Hit(name, line, text))
+        return hits
+
+    def scan_site(self, site_dir: Union[str, Path], pattern: str = '*.html') -> Dict[str, List[Hit]]:
+        """Hits per rule name across every matching file under site_dir, in path order"""
+        site_dir = Path(site_dir)
+        hits: Dict[str, List[Hit]] = {rule.name: [] for rule in self.rules}
+        for path in sorted(site_dir.rglob(pattern)):
+            for rule_name, found in self.scan_file(path, path.relative_to(site_dir).as_posix()).items():
+                hits[rule_name].extend(found)
+        return hits
+
+
+def hits_by_path(hits: List[Hit]) -> Dict[str, List[Hit]]:
+    """Group one rule's hits by file"""
+    grouped: Dict[str, List[Hit]] = {}
+    for hit in hits:
+        grouped.setdefault(hit.path, []).append(hit)
+    return grouped
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+DRUIDS Markdown Linter
+Checks the DRUIDS-specific content rules (frontmatter, security classification,
+MkDocs block syntax, internal links) in a single pass over each file.
+
+Whole directories are linted over a process pool, and per-file results are
+cached by content hash so re-lints only touch files that changed.
+
+Usage: python -m validators.markdown_linter docs/ [--format text|json|sarif]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+
+# Bump when rule behaviour changes so cached results are discarded
+RULES_VERSION = "1"
+
+REQUIRED_FIELDS = ("title", "type", "security", "document_id")
+VALID_SECURITY_LEVELS = ("L0", "L1", "L2")
+DOCUMENT_ID_PATTERN = re.compile(r'^[A-Z]{3}-[A-Z]{2,5}-\d{4}-\d{3}-(L[0-2])$')
+
+# Vault directory → required security classification
+VAULT_SECURITY = {
+    "public": "L0",
+    "member": "L1",
+    "sensitive": "L2",
+}
+
+# Rule id → (severity, short description)
+RULES = {
+    "DRU001": ("error", "Document must start with YAML frontmatter"),
+    "DRU002": ("error", "Frontmatter is missing a required field"),
+    "DRU003": ("error", "Security classification must be L0, L1 or L2"),
+    "DRU004": ("error", "document_id must follow XXX-TYPE-YYYY-NNN-LN"),
+    "DRU005": ("error", "Security classification must match the vault"),
+    "DRU006": ("error", "document_id suffix must match the security classification"),
+    "DRU101": ("warning", "Admonition content must be indented with 4 spaces"),
+    "DRU102": ("warning", "Tab content must be indented with 4 spaces"),
+    "DRU103": ("warning", "Internal links must not use the .md extension"),
+    "DRU104": ("warning", "Code blocks must declare a language"),
+}
+
+# Block-level constructs, compiled into one alternation so each line is matched once
+LINE_SCANNER = re.compile(
+    r'^(?P<indent>[ \t]*)(?:'
+    r'(?P<fence>`{3,}|~{3,})\s*(?P<lang>[^\s`{]*)'
+    r'|(?P<admonition>(?:!!!|\?\?\?\+?)\s+[\w-]+)'
+    r'|(?P<tab>===\+?\s+"[^"]*")'
+    r')'
+)
+LINK_PATTERN = re.compile(r'(?<!!)\[[^\]]*\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+
+# Files linted inline below this count; the pool only pays off for larger batches
+POOL_THRESHOLD = 32
+
+CACHE_FILE = Path(".cache") / "druids" / "markdown-lint.json"
+
+
+@dataclass
+class LintIssue:
+    """A single rule violation"""
+
+    rule: str
+    line: int
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    def format(self) -> str:
+        return f"Line {self.line}: {self.message} [{self.rule}]"
+
+
+def _split_frontmatter(lines: List[str]) -> Tuple[Optional[str], int]:
+    """Return the raw frontmatter and the index of the first body line"""
+    if not lines or lines[0].strip() != "---":
+        return None, 0
+    for index in range(1, len(lines)):
+        if lines[index].strip() in ("---", "..."):
+            return "\n".join(lines[1:index]), index + 1
+    return None, 0
+
+
+def _check_frontmatter(raw: Optional[str], rel_path: str) -> List[LintIssue]:
+    """Validate DRUIDS frontmatter fields"""
+    if raw is None:
+        return [LintIssue("DRU001", 1, "Missing YAML frontmatter")]
+
+    try:
+        metadata = yaml.safe_load(raw) or {}
+    except yaml.YAMLError as e:
+        return [LintIssue("DRU001", 1, f"Invalid YAML frontmatter: {e}")]
+    if not isinstance(metadata, dict):
+        return [LintIssue("DRU001", 1, "Frontmatter must be a YAML mapping")]
+
+    issues = []
+    for field_name in REQUIRED_FIELDS:
+        if not metadata.get(field_name):
+            issues.append(LintIssue("DRU002", 1, f"Missing required frontmatter field: {field_name}"))
+
+    security = metadata.get("security")
+    if security and str(security) not in VALID_SECURITY_LEVELS:
+        issues.append(LintIssue(
+            "DRU003", 1,
+            f"Invalid security classification '{security}' (expected one of {', '.join(VALID_SECURITY_LEVELS)})"
+        ))
+
+    document_id = metadata.get("document_id")
+    if document_id:
+        match = DOCUMENT_ID_PATTERN.match(str(document_id))
+        if not match:
+            issues.append(LintIssue(
+                "DRU004", 1,
+                f"Invalid document_id format '{document_id}' (expected e.g. TST-GUIDE-2024-001-L0)"
+            ))
+        elif security and match.group(1) != str(security):
+            issues.append(LintIssue(
+                "DRU006", 1,
+                f"document_id suffix {match.group(1)} does not match security {security}"
+            ))
+
+    parts = Path(rel_path).parts
+    for index, part in enumerate(parts[:-1]):
+        if part == "vault" and index + 1 < len(parts) - 1:
+            required = VAULT_SECURITY.get(parts[index + 1])
+            if required and security and str(security) != required:
+                issues.append(LintIssue(
+                    "DRU005", 1,
+                    f"Security mismatch: {parts[index + 1]} vault documents are {required}, "
+                    f"found {security} ({required} required)"
+                ))
+            break
+
+    return issues
+
+
+def _is_internal_md_link(url: str) -> bool:
+    if url.startswith(("http://", "https://", "mailto:", "#", "//")):
+        return False
+    return url.split("#", 1)[0].split("?", 1)[0].endswith(".md")
+
+
+def _indent_issue(rule: str, opener_line: int) -> LintIssue:
+    kind = "Admonition" if rule == "DRU101" else "Tab"
+    return LintIssue(rule, opener_line, f"{kind} content should be indented with 4 spaces")
+
+
+def lint_source(text: str, rel_path: str) -> List[LintIssue]:
+    """
+    Lint one document in a single pass over its lines
+
+    Args:
+        text: Markdown source
+        rel_path: Path relative to the lint root (drives the vault rules)
+
+    Returns:
+        List of issues ordered by line
+    """
+    lines = text.splitlines()
+    raw_frontmatter, body_start = _split_frontmatter(lines)
+    issues = _check_frontmatter(raw_frontmatter, rel_path)
+
+    fence = None            # closing marker of the open code fence
+    pending = None          # (rule, opener line, required indent) awaiting indented content
+
+    for index in range(body_start, len(lines)):
+        line = lines[index]
+        line_no = index + 1
+
+        if fence is not None:
+            if line.strip().startswith(fence) and not line.strip().strip(fence[0]):
+                fence = None
+            continue
+
+        if pending is not None and line.strip():
+            rule, opener_line, required = pending
+            indent = len(line.expandtabs(4)) - len(line.expandtabs(4).lstrip())
+            if indent < required:
+                issues.append(_indent_issue(rule, opener_line))
+            pending = None
+
+        match = LINE_SCANNER.match(line)
+        if match:
+            indent = len(match.group("indent").expandtabs(4))
+            if match.group("fence"):
+                fence = match.group("fence")
+                if not match.group("lang"):
+                    issues.append(LintIssue("DRU104", line_no, "Code block without language specification"))
+                continue
+            if match.group("admonition"):
+                pending = ("DRU101", line_no, indent + 4)
+                continue
+            if match.group("tab"):
+                pending = ("DRU102", line_no, indent + 4)
+                continue
+
+        if "](" in line:
+            for link in LINK_PATTERN.finditer(line):
+                if _is_internal_md_link(link.group(1)):
+                    issues.append(LintIssue(
+                        "DRU103", line_no,
+                        f"Remove .md extension from internal link '{link.group(1)}'"
+                    ))
+
+    if pending is not None:
+        issues.append(_indent_issue(pending[0], pending[1]))
+
+    return sorted(issues, key=lambda issue: issue.line)
+
+
+def _lint_worker(job: Tuple[str, str]) -> Tuple[str, List[Dict]]:
+    """Process-pool entry point"""
+    rel_path, text = job
+    return rel_path, [asdict(issue) for issue in lint_source(text, rel_path)]
+
+
+class DRUIDSMarkdownLinter:
+    """Lint DRUIDS documentation files with caching and parallel directory runs"""
+
+    def __init__(self, root_dir: str, jobs: Optional[int] = None, use_cache: bool = True):
+        self.root_dir = Path(root_dir)
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.cache_path = self.root_dir / CACHE_FILE
+        self.cache_hits = 0
+        self._cache: Optional[Dict[str, Dict]] = None
+
+    def _relative(self, file_path: Path) -> str:
+        try:
+            return Path(file_path).resolve().relative_to(self.root_dir.resolve()).as_posix()
+        except ValueError:
+            return Path(file_path).resolve().as_posix()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self._cache is None:
+            self._cache = {}
+            if self.use_cache and self.cache_path.exists():
+                try:
+                    data = json.loads(self.cache_path.read_text())
+                    if data.get("rules_version") == RULES_VERSION:
+                        self._cache = data.get("files", {})
+                except (OSError, ValueError):
+                    pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        if not self.use_cache:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps({
+            "rules_version": RULES_VERSION,
+            "files": self._load_cache(),
+        }))
+
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def lint_issues(self, file_path: Path) -> List[LintIssue]:
+        """Lint a single file and return structured issues"""
+        text = Path(file_path).read_text(encoding="utf-8")
+        return lint_source(text, self._relative(file_path))
+
+    def lint_file(self, file_path: Path) -> Tuple[List[str], List[str]]:
+        """
+        Lint a single file
+
+        Returns:
+            Tuple of (errors, warnings) as formatted messages
+        """
+        return self._split(self.lint_issues(file_path))
+
+    @staticmethod
+    def _split(issues: List[LintIssue]) -> Tuple[List[str], List[str]]:
+        errors = [issue.format() for issue in issues if issue.severity == "error"]
+        warnings = [issue.format() for issue in issues if issue.severity == "warning"]
+        return errors, warnings
+
+    def lint_paths(self, files: List[Path]) -> Dict[str, List[LintIssue]]:
+        """
+        Lint many files, reusing cached results for unchanged content
+
+        Cache misses are linted over a process pool when there are enough of them.
+        """
+        cache = self._load_cache()
+        results: Dict[str, List[LintIssue]] = {}
+        jobs = []
+        hashes = {}
+        self.cache_hits = 0
+
+        for file_path in files:
+            rel_path = self._relative(file_path)
+            text = Path(file_path).read_text(encoding="utf-8")
+            digest = self._content_hash(text)
+            cached = cache.get(rel_path)
+            if cached and cached.get("hash") == digest:
+                results[rel_path] = [LintIssue(**issue) for issue in cached["issues"]]
+                self.cache_hits += 1
+            else:
+                hashes[rel_path] = digest
+                jobs.append((rel_path, text))
+
+        if len(jobs) >= POOL_THRESHOLD and self.jobs != 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                linted = list(pool.map(_lint_worker, jobs, chunksize=8))
+        else:
+            linted = [_lint_worker(job) for job in jobs]
+
+        for rel_path, issues in linted:
+            cache[rel_path] = {"hash": hashes[rel_path], "issues": issues}
+            results[rel_path] = [LintIssue(**issue) for issue in issues]
+
+        if jobs:
+            self._save_cache()
+
+        return dict(sorted(results.items()))
+
+    def lint_directory(self, directory: Path) -> Dict:
+        """
+        Lint every markdown file below a directory
+
+        Returns:
+            Dict with totals and per-file 'results'
+        """
+        directory = Path(directory)
+        files = sorted(
+            path for path in directory.rglob("*.md")
+            if not any(part.startswith(".") for part in path.relative_to(directory).parts)
+        )
+        linted = self.lint_paths(files)
+
+        results = {}
+        for rel_path, issues in linted.items():
+            errors, warnings = self._split(issues)
+            results[rel_path] = {"errors": errors, "warnings": warnings}
+
+        return {
+            "total_files": len(files),
+            "files_with_errors": sum(1 for r in results.values() if r["errors"]),
+            "files_with_warnings": sum(1 for r in results.values() if r["warnings"]),
+            "total_errors": sum(len(r["errors"]) for r in results.values()),
+            "total_warnings": sum(len(r["warnings"]) for r in results.values()),
+            "cache_hits": self.cache_hits,
+            "results": results,
+            "issues": linted,
+        }
+
+    def copy_config_files(self, target_dir: Path) -> None:
+        """Write markdownlint configs derived from config/.markdownlint-cli2.yaml"""
+        target_dir = Path(target_dir)
+        source = Path(__file__).parent.parent / "config" / ".markdownlint-cli2.yaml"
+        settings = yaml.safe_load(source.read_text()) if source.exists() else {}
+        ignores = settings.pop("ignores", [])
+        settings.pop("extends", None)
+
+        with open(target_dir / ".markdownlint.yml", "w") as f:
+            yaml.safe_dump(settings, f, sort_keys=True)
+        with open(target_dir / ".markdownlint-cli2.jsonc", "w") as f:
+            f.write("// Generated by validators/markdown_linter.py\n")
+            json.dump({"config": settings, "ignores": ignores}, f, indent=2)
+
+    def run_markdownlint_cli2(self, file_path: Path) -> Tuple[bool, str]:
+        """Run markdownlint-cli2 for the generic style rules"""
+        if shutil.which("markdownlint-cli2") is None:
+            return False, "markdownlint-cli2 not found"
+        result = subprocess.run(
+            ["markdownlint-cli2", str(file_path)],
+            capture_output=True,
+            text=True,
+            cwd=Path(file_path).parent
+        )
+        return result.returncode == 0, result.stdout + result.stderr
+
+
+def to_json(linted: Dict[str, List[LintIssue]]) -> str:
+    """Machine-readable report: one entry per file"""
+    return json.dumps({
+        "files": {
+            path: [dict(asdict(issue), severity=issue.severity) for issue in issues]
+            for path, issues in linted.items()
+        },
+        "summary": {
+            "files": len(linted),
+            "errors": sum(1 for issues in linted.values() for i in issues if i.severity == "error"),
+            "warnings": sum(1 for issues in linted.values() for i in issues if i.severity == "warning"),
+        },
+    }, indent=2)
+
+
+def to_sarif(linted: Dict[str, List[LintIssue]], base_uri: str = "") -> str:
+    """SARIF 2.1.0 report for code-scanning integrations"""
+    rule_ids = sorted(RULES)
+    results = []
+    for path, issues in linted.items():
+        for issue in issues:
+            results.append({
+                "ruleId": issue.rule,
+                "ruleIndex": rule_ids.index(issue.rule),
+                "level": issue.severity,
+                "message": {"text": issue.message},
+                "locations": [{
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": f"{base_uri}{path}"},
+                        "region": {"startLine": issue.line},
+                    }
+                }],
+            })
+
+    return json.dumps({
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "druids-markdown-linter",
+                    "version": RULES_VERSION,
+                    "rules": [
+                        {
+                            "id": rule_id,
+                            "shortDescription": {"text": RULES[rule_id][1]},
+                            "defaultConfiguration": {"level": RULES[rule_id][0]},
+                        }
+                        for rule_id in rule_ids
+                    ],
+                }
+            },
+            "results": results,
+        }],
+    }, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DRUIDS-specific markdown linter")
+    parser.add_argument("directory", type=Path, nargs="?", default=Path("docs"),
+                        help="Directory to lint (default: docs)")
+    parser.add_argument("--format", choices=["text", "json", "sarif"], default="text",
+                        help="Output format (default: text)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for cache misses (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the result cache")
+    parser.add_argument("--output", type=Path, help="Write the report to a file instead of stdout")
+    args = parser.parse_args()
+
+    # Paths are reported (and cached) relative to the working directory
+    linter = DRUIDSMarkdownLinter(".", jobs=args.jobs, use_cache=not args.no_cache)
+    report = linter.lint_directory(args.directory)
+
+    if args.format == "json":
+        output = to_json(report["issues"])
+    elif args.format == "sarif":
+        output = to_sarif(report["issues"])
+    else:
+        lines = []
+        for path, result in report["results"].items():
+            for message in result["errors"]:
+                lines.append(f"❌ {path}: {message}")
+            for message in result["warnings"]:
+                lines.append(f"⚠️  {path}: {message}")
+        lines.append(
+            f"\n📊 {report['total_files']} files, {report['total_errors']} errors, "
+            f"{report['total_warnings']} warnings ({report['cache_hits']} cached)"
+        )
+        output = "\n".join(lines)
+
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    sys.exit(1 if report["total_errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
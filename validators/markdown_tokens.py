@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Fence-, frontmatter- and admonition-aware markdown token stream.
+
+One linear pass over a page produces a compact array of structural tokens
+(headings, fences, links, wikilinks, callouts) that the structural checks
+share, instead of each check splitting the page into lines and matching
+`#` on its own. Lines inside code fences never produce tokens, so `# comment`
+lines in bash examples are not mistaken for headings.
+"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+# yaml and markdown are imported where they are used: loading a cached
+# corpus (validators/corpus.py) then never pays for them
+
+
+FENCE_OPEN_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})(.*)$')
+FENCE_CLOSE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})\s*$')
+HEADING_PATTERN = re.compile(r'^(#{1,6})(?:\s+(.*?))?(?:\s+#+)?\s*$')
+ADMONITION_PATTERN = re.compile(r'^(\s*)(!!!|\?\?\?\+?)\s*([\w-]+)(?:\s+"([^"]*)")?')
+TABBED_PATTERN = re.compile(r'^(\s*)===\+?\s+"')
+OBSIDIAN_CALLOUT_PATTERN = re.compile(r'^\s*>\s*\[!([\w-]+)\][+-]?\s*(.*)$')
+LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+WIKILINK_PATTERN = re.compile(r'(!?)\[\[([^\]|#]*)(?:#([^\]|]*))?(?:\|([^\]]*))?\]\]')
+INLINE_CODE_PATTERN = re.compile(r'(`+)(.+?)\1')
+ATTR_LIST_PATTERN = re.compile(r'\{:?\s*([^}]*)\}\s*$')
+ATTR_ID_PATTERN = re.compile(r'\{:?[^}]*?#([\w:.-]+)[^}]*\}')
+HTML_ID_PATTERN = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*["\']([^"\']+)["\']')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+EMOJI_PATTERN = re.compile(r':[a-z0-9_+-]+:')
+EMPHASIS_PATTERN = re.compile(r'\*+|~~|==|\^\^')
+
+
+class Heading(NamedTuple):
+    line: int
+    level: int
+    text: str
+    slug: str  # toc slug of the rendered text, or the explicit { #id }
+    explicit: bool = False
+
+
+class Fence(NamedTuple):
+    line: int
+    end: int
+    language: str
+
+
+class Link(NamedTuple):
+    line: int
+    text: str
+    url: str
+    image: bool
+
+
+class Wikilink(NamedTuple):
+    line: int
+    target: str
+    heading: Optional[str]
+    alias: Optional[str]
+    embed: bool
+
+
+class Callout(NamedTuple):
+    line: int
+    kind: str
+    title: str
+    syntax: str  # 'admonition' (!!! / ???) or 'obsidian' (> [!note])
+
+
+class Anchor(NamedTuple):
+    line: int
+    id: str
+    html: bool  # raw HTML id/name rather than an attr_list { #id }
+
+
+Token = Union[Heading, Fence, Link, Wikilink, Callout, Anchor]
+
+
+@dataclass
+class PageTokens:
+    """Token array of one page, in document order"""
+
+    frontmatter: Optional[Dict] = None
+    frontmatter_error: Optional[str] = None
+    body_start: int = 1
+    tokens: List[Token] = field(default_factory=list)
+
+    def of(self, kind: type) -> List[Token]:
+        return [token for token in self.tokens if type(token) is kind]
+
+    @property
+    def headings(self) -> List[Heading]:
+        return self.of(Heading)
+
+    @property
+    def fences(self) -> List[Fence]:
+        return self.of(Fence)
+
+    @property
+    def links(self) -> List[Link]:
+        return [token for token in self.of(Link) if not token.image]
+
+    @property
+    def images(self) -> List[Link]:
+        return [token for token in self.of(Link) if token.image]
+
+    @property
+    def wikilinks(self) -> List[Wikilink]:
+        return self.of(Wikilink)
+
+    @property
+    def callouts(self) -> List[Callout]:
+        return self.of(Callout)
+
+    def anchor_ids(self) -> Set[str]:
+        """
+        Anchor ids the rendered page will contain
+
+        Mirrors the toc extension: explicit attr_list ids are reserved first,
+        then each heading without one gets its slug made unique with
+        `_1`, `_2`... suffixes in document order. Raw HTML ids are added as-is.
+        """
+        from markdown.extensions.toc import unique
+
+        anchors = self.of(Anchor)
+        used = {anchor.id for anchor in anchors if not anchor.html}
+        for heading in self.headings:
+            if not heading.explicit:
+                unique(heading.slug, used)
+        return used | {anchor.id for anchor in anchors if anchor.html}
+
+
+def fence_language(info: str) -> str:
+    """Language of a fence info string: "python", "{ .python }" or "python title=x" """
+    info = info.strip()
+    if info.startswith('{'):
+        match = re.search(r'\.([\w+#-]+)', info)
+        return match.group(1) if match else ''
+    return info.split()[0].lstrip('.') if info else ''
+
+
+def heading_slug(text: str) -> Tuple[str, bool]:
+    """
+    Anchor id of a heading, as the toc extension assigns it
+
+    The slug is computed from the text the heading renders to: links and
+    wikilinks become their text, images, emoji, HTML tags and emphasis
+    markers disappear. A trailing attr_list `{ #id }` wins over the slug.
+
+    Returns:
+        Tuple of (id, True if the id is explicit)
+    """
+    from markdown.extensions.toc import slugify
+
+    attrs = ATTR_LIST_PATTERN.search(text)
+    if attrs:
+        explicit = re.search(r'#([\w:.-]+)', attrs.group(1))
+        if explicit:
+            return explicit.group(1), True
+        text = text[:attrs.start()]
+
+    text = LINK_PATTERN.sub(lambda m: '' if m.group(1) else m.group(2), text)
+    text = WIKILINK_PATTERN.sub(lambda m: '' if m.group(1) else (m.group(4) or m.group(2)), text)
+    text = INLINE_CODE_PATTERN.sub(lambda m: m.group(2), text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    text = EMOJI_PATTERN.sub('', text)
+    text = EMPHASIS_PATTERN.sub('', text)
+    return slugify(html.unescape(text), '-'), False
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(' \t'))
+
+
+def tokenize(text: str) -> PageTokens:
+    """
+    Tokenize page source in a single pass
+
+    Args:
+        text: Markdown source including frontmatter
+
+    Returns:
+        PageTokens with parsed frontmatter and 1-based line numbers of the
+        whole file
+    """
+    page = PageTokens()
+    tokens = page.tokens
+    lines = text.split('\n')
+    start = 0
+
+    if lines and lines[0].strip() == '---':
+        import yaml
+
+        for index in range(1, len(lines)):
+            if lines[index].strip() in ('---', '...'):
+                try:
+                    page.frontmatter = yaml.safe_load('\n'.join(lines[1:index])) or {}
+                except yaml.YAMLError as e:
+                    page.frontmatter_error = str(e).split('\n')[0]
+                start = index + 1
+                break
+    page.body_start = start + 1
+
+    fence = None  # (marker, opening line number, language)
+    containers: List[int] = []  # content indents of enclosing admonitions/tabs
+
+    for index in range(start, len(lines)):
+        line = lines[index]
+        number = index + 1
+
+        if fence is not None:
+            match = FENCE_CLOSE_PATTERN.match(line)
+            if match and match.group(1)[0] == fence[0][0] and len(match.group(1)) >= len(fence[0]):
+                tokens.append(Fence(fence[1], number, fence[2]))
+                fence = None
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        indent = _indent(line)
+        while containers and indent < containers[-1]:
+            containers.pop()
+        relative = indent - (containers[-1] if containers else 0)
+
+        if '`' in line or '~' in line:
+            match = FENCE_OPEN_PATTERN.match(line)
+            if match and not (match.group(2)[0] == '`' and '`' in match.group(3)):
+                fence = (match.group(2), number, fence_language(match.group(3)))
+                continue
+
+        first = stripped[0]
+        if first == '#' and relative <= 3:
+            match = HEADING_PATTERN.match(stripped)
+            if match:
+                heading = (match.group(2) or '').strip()
+                slug, explicit = heading_slug(heading)
+                tokens.append(Heading(number, len(match.group(1)), heading, slug, explicit))
+        elif first in '!?':
+            match = ADMONITION_PATTERN.match(line)
+            if match:
+                tokens.append(Callout(number, match.group(3).lower(), match.group(4) or '', 'admonition'))
+                containers.append(len(match.group(1)) + 4)
+        elif first == '=':
+            match = TABBED_PATTERN.match(line)
+            if match:
+                containers.append(len(match.group(1)) + 4)
+        elif first == '>' and '[!' in line:
+            match = OBSIDIAN_CALLOUT_PATTERN.match(line)
+            if match:
+                tokens.append(Callout(number, match.group(1).lower(), match.group(2).strip(), 'obsidian'))
+
+        if '{' in line and '#' in line:
+            tokens.extend(Anchor(number, match.group(1), False) for match in ATTR_ID_PATTERN.finditer(line))
+        if '<' in line and ('id' in line or 'name' in line):
+            tokens.extend(Anchor(number, match.group(1), True) for match in HTML_ID_PATTERN.finditer(line))
+
+        if '[' not in line:
+            continue
+        if '`' in line:
+            line = INLINE_CODE_PATTERN.sub(lambda m: ' ' * len(m.group(0)), line)
+        if '](' in line:
+            for match in LINK_PATTERN.finditer(line):
+                tokens.append(Link(number, match.group(2), match.group(3), bool(match.group(1))))
+        if '[[' in line:
+            for match in WIKILINK_PATTERN.finditer(line):
+                target = match.group(2).strip()
+                if target:
+                    tokens.append(Wikilink(number, target, match.group(3), match.group(4), bool(match.group(1))))
+
+    if fence is not None:
+        # An unclosed fence swallows the rest of the page
+        tokens.append(Fence(fence[1], len(lines), fence[2]))
+
+    return page
+
+
+def tokenize_file(path: Path) -> PageTokens:
+    return tokenize(Path(path).read_text(encoding='utf-8', errors='replace'))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Flattened index of the MkDocs nav.
+The nested nav from mkdocs.yml is walked once into an ordered array of
+entries with their breadcrumb of section titles, so nav checks become set
+operations against the docs file list: nav targets that don't exist, pages
+that exist but aren't listed, and pages listed more than once.
+"""
+
+from pathlib import PurePosixPath
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from pathspec.gitignore import GitIgnoreSpec
+
+
+# Always excluded by MkDocs, on top of exclude_docs
+DEFAULT_EXCLUDE = ['.*', '/templates/']
+PAGE_SUFFIXES = ('.md', '.markdown')
+
+
+class NavEntry(NamedTuple):
+    position: int
+    title: Optional[str]
+    target: str
+    breadcrumb: Tuple[str, ...]  # titles of the enclosing sections, outermost first
+
+    @property
+    def external(self) -> bool:
+        return '://' in self.target or self.target.startswith(('mailto:', '//'))
+
+
+def _spec(value: Any) -> Optional[GitIgnoreSpec]:
+    """exclude_docs/not_in_nav as loaded by MkDocs (a spec) or raw YAML (a string)"""
+    if value is None or isinstance(value, GitIgnoreSpec):
+        return value
+    return GitIgnoreSpec.from_lines(str(value).splitlines())
+
+
+class NavIndex:
+    """Ordered nav entries plus set queries against the docs files"""
+
+    def __init__(self, nav: Optional[List], exclude_docs: Any = None, not_in_nav: Any = None):
+        self.entries: List[NavEntry] = []
+        self.by_target: Dict[str, List[NavEntry]] = {}
+        self.exclude = GitIgnoreSpec.from_lines(DEFAULT_EXCLUDE)
+        self.exclude_docs = _spec(exclude_docs)
+        self.not_in_nav = _spec(not_in_nav)
+
+        # Iterative pre-order walk: (item, breadcrumb) in document order
+        stack = [(item, ()) for item in reversed(nav or [])]
+        while stack:
+            item, breadcrumb = stack.pop()
+            if isinstance(item, dict):
+                for title, value in reversed(list(item.items())):
+                    if isinstance(value, list):
+                        stack.extend((child, breadcrumb + (title,)) for child in reversed(value))
+                    else:
+                        stack.append(((title, value), breadcrumb))
+            elif isinstance(item, tuple):
+                self._add(item[0], item[1], breadcrumb)
+            elif isinstance(item, str):
+                self._add(None, item, breadcrumb)
+
+    @classmethod
+    def from_config(cls, config: Mapping) -> 'NavIndex':
+        """Build from a loaded MkDocs config or the raw mkdocs.yml mapping"""
+        return cls(config.get('nav'), config.get('exclude_docs'), config.get('not_in_nav'))
+
+    def _add(self, title: Optional[str], target: str, breadcrumb: Tuple[str, ...]) -> None:
+        target = str(target)
+        if not ('://' in target or target.startswith(('mailto:', '//'))):
+            target = PurePosixPath(target.lstrip('/')).as_posix()
+        entry = NavEntry(len(self.entries), title, target, breadcrumb)
+        self.entries.append(entry)
+        self.by_target.setdefault(target, []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    @property
+    def targets(self) -> Set[str]:
+        """Docs-relative paths listed in the nav"""
+        return {target for target, entries in self.by_target.items() if not entries[0].external}
+
+    def is_excluded(self, rel_path: str) -> bool:
+        if self.exclude.match_file(rel_path):
+            return True
+        return self.exclude_docs is not None and self.exclude_docs.match_file(rel_path)
+
+    def missing(self, files: Iterable[str]) -> List[NavEntry]:
+        """Nav entries whose target is not among the docs files"""
+        files = files if isinstance(files, (set, frozenset)) else set(files)
+        return [entry for entry in self.entries if not entry.external and entry.target not in files]
+
+    def unlisted(self, files: Iterable[str]) -> List[str]:
+        """
+        Pages that exist but are not in the nav
+
+        Files excluded from the build and pages matched by not_in_nav are
+        not reported.
+        """
+        pages = {path for path in files if path.endswith(PAGE_SUFFIXES)} - self.targets
+        return sorted(
+            path for path in pages
+            if not self.is_excluded(path)
+            and not (self.not_in_nav is not None and self.not_in_nav.match_file(path))
+        )
+
+    def duplicates(self) -> Dict[str, List[NavEntry]]:
+        """Targets listed more than once, with every entry listing them"""
+        return {target: entries for target, entries in self.by_target.items() if len(entries) > 1}
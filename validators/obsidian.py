@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+One-pass Obsidian syntax engine.
+A single regex alternation walks each page left to right and rewrites the
+Obsidian-only syntax into Markdown the configured extensions understand:
+[[target]], [[target|alias]] and [[target#heading]] become relative links
+(so MkDocs validates and converts them like any other link), ![[page]] and
+![[page#heading]] transclude the page or section, ![[image.png|300]]
+becomes a sized image, > [!type] callouts become admonitions and
+%% comments %% are dropped. Code fences, indented code blocks, inline code
+and HTML comments are tokens of their own and pass through untouched. Targets resolve by stem,
+like Obsidian, against an index built once per build, and each resolution
+is cached.
+"""
+
+import posixpath
+import re
+from pathlib import PurePosixPath
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import quote
+
+from validators.markdown_tokens import PageTokens, heading_slug, tokenize
+
+TOKEN_PATTERN = re.compile(
+    # Indented lines after a blank line: code, or the body of a list item or admonition
+    r'(?P<indented>(?:\A|(?<=\n\n))(?: {4}|\t)[^\n]*(?:\n(?:[ \t]*\n)*(?: {4}|\t)[^\n]*)*)'
+    r'|(?P<fence>^[ \t]*(?P<mark>`{3,}|~{3,})[^\n]*(?s:.*?)(?:\n[ \t]*(?P=mark)[`~]*[ \t]*$|\Z))'
+    r'|(?P<code>(?P<ticks>`+)(?:[^`\n]|\n(?!\n))+?(?P=ticks))'
+    r'|(?P<html_comment><!--(?s:.*?)-->)'
+    r'|(?P<comment>%%(?s:.*?)%%)'
+    r'|(?P<callout>^[ \t]*>[ \t]?\[!(?P<kind>[^\]\n]+)\](?P<fold>[-+]?)[ \t]*(?P<title>[^\n]*)(?:\n[ \t]*>[^\n]*)*)'
+    # [text]([[target]]): the Markdown text wins, the wikilink gives the target
+    r'|(?P<mixed>\[(?P<mixed_text>[^\]\n]*)\]\(\[\[(?P<mixed_link>[^\]\n]+)\]\]\))'
+    r'|(?P<embed>!\[\[(?P<embed_link>[^\]\n]+)\]\])'
+    r'|(?P<wikilink>\[\[(?P<link>[^\]\n]+)\]\])'
+    # Relative Markdown links and images, rebased when a page is embedded elsewhere
+    r'|(?P<mdlink>!?\[[^\]\n]*\]\((?P<url>[^)\s]+))',
+    re.MULTILINE,
+)
+QUOTE_PREFIX = re.compile(r'^[ \t]*> ?')
+INDENT_PREFIX = re.compile(r'^(?: {4}|\t)', re.MULTILINE)
+# Lines of a block whose indented continuation is its body rather than code:
+# list items, admonitions, content tabs, footnotes, definitions, nested content
+CONTAINER_LINE = re.compile(
+    r'^(?:[ \t]+\S|[ \t]*(?:[-*+]|\d+[.)])[ \t]|(?:!!!|\?\?\?\+?|===[!+]?)[ \t]|\[\^[^\]\n]+\]:|:[ \t])',
+    re.MULTILINE,
+)
+EXTERNAL_URL = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//|#|/)', re.IGNORECASE)
+
+IMAGE_SUFFIXES = {'.avif', '.bmp', '.gif', '.jpeg', '.jpg', '.png', '.svg', '.webp'}
+
+# Obsidian callout types and aliases -> Material admonition types
+CALLOUT_TYPES = {
+    'abstract': 'abstract', 'summary': 'abstract', 'tldr': 'abstract',
+    'info': 'info', 'todo': 'info',
+    'tip': 'tip', 'hint': 'tip', 'important': 'tip',
+    'success': 'success', 'check': 'success', 'done': 'success',
+    'question': 'question', 'help': 'question', 'faq': 'question',
+    'warning': 'warning', 'caution': 'warning', 'attention': 'warning',
+    'failure': 'failure', 'fail': 'failure', 'missing': 'failure',
+    'danger': 'danger', 'error': 'danger',
+    'bug': 'bug',
+    'example': 'example',
+    'quote': 'quote', 'cite': 'quote',
+    'note': 'note',
+}
+FOLD_MARKERS = {'': '!!!', '-': '???', '+': '???+'}
+
+
+class Converted(NamedTuple):
+    markdown: str
+    problems: List[str]  # unresolved targets and embed cycles, as warning messages
+
+
+def index_key(name: str) -> str:
+    """Key a file is found by: the stem of pages, the full name of other files"""
+    name = PurePosixPath(name).name.lower()
+    return name[:-3] if name.endswith('.md') else name
+
+
+def build_index(paths: Iterable[str]) -> Dict[str, Set[str]]:
+    """Docs-relative paths grouped by index_key"""
+    index: Dict[str, Set[str]] = {}
+    for path in paths:
+        index.setdefault(index_key(path), set()).add(path)
+    return index
+
+
+def resolve_wikilink(index: Dict[str, Set[str]], target: str, source: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve a wikilink target against a stem index
+
+    Targets starting with ./ or ../ are relative to the source page. Any
+    other target is looked up by its last segment, and its folders, if
+    given, must match the end of the path; ties go to the first path in
+    sorted order.
+
+    Returns:
+        Docs-relative path, or None if nothing matches
+    """
+    target = target.strip()
+    if target.startswith(('./', '../')):
+        if source is None:
+            return None
+        joined = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        for candidate in (joined, f'{joined}.md'):
+            if candidate in index.get(index_key(candidate), ()):
+                return candidate
+        return None
+
+    target = target.strip('/').lower()
+    matches = index.get(index_key(target))
+    if not matches:
+        return None
+    if '/' not in target:
+        return min(matches)
+    for match in sorted(matches):
+        path = match.lower()
+        if path.endswith('.md') and not target.endswith('.md'):
+            path = path[:-3]
+        if path == target or path.endswith(f'/{target}'):
+            return match
+    return None
+
+
+def split_wikilink(inner: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """target#heading|alias -> (target, heading, alias); `\\|` inside tables separates too"""
+    link, separator, alias = inner.replace('\\|', '|').partition('|')
+    target, has_heading, heading = link.partition('#')
+    return target.strip(), heading.strip() if has_heading else None, alias.strip() if separator else None
+
+
+def link_text(target: str, heading: Optional[str]) -> str:
+    """What Obsidian shows for a wikilink without an alias"""
+    if heading and target:
+        return f'{target} > {heading.lstrip("^")}'
+    return heading.lstrip('^') if heading else target
+
+
+def anchor(heading: Optional[str]) -> str:
+    """Fragment of a heading link; block references (#^id) link the page"""
+    if not heading or heading.startswith('^'):
+        return ''
+    return f'#{heading_slug(heading)[0]}'
+
+
+def _indent(text: str, prefix: str) -> str:
+    return '\n'.join(f'{prefix}{line}' if line.strip() else '' for line in text.split('\n'))
+
+
+class ObsidianEngine:
+    """
+    Obsidian syntax converter for one build
+
+    Args:
+        paths: Docs-relative paths of every file a wikilink may point at
+        read: Returns the Markdown source (with frontmatter) of a page, for embeds
+    """
+
+    def __init__(self, paths: Iterable[str], read: Callable[[str], str]):
+        self.index = build_index(paths)
+        self.read = read
+        # (target, source dir for relative targets) -> resolved path
+        self._resolved: Dict[Tuple[str, str], Optional[str]] = {}
+        # path -> (source lines, tokens) of embedded pages
+        self._pages: Dict[str, Tuple[List[str], PageTokens]] = {}
+
+    def resolve(self, target: str, source: str) -> Optional[str]:
+        key = (target, posixpath.dirname(source) if target.startswith(('./', '../')) else '')
+        if key not in self._resolved:
+            self._resolved[key] = resolve_wikilink(self.index, target, source)
+        return self._resolved[key]
+
+    def convert(self, markdown: str, source: str) -> Converted:
+        """
+        Rewrite the Obsidian syntax of a page
+
+        Args:
+            markdown: Page body, without frontmatter
+            source: Docs-relative path of the page
+        """
+        problems: List[str] = []
+        if '[[' not in markdown and '[!' not in markdown and '%%' not in markdown:
+            return Converted(markdown, problems)
+        return Converted(self._convert(markdown, source, source, [source], problems), problems)
+
+    def _convert(self, markdown: str, source: str, base: str, stack: List[str], problems: List[str]) -> str:
+        """
+        Args:
+            source: Page the text was written in; relative targets and links start there
+            base: Page being rendered; output links are relative to it
+            stack: Pages being embedded, outermost first
+        """
+        def replace(match: re.Match) -> str:
+            kind = match.lastgroup
+            if kind == 'indented':
+                return self._indented(match, source, base, stack, problems)
+            if kind == 'comment':
+                return ''
+            if kind == 'callout':
+                return self._callout(match, source, base, stack, problems)
+            if kind == 'mixed':
+                return self._link(match['mixed_link'], source, base, problems, match['mixed_text'])
+            if kind == 'wikilink':
+                return self._link(match['link'], source, base, problems)
+            if kind == 'embed':
+                return self._embed(match, source, base, stack, problems)
+            if kind == 'mdlink' and source != base and not EXTERNAL_URL.match(match['url']):
+                rebased = posixpath.relpath(
+                    posixpath.normpath(posixpath.join(posixpath.dirname(source), match['url'])),
+                    posixpath.dirname(base) or '.',
+                )
+                return match.group(0)[:match.start('url') - match.start()] + rebased
+            return match.group(0)
+
+        return TOKEN_PATTERN.sub(replace, markdown)
+
+    def _url(self, path: str, base: str) -> str:
+        return quote(posixpath.relpath(path, posixpath.dirname(base) or '.'))
+
+    def _link(self, inner: str, source: str, base: str, problems: List[str], text: Optional[str] = None) -> str:
+        target, heading, alias = split_wikilink(inner)
+        text = text or alias or link_text(target, heading)
+        if not target:
+            return f'[{text}]({anchor(heading)})' if anchor(heading) else text
+        path = self.resolve(target, source)
+        if path is None:
+            problems.append(
+                f"Doc file '{source}' contains a wikilink [[{inner}]], but the target "
+                f"'{target}' is not found among documentation files."
+            )
+            return text
+        return f'[{text}]({self._url(path, base)}{anchor(heading)})'
+
+    def _embed(self, match: re.Match, source: str, base: str, stack: List[str], problems: List[str]) -> str:
+        inner = match['embed_link']
+        target, heading, alias = split_wikilink(inner)
+        path = self.resolve(target, source)
+        if path is None:
+            problems.append(
+                f"Doc file '{source}' embeds ![[{inner}]], but the target "
+                f"'{target}' is not found among documentation files."
+            )
+            return alias or link_text(target, heading)
+        url = self._url(path, base)
+        name = PurePosixPath(path).name
+
+        if not path.endswith('.md'):
+            if PurePosixPath(path).suffix.lower() not in IMAGE_SUFFIXES:
+                return f'[{alias or name}]({url})'
+            size = re.fullmatch(r'(\d+)(?:x(\d+))?', alias or '')
+            if size is None:
+                return f'![{alias or name}]({url})'
+            attributes = f'width="{size[1]}"' + (f' height="{size[2]}"' if size[2] else '')
+            return f'![{name}]({url}){{ {attributes} }}'
+
+        text = alias or link_text(target, heading)
+        line_start = match.string.rfind('\n', 0, match.start()) + 1
+        line_end = match.string.find('\n', match.end())
+        before = match.string[line_start:match.start()]
+        after = match.string[match.end():line_end if line_end != -1 else len(match.string)]
+        if before.strip() or after.strip():
+            # Transclusion needs a block of its own; inline embeds stay links
+            return f'[{text}]({url}{anchor(heading)})'
+        if path in stack:
+            problems.append(
+                f"Doc file '{source}' embeds ![[{inner}]] in a cycle "
+                f"({' -> '.join(stack + [path])}); it is linked instead."
+            )
+            return f'[{text}]({url}{anchor(heading)})'
+
+        body = self._section(path, heading)
+        if body is None:
+            problems.append(f"Doc file '{source}' embeds ![[{inner}]], but '{path}' has no heading '{heading}'.")
+            return f'[{text}]({url})'
+        content = self._convert(body, path, base, stack + [path], problems)
+        return _indent(f'<div class="druids-embed" markdown>\n\n{content.strip()}\n\n</div>', before).lstrip(' \t')
+
+    def _section(self, path: str, heading: Optional[str]) -> Optional[str]:
+        """Body of a page without frontmatter, or the section under one of its headings"""
+        if path not in self._pages:
+            text = self.read(path)
+            self._pages[path] = (text.split('\n'), tokenize(text))
+        lines, tokens = self._pages[path]
+        if not heading or heading.startswith('^'):
+            return '\n'.join(lines[tokens.body_start - 1:])
+
+        slug = heading_slug(heading)[0]
+        headings = tokens.headings
+        for position, found in enumerate(headings):
+            if found.slug == slug:
+                end = next((h.line - 1 for h in headings[position + 1:] if h.level <= found.level), len(lines))
+                return '\n'.join(lines[found.line - 1:end])
+        return None
+
+    def _indented(self, match: re.Match, source: str, base: str, stack: List[str], problems: List[str]) -> str:
+        block = match['indented']
+        previous = match.string[:match.start()].rstrip().rsplit('\n\n', 1)[-1]
+        if not CONTAINER_LINE.search(previous):
+            return block  # Indented code block
+        body = INDENT_PREFIX.sub('', block)
+        converted = self._convert(body, source, base, stack, problems)
+        return block if converted == body else _indent(converted, '    ')
+
+    def _callout(self, match: re.Match, source: str, base: str, stack: List[str], problems: List[str]) -> str:
+        lines = match['callout'].split('\n')
+        indent = lines[0][:len(lines[0]) - len(lines[0].lstrip(' \t'))]
+        kind = match['kind'].split('|', 1)[0].strip().lower()
+        kind = CALLOUT_TYPES.get(kind, re.sub(r'[^\w-]', '-', kind))
+        title = match['title'].strip()
+        if title:
+            title = ' "' + self._convert(title, source, base, stack, problems) + '"'
+        header = f'{indent}{FOLD_MARKERS[match["fold"]]} {kind}{title}'
+
+        body = '\n'.join(QUOTE_PREFIX.sub('', line, count=1) for line in lines[1:])
+        if not body.strip():
+            return header
+        return f'{header}\n{_indent(self._convert(body, source, base, stack, problems), indent + "    ")}'
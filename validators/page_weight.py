@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Per-page download weight of the built site.
+Every HTML page is resolved to the stylesheets, scripts, fonts and images
+it loads. Each asset is sized once (raw, gzip and, when the brotli module
+is installed, brotli) in a cache shared by all pages and persisted between
+runs. Totals are split into everything the page downloads and what
+blocks first render: the document, its stylesheets, the fonts they use
+and synchronous head scripts. Budgets are set per top-level section in
+config/page-budgets.yml; a page that loads a script from another origin
+can't be measured and fails its budget.
+"""
+
+import gzip
+import html as html_entities
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from validators.resource_hints import ResourceHints, page_dir, resolve
+
+SIZE_CACHE_VERSION = '1'
+# Entries kept in the history file
+HISTORY_LIMIT = 100
+# A page regresses when its gzip total grows by more than both of these
+REGRESSION_BYTES = 5 * 1024
+REGRESSION_RATIO = 0.05
+
+STYLESHEET = re.compile(r'<link\b[^>]*\brel="stylesheet"[^>]*>')
+SCRIPT = re.compile(r'<script\b[^>]*\bsrc="[^"]+"[^>]*>')
+IMAGE = re.compile(r'<(?:img|source)\b[^>]*\bsrc="[^"]+"[^>]*>|<link\b[^>]*\brel="icon"[^>]*>')
+PRELOAD = re.compile(r'<link\b[^>]*\brel="preload"[^>]*>')
+ATTRIBUTE = re.compile(r'([\w-]+)(?:="([^"]*)")?')
+
+
+class Size(NamedTuple):
+    raw: int
+    gzip: int
+    brotli: Optional[int]  # None without the brotli module
+
+    def __add__(self, other: 'Size') -> 'Size':
+        brotli = None if self.brotli is None or other.brotli is None else self.brotli + other.brotli
+        return Size(self.raw + other.raw, self.gzip + other.gzip, brotli)
+
+
+ZERO = Size(0, 0, 0)
+
+
+def measure(data: bytes) -> Size:
+    """Transfer sizes; gzip at level 6, what most servers use on the fly"""
+    try:
+        import brotli
+    except ImportError:
+        compressed = None
+    else:
+        compressed = len(brotli.compress(data))
+    return Size(len(data), len(gzip.compress(data, compresslevel=6, mtime=0)), compressed)
+
+
+class SizeCache:
+    """Asset sizes keyed by site path, reused while the file's size and mtime match"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: Dict[str, Tuple[int, int, Size]] = {}
+        if path is not None:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == SIZE_CACHE_VERSION:
+                    self.entries = {key: (stat[0], stat[1], Size(*size)) for key, (stat, size) in data['entries'].items()}
+            except (OSError, ValueError, KeyError, TypeError):
+                self.entries = {}
+
+    def size(self, file_path: Path, key: str) -> Size:
+        stat = file_path.stat()
+        cached = self.entries.get(key)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        size = measure(file_path.read_bytes())
+        self.entries[key] = (stat.st_size, stat.st_mtime_ns, size)
+        return size
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        entries = {key: [[size, mtime], list(value)] for key, (size, mtime, value) in self.entries.items()}
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': SIZE_CACHE_VERSION, 'entries': entries}, f)
+        os.replace(tmp, self.path)
+
+
+class Asset(NamedTuple):
+    path: str  # site-relative
+    kind: str  # document, stylesheet, script, font or image
+    blocking: bool
+
+
+@dataclass
+class PageWeight:
+    page: str  # site-relative path of the HTML file
+    section: str
+    assets: List[Asset] = field(default_factory=list)
+    total: Size = ZERO
+    blocking: Size = ZERO
+    external: List[str] = field(default_factory=list)  # URLs on other origins, not measured
+    external_scripts: List[str] = field(default_factory=list)  # the scripts among them, a budget violation
+    missing: List[str] = field(default_factory=list)  # local references with no file
+
+
+def attributes(tag: str) -> Dict[str, str]:
+    return {
+        name.lower(): html_entities.unescape(value or '')
+        for name, value in ATTRIBUTE.findall(tag[1:].split(None, 1)[-1])
+    }
+
+
+def section_of(page: str) -> str:
+    """Top-level directory of a page, 'home' for the pages at the site root"""
+    return page.split('/', 1)[0] if '/' in page else 'home'
+
+
+def page_url(page: str) -> str:
+    return page[:-len('index.html')] if page == 'index.html' or page.endswith('/index.html') else page
+
+
+def find_assets(html: str, url: str, hints: ResourceHints) -> List[Tuple[str, str, bool]]:
+    """(reference, kind, render-blocking) of everything a page loads, in document order per kind"""
+    head = html.split('</head>', 1)[0]
+    found = []
+    for tag in STYLESHEET.findall(html):
+        attrs = attributes(tag)
+        if attrs.get('href', '').endswith('.css'):
+            found.append((attrs['href'], 'stylesheet', attrs.get('media', 'all') != 'print'))
+    for tag in SCRIPT.findall(html):
+        attrs = attributes(tag)
+        deferred = 'async' in attrs or 'defer' in attrs or attrs.get('type') == 'module'
+        found.append((attrs['src'], 'script', tag in head and not deferred))
+    for tag in IMAGE.findall(html):
+        attrs = attributes(tag)
+        found.append((attrs.get('src') or attrs.get('href', ''), 'image', False))
+    for tag in PRELOAD.findall(html):
+        attrs = attributes(tag)
+        kind = {'style': 'stylesheet', 'script': 'script', 'font': 'font', 'image': 'image'}.get(attrs.get('as'))
+        if kind:
+            found.append((attrs.get('href', ''), kind, kind in ('stylesheet', 'font')))
+    base_dir = page_dir(url)
+    for face in hints.fonts(html, url):
+        # Fonts are needed for first paint of text in their family
+        found.append((os.path.relpath(face.path, base_dir or '.').replace(os.sep, '/'), 'font', True))
+    return found
+
+
+def weigh_page(site_dir: Path, page: str, cache: SizeCache, hints: ResourceHints, base_path: str = '/') -> PageWeight:
+    """
+    Resolve and size one page's assets; assets referenced twice count once
+
+    Args:
+        base_path: Path of site_url, which root-relative references (as in
+            404.html) start with
+    """
+    weight = PageWeight(page, section_of(page))
+    html = (site_dir / page).read_text(encoding='utf-8')
+    url = page_url(page)
+    assets: Dict[str, Asset] = {page: Asset(page, 'document', True)}
+    for reference, kind, blocking in find_assets(html, url, hints):
+        if reference.startswith('data:') or not reference:
+            continue
+        if reference.startswith(base_path) and not reference.startswith('//'):
+            path = resolve('', reference[len(base_path):])
+        else:
+            path = resolve(page_dir(url), reference)
+        if path is None:
+            weight.external.append(reference)
+            if kind == 'script':
+                weight.external_scripts.append(reference)
+        elif not (site_dir / path).is_file():
+            weight.missing.append(reference)
+        elif path in assets:
+            assets[path] = assets[path]._replace(blocking=assets[path].blocking or blocking)
+        else:
+            assets[path] = Asset(path, kind, blocking)
+
+    weight.assets = list(assets.values())
+    for asset in weight.assets:
+        size = cache.size(site_dir / asset.path, asset.path)
+        weight.total += size
+        if asset.blocking:
+            weight.blocking += size
+    return weight
+
+
+def weigh_site(site_dir: Path, cache: Optional[SizeCache] = None, base_path: str = '/') -> List[PageWeight]:
+    site_dir = Path(site_dir)
+    cache = cache if cache is not None else SizeCache()
+    hints = ResourceHints(site_dir)
+    return [
+        weigh_page(site_dir, path.relative_to(site_dir).as_posix(), cache, hints, base_path)
+        for path in sorted(site_dir.rglob('*.html'))
+    ]
+
+
+def load_budgets(path: Path) -> Dict[str, Dict[str, int]]:
+    """Section -> {'total': KiB, 'blocking': KiB} (gzip), with 'default' for the rest"""
+    import yaml
+
+    with open(path, encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    budgets = {'default': data.get('default', {})}
+    for section, budget in (data.get('sections') or {}).items():
+        budgets[section] = {**budgets['default'], **budget}
+    return budgets
+
+
+def budget_violations(weights: List[PageWeight], budgets: Dict[str, Dict[str, int]]) -> List[str]:
+    """Pages over their section budget, and pages whose weight is unknown because of a script on another origin"""
+    violations = []
+    for weight in weights:
+        for reference in weight.external_scripts:
+            violations.append(f"{weight.page}: {reference} is on another origin, so the page weight is not measured")
+        budget = budgets.get(weight.section, budgets.get('default', {}))
+        for name, size in (('total', weight.total), ('blocking', weight.blocking)):
+            limit = budget.get(name)
+            if limit is not None and size.gzip > limit * 1024:
+                violations.append(
+                    f"{weight.page}: {name} {size.gzip / 1024:.1f} KiB gzip exceeds "
+                    f"the {weight.section} budget of {limit} KiB"
+                )
+    return violations
+
+
+def history_entry(weights: List[PageWeight], commit: Optional[str] = None) -> Dict:
+    """Gzip totals of one run, per page, for the history file"""
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'commit': commit,
+        'pages': {weight.page: [weight.total.gzip, weight.blocking.gzip] for weight in weights},
+    }
+
+
+def load_history(path: Path) -> List[Dict]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_history(path: Path, history: List[Dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(history[-HISTORY_LIMIT:], f, indent=1)
+    os.replace(tmp, path)
+
+
+def regressions(previous: Dict, current: Dict) -> List[str]:
+    """Pages whose gzip total grew past the regression thresholds since the previous entry"""
+    found = []
+    for page, (total, _) in current['pages'].items():
+        if page not in previous['pages']:
+            continue
+        before = previous['pages'][page][0]
+        growth = total - before
+        if growth > REGRESSION_BYTES and growth > before * REGRESSION_RATIO:
+            found.append(f"{page}: {before / 1024:.1f} -> {total / 1024:.1f} KiB gzip")
+    return found
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+In-memory index of the files under a docs directory.
+Built from a single directory walk, it resolves links MkDocs-style and answers
+"does this target exist with different casing, a different extension or as a
+directory index" with dictionary lookups instead of per-link filesystem calls.
+"""
+
+import os
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+
+
+# Kinds of near-miss returned by PathIndex.variant()
+VARIANT_CASE = 'case'
+VARIANT_EXTENSION = 'extension'
+VARIANT_INDEX = 'index'
+
+
+def join_link(link: str, source: str) -> Optional[str]:
+    """
+    Normalize a link against its source page
+
+    Anchors and query strings are dropped, '/' means the docs root.
+
+    Returns:
+        Docs-relative path the link points at ('' for the docs root), or
+        None if it escapes the docs
+    """
+    target = unquote(link.split('#', 1)[0].split('?', 1)[0])
+    if target.startswith('/'):
+        joined = target.lstrip('/')
+    else:
+        joined = str(PurePosixPath(source).parent / target)
+    normalized = os.path.normpath(joined).replace(os.sep, '/') if joined else '.'
+    if normalized.startswith('../') or normalized == '..':
+        return None
+    return '' if normalized == '.' else normalized
+
+
+def link_candidates(link: str, source: str) -> List[str]:
+    """
+    Docs-relative paths a relative link may refer to, most specific first
+
+    Directory links map to their index.md and extensionless links to the
+    .md file, then the directory index. Shared by PathIndex and DocsCorpus
+    so the tests and the build resolve links the same way.
+
+    Returns:
+        Candidate paths; empty for anchor-only links and links escaping the docs
+    """
+    target = unquote(link.split('#', 1)[0].split('?', 1)[0])
+    if not target:
+        return []
+    rel_path = join_link(link, source)
+    if rel_path is None:
+        return []
+    if not rel_path or target.endswith('/'):
+        return [f'{rel_path}/index.md' if rel_path else 'index.md']
+    if PurePosixPath(rel_path).suffix:
+        return [rel_path, f'{rel_path}/index.md']
+    return [f'{rel_path}.md', f'{rel_path}/index.md', rel_path]
+
+
+class PathIndex:
+    """Case-insensitive path index for a docs directory"""
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = Path(os.path.abspath(docs_dir))
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = {''}
+        # casefolded relative path -> real relative path
+        self.by_casefold: Dict[str, str] = {}
+        # casefolded path without suffix -> real relative paths
+        self.by_base: Dict[str, List[str]] = {}
+        # casefolded stem -> real relative paths
+        self.by_stem: Dict[str, List[str]] = {}
+
+        for root, dirs, files in os.walk(self.docs_dir):
+            rel_root = os.path.relpath(root, self.docs_dir).replace(os.sep, '/')
+            rel_root = '' if rel_root == '.' else rel_root
+            for name in dirs:
+                self.dirs.add(f'{rel_root}/{name}' if rel_root else name)
+            for name in files:
+                self.add(f'{rel_root}/{name}' if rel_root else name)
+
+    def add(self, rel_path: str) -> None:
+        path = PurePosixPath(rel_path)
+        self.files.add(rel_path)
+        self.by_casefold.setdefault(rel_path.casefold(), rel_path)
+        self.by_base.setdefault(str(path.with_suffix('')).casefold(), []).append(rel_path)
+        self.by_stem.setdefault(path.stem.casefold(), []).append(rel_path)
+
+    # -- paths -----------------------------------------------------------
+
+    def rel(self, path: Union[str, Path]) -> Optional[str]:
+        """Docs-relative posix path of an absolute path, or None outside the docs"""
+        rel_path = os.path.relpath(os.path.abspath(path), self.docs_dir).replace(os.sep, '/')
+        if rel_path == '.':
+            return ''
+        if rel_path.startswith('../') or rel_path == '..':
+            return None
+        return rel_path
+
+    def path(self, rel_path: str) -> Path:
+        return self.docs_dir / rel_path
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        """Whether a file exists; accepts docs-relative strings or absolute Paths"""
+        rel_path = self.rel(path) if isinstance(path, Path) else path
+        return rel_path in self.files
+
+    def is_dir(self, rel_path: str) -> bool:
+        return rel_path in self.dirs
+
+    # -- link resolution -------------------------------------------------
+
+    def join(self, link: str, source: str) -> Optional[str]:
+        """Docs-relative path a link points at, or None if it escapes the docs (see join_link)"""
+        return join_link(link, source)
+
+    def target(self, link: str, source: str) -> Optional[str]:
+        """
+        Path a link refers to: the first of its link_candidates that exists,
+        else the most specific one
+        """
+        candidates = link_candidates(link, source)
+        for candidate in candidates:
+            if candidate in self.files:
+                return candidate
+        return candidates[0] if candidates else None
+
+    def resolve(self, link: str, source: str) -> Optional[str]:
+        """Existing file a link refers to, or None"""
+        rel_path = self.target(link, source)
+        return rel_path if rel_path in self.files else None
+
+    # -- near misses -----------------------------------------------------
+
+    def variant(self, rel_path: str) -> Optional[Tuple[str, str]]:
+        """
+        Find an existing file the missing rel_path was probably meant to be
+
+        Returns:
+            (kind, real path) where kind is VARIANT_CASE, VARIANT_EXTENSION or
+            VARIANT_INDEX, or None
+        """
+        if rel_path in self.files:
+            return None
+        folded = rel_path.casefold()
+
+        actual = self.by_casefold.get(folded)
+        if actual is not None:
+            return VARIANT_CASE, actual
+
+        base = str(PurePosixPath(rel_path).with_suffix('')).casefold()
+        for actual in self.by_base.get(base, []):
+            return VARIANT_EXTENSION, actual
+
+        actual = self.by_casefold.get(f'{base}/index.md')
+        if actual is not None:
+            return VARIANT_INDEX, actual
+
+        return None
+
+    def with_stem(self, stem: str) -> List[str]:
+        """Files whose name without suffix matches stem case-insensitively"""
+        return sorted(self.by_stem.get(stem.casefold(), []))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Process pool that converts page Markdown to HTML.
+Workers are forked once the config and file list are final, so each one
+inherits the configured markdown_extensions and the files links resolve
+against without pickling them: only (src_uri, markdown) is sent, and the
+fields Page.render() sets come back together with the log records it
+emitted, to be replayed in the parent in page order.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from mkdocs.structure.pages import Page
+
+
+class RenderResult(NamedTuple):
+    content: str
+    toc: Any
+    title: Optional[str]
+    anchors: Set[str]
+    # src_uri -> {anchor: original link}, or None when anchors aren't validated
+    links_to_anchors: Optional[Dict[str, Dict[str, str]]]
+    # (logger name, level, message) emitted while rendering
+    records: List[Tuple[str, int, str]]
+    # share() name -> the object's export() after this page
+    shared: Dict[str, Any]
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: List[Tuple[str, int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.name, record.levelno, record.getMessage()))
+
+
+_worker: Dict[str, Any] = {}
+# Objects updated while rendering (caches, counters); see share()
+_shared: Dict[str, Any] = {}
+
+
+def share(name: str, obj: Any) -> None:
+    """
+    Send an object's render-time changes from the workers back to the parent
+
+    The object needs export(), returning and resetting its changes since the
+    last call, and merge(changes). Register it before the pool forks.
+    """
+    _shared[name] = obj
+
+
+def _init_worker(config, files) -> None:
+    """Keep the inherited config and files; capture MkDocs logging for the parent"""
+    capture = _Capture()
+    logger = logging.getLogger('mkdocs')
+    logger.handlers = [capture]
+    logger.propagate = False
+    _worker.update(config=config, files=files, capture=capture)
+
+
+def render(src_uri: str, markdown: str) -> RenderResult:
+    """Worker side: Page.render() of one page, as a serial build would call it"""
+    config, files, capture = _worker['config'], _worker['files'], _worker['capture']
+    capture.records = []
+    file = files.get_file_from_path(src_uri)
+    page = file.page if file.page is not None else Page(None, file, config)
+    page.markdown = markdown
+    config._current_page = page
+    try:
+        page.render(config, files)
+    finally:
+        config._current_page = None
+
+    links = page.links_to_anchors
+    return RenderResult(
+        page.content,
+        page.toc,
+        page._title_from_render,
+        page.present_anchor_ids,
+        None if links is None else {target.src_uri: anchors for target, anchors in links.items()},
+        capture.records,
+        {name: obj.export() for name, obj in _shared.items()},
+    )
+
+
+def apply_result(page: Page, result: RenderResult, files) -> None:
+    """Parent side: set what Page.render() would have set and replay its logging"""
+    for name, level, message in result.records:
+        logging.getLogger(name).log(level, message)
+    for name, changes in result.shared.items():
+        if name in _shared:
+            _shared[name].merge(changes)
+    page.content = result.content
+    page.toc = result.toc
+    page._title_from_render = result.title
+    page.present_anchor_ids = result.anchors
+    if result.links_to_anchors is not None:
+        page.links_to_anchors = {
+            files.get_file_from_path(src_uri): anchors for src_uri, anchors in result.links_to_anchors.items()
+        }
+
+
+def can_fork() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+class RenderPool:
+    """Forked workers rendering pages for one build"""
+
+    def __init__(self, config, files, jobs: int):
+        self.executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(config, files),
+        )
+
+    def submit(self, page: Page) -> 'Future[RenderResult]':
+        return self.executor.submit(render, page.file.src_uri, page.markdown)
+
+    def close(self, cancel: bool = False) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=cancel)
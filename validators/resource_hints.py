@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Resource hints derived from what a built page actually loads.
+The stylesheets a page links are read from the built site, their
+@font-face rules are matched against the font families the page's CSS
+and inline styles use, and one face per used family (regular weight,
+normal style, woff2 preferred) is preloaded. Every external origin the
+page's stylesheets and scripts load from gets a preconnect, so neither the
+fonts nor those origins wait for the CSS to be parsed first.
+"""
+
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from urllib.parse import urlsplit
+
+FONT_FACE = re.compile(r'@font-face\s*\{([^}]*)\}', re.IGNORECASE)
+DECLARATION = re.compile(r'([\w-]+)\s*:\s*([^;]+)')
+FONT_SOURCE = re.compile(r'url\(\s*["\']?([^"\')]+)["\']?\s*\)(?:\s*format\(\s*["\']?([\w-]+)["\']?\s*\))?')
+# Family declarations, plus Material's --md-text-font/--md-code-font, which its font-family stacks read
+FAMILY_USE = re.compile(r'(?:font-family|--md-(?:text|code)-font)\s*:\s*([^;}]+)', re.IGNORECASE)
+GENERIC_FAMILIES = {'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'initial'}
+FORMAT_PREFERENCE = ['woff2', 'woff', 'truetype', 'opentype']
+
+STYLESHEET = re.compile(r'<link\b[^>]*\brel="stylesheet"[^>]*\bhref="([^"]+)"[^>]*>')
+INLINE_STYLE = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+# Links the browser fetches (not canonical, alternate, ...) and scripts
+HEAD_RESOURCE = re.compile(
+    r'<(?:link\b[^>]*\brel="(?:stylesheet|preload|modulepreload|icon)"[^>]*\bhref|script\b[^>]*\bsrc)'
+    r'="((?:https?:)?//[^"]+)"'
+)
+PRECONNECT = re.compile(r'<link\b[^>]*\brel="preconnect"[^>]*\bhref="([^"]+)"')
+PRELOAD_FONT = re.compile(r'<link rel="preload" href="([^"]+)" as="font"')
+
+
+class FontFace(NamedTuple):
+    family: str
+    weight: str
+    style: str
+    path: str  # site-relative path of the font file
+    format: str
+
+
+def page_dir(url: str) -> str:
+    """Site directory a page URL resolves relative links against"""
+    return url.rstrip('/') if url.endswith('/') else posixpath.dirname(url)
+
+
+def resolve(base_dir: str, href: str) -> Optional[str]:
+    """Site-relative path of a relative URL, or None for external and data URLs"""
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc or href.startswith('/'):
+        return None
+    path = posixpath.normpath(posixpath.join(base_dir, parts.path))
+    return None if path.startswith('..') else path
+
+
+def relative_url(path: str, base_dir: str) -> str:
+    return posixpath.relpath(path, base_dir or '.')
+
+
+def family_names(value: str) -> List[str]:
+    names = (name.strip().strip('"\'').lower() for name in value.split(','))
+    return [name for name in names if name and name not in GENERIC_FAMILIES and not name.startswith('var(')]
+
+
+def parse_font_faces(css: str, css_path: str) -> List[FontFace]:
+    """@font-face rules of a stylesheet, with sources resolved against its location"""
+    faces = []
+    for block in FONT_FACE.findall(css):
+        declarations = {name.lower(): value.strip() for name, value in DECLARATION.findall(block)}
+        families = family_names(declarations.get('font-family', ''))
+        sources = [
+            (resolve(posixpath.dirname(css_path), url), (fmt or '').lower())
+            for url, fmt in FONT_SOURCE.findall(declarations.get('src', ''))
+        ]
+        sources = [(path, fmt) for path, fmt in sources if path is not None]
+        if not families or not sources:
+            continue
+        path, fmt = min(sources, key=lambda source: (
+            FORMAT_PREFERENCE.index(source[1]) if source[1] in FORMAT_PREFERENCE else len(FORMAT_PREFERENCE)
+        ))
+        faces.append(FontFace(
+            families[0],
+            declarations.get('font-weight', '400').replace('normal', '400'),
+            declarations.get('font-style', 'normal'),
+            path,
+            fmt or posixpath.splitext(path)[1].lstrip('.'),
+        ))
+    return faces
+
+
+def used_families(styles: Iterable[str]) -> Set[str]:
+    """Font families named outside @font-face rules"""
+    used = set()
+    for css in styles:
+        for value in FAMILY_USE.findall(FONT_FACE.sub('', css)):
+            used.update(family_names(value))
+    return used
+
+
+def preload_faces(faces: Iterable[FontFace], families: Set[str]) -> List[FontFace]:
+    """One face per used family: the regular upright face, else the first declared"""
+    chosen: Dict[str, FontFace] = {}
+    for face in faces:
+        if face.family not in families:
+            continue
+        current = chosen.get(face.family)
+        if current is None or (face.weight, face.style) == ('400', 'normal') != (current.weight, current.style):
+            chosen[face.family] = face
+    return list(chosen.values())
+
+
+class ResourceHints:
+    """Per-page preload and preconnect hints for one built site"""
+
+    def __init__(self, site_dir: Path):
+        self.site_dir = Path(site_dir)
+        self._stylesheets: Dict[str, str] = {}
+
+    def stylesheet(self, path: str) -> str:
+        if path not in self._stylesheets:
+            try:
+                self._stylesheets[path] = (self.site_dir / path).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                self._stylesheets[path] = ''
+        return self._stylesheets[path]
+
+    def fonts(self, html: str, url: str) -> List[FontFace]:
+        """Faces to preload on a page: declared by its stylesheets and used by its styles"""
+        base_dir = page_dir(url)
+        sheets = [path for path in (resolve(base_dir, href) for href in STYLESHEET.findall(html))
+                  if path is not None and path.endswith('.css')]
+        styles = [self.stylesheet(path) for path in sheets] + INLINE_STYLE.findall(html)
+        faces = [face for path in sheets for face in parse_font_faces(self.stylesheet(path), path)]
+        return preload_faces(faces, used_families(styles))
+
+    def tags(self, html: str, url: str) -> List[str]:
+        base_dir = page_dir(url)
+        tags = [
+            f'<link rel="preload" href="{relative_url(face.path, base_dir)}" as="font" '
+            f'type="font/{face.format}" crossorigin>'
+            for face in self.fonts(html, url)
+        ]
+        connected = {urlsplit(href).netloc for href in PRECONNECT.findall(html)}
+        for href in HEAD_RESOURCE.findall(html):
+            origin = urlsplit(href)
+            if origin.netloc not in connected:
+                connected.add(origin.netloc)
+                tags.append(f'<link rel="preconnect" href="{origin.scheme or "https"}://{origin.netloc}">')
+        return tags
+
+    def inject(self, html: str, url: str) -> str:
+        """Insert the hints before the first <link> of the head"""
+        tags = self.tags(html, url)
+        position = html.find('<link')
+        if not tags or position < 0 or position > html.find('</head>'):
+            return html
+        return html[:position] + '\n'.join(tags) + '\n' + html[position:]
+
+
+def preload_problems(site_dir: Path) -> List[str]:
+    """Preloaded fonts of a built site that don't exist or that the page doesn't use"""
+    site_dir = Path(site_dir)
+    hints = ResourceHints(site_dir)
+    problems = []
+    for path in sorted(site_dir.rglob('*.html')):
+        rel_path = path.relative_to(site_dir).as_posix()
+        url = rel_path[:-len('index.html')] if rel_path.endswith('index.html') else rel_path
+        html = path.read_text(encoding='utf-8')
+        used = {face.path for face in hints.fonts(html, url)}
+        for href in PRELOAD_FONT.findall(html):
+            target = resolve(page_dir(url), href)
+            if target is None or not (site_dir / target).is_file():
+                problems.append(f"{rel_path}: preloaded font {href} does not exist")
+            elif target not in used:
+                problems.append(f"{rel_path}: preloaded font {href} is not used by the page")
+    return problems
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Self-hosting of third-party scripts.
+A script referenced from a CDN as an exact npm version
+(cdn.jsdelivr.net/npm/<name>@<version>/<path> or unpkg.com) is fetched as
+that version's npm tarball into .cache/druids/vendor, checked against the
+integrity recorded in vendor-lock.json, and the script plus the files it
+loads at runtime are served from the site itself under a content-hashed
+name with a Subresource Integrity hash. Offline builds fill the cache from
+a local directory of tarballs instead of the registry. A package without a
+lock entry is an error; entries are only recorded when asked to with
+DRUIDS_VENDOR_UPDATE=1.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import urllib.request
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+REGISTRY = 'https://registry.npmjs.org'
+LOCK_FILE = 'vendor-lock.json'
+VENDOR_DIR = 'assets/vendor'
+CACHE_DIR = Path('.cache') / 'druids' / 'vendor'
+# Directory of npm tarballs used instead of the registry
+LOCAL_DIR_ENV = 'DRUIDS_VENDOR_DIR'
+# Set to 1 to record lock entries for packages that have none
+UPDATE_ENV = 'DRUIDS_VENDOR_UPDATE'
+FETCH_TIMEOUT = 60
+
+CDN_PATTERN = re.compile(
+    r'^(?:https?:)?//(?:cdn\.jsdelivr\.net/npm|unpkg\.com)/'
+    r'(?P<name>(?:@[^/@]+/)?[^/@]+)@(?P<version>[^/]+)/(?P<path>[^?#]+)$'
+)
+EXACT_VERSION = re.compile(r'^\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?$')
+
+# Files a package's scripts load relative to themselves, per package
+RUNTIME_ASSETS: Dict[str, List[str]] = {
+    'mathjax': [
+        'es5/output/chtml/fonts/woff-v2/*.woff',
+        'es5/input/tex/extensions/*.js',
+    ],
+}
+
+
+class VendorError(Exception):
+    """A package that can't be fetched or doesn't match its recorded integrity"""
+
+
+class CdnScript(NamedTuple):
+    name: str
+    version: str
+    path: str  # within the package
+
+    @property
+    def pinned(self) -> bool:
+        return bool(EXACT_VERSION.match(self.version))
+
+    @property
+    def tarball(self) -> str:
+        """Registry tarball name, e.g. mathjax-3.2.2.tgz"""
+        return f"{self.name.split('/')[-1]}-{self.version}.tgz"
+
+    @property
+    def tarball_url(self) -> str:
+        return f"{REGISTRY}/{self.name}/-/{self.tarball}"
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.version}"
+
+
+class VendoredScript(NamedTuple):
+    src: str  # site-relative path of the script
+    integrity: str
+    files: Dict[str, bytes]  # site-relative path -> content, including the script
+
+
+class VendorRun(NamedTuple):
+    scripts: Dict[str, VendoredScript]  # CDN URL -> self-hosted script
+    errors: Dict[str, str]  # CDN URL -> why it is still loaded from the CDN
+    recorded: bool  # new entries were written to the lock file
+
+
+def parse_cdn_url(url: str) -> Optional[CdnScript]:
+    match = CDN_PATTERN.match(url)
+    if not match:
+        return None
+    return CdnScript(match['name'], match['version'], match['path'])
+
+
+def subresource_integrity(data: bytes, algorithm: str = 'sha384') -> str:
+    digest = hashlib.new(algorithm, data).digest()
+    return f"{algorithm}-{base64.b64encode(digest).decode('ascii')}"
+
+
+def hashed_name(path: str, data: bytes) -> str:
+    """tex-mml-chtml.js -> tex-mml-chtml.<8 hex chars>.js"""
+    path = PurePosixPath(path)
+    return str(path.with_name(f"{path.stem}.{hashlib.sha256(data).hexdigest()[:8]}{path.suffix}"))
+
+
+def load_lock(lock_path: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(lock_path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_lock(lock_path: Path, lock: Dict[str, Dict[str, str]]) -> None:
+    with open(lock_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(lock.items())), f, indent=2)
+        f.write('\n')
+
+
+def fetch_tarball(script: CdnScript, cache_dir: Path, local_dir: Optional[Path] = None) -> Path:
+    """
+    Path of the package tarball in the vendor cache, filling the cache first
+
+    Raises:
+        VendorError: If the tarball is neither cached, in local_dir nor downloadable
+    """
+    cached = cache_dir / script.tarball
+    if cached.exists():
+        return cached
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(f'.{os.getpid()}.tmp')
+    if local_dir is not None:
+        source = local_dir / script.tarball
+        if not source.exists():
+            raise VendorError(f"{script.tarball} not found in {local_dir}")
+        shutil.copyfile(source, tmp)
+    else:
+        try:
+            with urllib.request.urlopen(script.tarball_url, timeout=FETCH_TIMEOUT) as response:
+                tmp.write_bytes(response.read())
+        except OSError as e:
+            raise VendorError(f"Could not download {script.tarball_url}: {e}") from e
+    os.replace(tmp, cached)
+    return cached
+
+
+def verify_tarball(script: CdnScript, data: bytes, lock: Dict[str, Dict[str, str]], update: bool = False) -> bool:
+    """
+    Check a tarball against its lock entry
+
+    Args:
+        update: Record an entry for a package that has none
+
+    Returns:
+        True if a new entry was recorded
+
+    Raises:
+        VendorError: If the package has no entry (and update is off) or the
+            tarball doesn't match the recorded integrity
+    """
+    entry = lock.get(script.key)
+    if entry is None:
+        if not update:
+            raise VendorError(
+                f"{script.key} has no entry in {LOCK_FILE}; build once with {UPDATE_ENV}=1 "
+                f"and commit the lock file"
+            )
+        lock[script.key] = {'resolved': script.tarball_url, 'integrity': subresource_integrity(data, 'sha512')}
+        return True
+    algorithm = entry['integrity'].split('-', 1)[0]
+    if subresource_integrity(data, algorithm) != entry['integrity']:
+        raise VendorError(f"{script.tarball} does not match the integrity recorded in {LOCK_FILE}")
+    return False
+
+
+def extract(data: bytes, script: CdnScript) -> Dict[str, bytes]:
+    """The script and its runtime assets, keyed by path within the package"""
+    patterns = RUNTIME_ASSETS.get(script.name, [])
+    files = {}
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as tar:
+        for member in tar.getmembers():
+            # npm tarballs keep everything under one top-level directory, usually package/
+            path = member.name.split('/', 1)[-1]
+            if member.isfile() and (path == script.path or any(fnmatch(path, p) for p in patterns)):
+                files[path] = tar.extractfile(member).read()
+    if script.path not in files:
+        raise VendorError(f"{script.path} not found in {script.tarball}")
+    return files
+
+
+def vendor_script(
+    url: str,
+    cache_dir: Path,
+    lock: Dict[str, Dict[str, str]],
+    local_dir: Optional[Path] = None,
+    update: bool = False,
+) -> VendoredScript:
+    """
+    Self-host one pinned CDN script
+
+    The files keep the package layout under assets/vendor/<name>@<version>/
+    so the script finds its runtime assets; only the script itself gets a
+    content-hashed name.
+
+    Raises:
+        VendorError: If the URL isn't a pinned npm CDN URL, the package is
+            unavailable or it isn't in the lock (see verify_tarball)
+    """
+    script = parse_cdn_url(url)
+    if script is None:
+        raise VendorError(f"{url} is not an npm CDN URL (cdn.jsdelivr.net/npm or unpkg.com)")
+    if not script.pinned:
+        raise VendorError(f"{url} does not pin an exact version")
+
+    data = fetch_tarball(script, cache_dir, local_dir).read_bytes()
+    verify_tarball(script, data, lock, update)
+
+    root = f"{VENDOR_DIR}/{script.key}"
+    files = {f"{root}/{path}": content for path, content in extract(data, script).items()}
+    content = files.pop(f"{root}/{script.path}")
+    src = f"{root}/{hashed_name(script.path, content)}"
+    files[src] = content
+    return VendoredScript(src, subresource_integrity(content), files)
+
+
+def vendor_scripts(urls: Iterable[str], root: Path) -> VendorRun:
+    """
+    Self-host CDN scripts of the project at root, saving new lock entries
+
+    Tarballs come from the registry, or from the directory named by
+    DRUIDS_VENDOR_DIR when it is set. New lock entries are only recorded
+    with DRUIDS_VENDOR_UPDATE=1.
+    """
+    local_dir = os.environ.get(LOCAL_DIR_ENV)
+    update = os.environ.get(UPDATE_ENV) == '1'
+    lock = load_lock(root / LOCK_FILE)
+    recorded = dict(lock)
+    scripts, errors = {}, {}
+    for url in urls:
+        try:
+            scripts[url] = vendor_script(url, root / CACHE_DIR, lock, Path(local_dir) if local_dir else None, update)
+        except VendorError as e:
+            errors[url] = str(e)
+    if lock != recorded:
+        save_lock(root / LOCK_FILE, lock)
+    return VendorRun(scripts, errors, lock != recorded)
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Watch-mode validation daemon for the docs directory.
+
+Keeps the link graph, frontmatter table and wikilink index in memory and, on
+each save, re-validates only the changed page plus the pages linking to it.
+Results go to the terminal and optionally to a JSON file or a Unix socket.
+
+Usage: python -m validators.watch [docs] [--poll] [--json-file FILE] [--socket PATH]
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from validators.corpus import DocsCorpus, PageRecord
+from validators.markdown_linter import lint_source
+
+
+# Editors write several events per save; changes are batched over this window
+DEBOUNCE_SECONDS = 0.1
+POLL_INTERVAL = 0.5
+
+
+def validate_page(corpus: DocsCorpus, record: PageRecord, lint_errors: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    Validate one page against the in-memory corpus
+
+    Args:
+        corpus: Loaded corpus
+        record: Page to validate
+        lint_errors: Precomputed DRUIDS linter errors; read from disk when omitted
+
+    Returns:
+        List of issue dicts with 'rule', 'line' and 'message'
+    """
+    issues = []
+
+    if record.frontmatter_error:
+        issues.append({'rule': 'frontmatter', 'line': 1, 'message': f"Invalid YAML frontmatter: {record.frontmatter_error}"})
+
+    issues.extend(corpus.link_issues(record))
+
+    if lint_errors is None:
+        lint_errors = lint_page(corpus, record)
+    issues.extend(lint_errors)
+
+    return sorted(issues, key=lambda issue: issue['line'])
+
+
+def lint_page(corpus: DocsCorpus, record: PageRecord) -> List[Dict]:
+    """DRUIDS linter errors (warnings are left to the full linter run)"""
+    text = (corpus.docs_dir / record.path).read_text(encoding='utf-8', errors='replace')
+    return [
+        {'rule': issue.rule, 'line': issue.line, 'message': issue.message}
+        for issue in lint_source(text, record.path)
+        if issue.severity == 'error'
+    ]
+
+
+class ValidationDaemon:
+    """Incrementally re-validate docs as files change"""
+
+    def __init__(self, docs_dir: Path, json_file: Optional[Path] = None, socket_path: Optional[Path] = None,
+                 quiet: bool = False):
+        self.docs_dir = Path(docs_dir)
+        self.corpus = DocsCorpus(self.docs_dir)
+        self.results: Dict[str, List[Dict]] = {}
+        # path -> (mtime, lint errors); pages re-checked only as dependents are not re-read
+        self._lint_cache: Dict[str, tuple] = {}
+        self.json_file = json_file
+        self.quiet = quiet
+        self.listeners: List[Callable[[Dict], None]] = []
+        self._server: Optional[socket.socket] = None
+        self._clients: List[socket.socket] = []
+        if socket_path:
+            self._start_socket(socket_path)
+
+    # -- validation ------------------------------------------------------
+
+    def start(self) -> Dict:
+        """Load the corpus and validate every page once"""
+        started = time.perf_counter()
+        self.corpus.load()
+        return self.revalidate(set(self.corpus.pages), started, changed=[])
+
+    def handle_changes(self, changed: Iterable[str], removed: Iterable[str] = ()) -> Dict:
+        """
+        Update the corpus for changed/removed files and re-check affected pages
+
+        Args:
+            changed: Docs-relative paths that were created or modified
+            removed: Docs-relative paths that were deleted
+        """
+        started = time.perf_counter()
+        affected: Set[str] = set()
+        for rel_path in removed:
+            affected |= self.corpus.remove(rel_path)
+            self.results.pop(rel_path, None)
+            self._lint_cache.pop(rel_path, None)
+        for rel_path in changed:
+            if (self.docs_dir / rel_path).is_file():
+                affected |= self.corpus.update(rel_path)
+        return self.revalidate(affected, started, changed=sorted(set(changed) | set(removed)))
+
+    def revalidate(self, paths: Set[str], started: float, changed: List[str]) -> Dict:
+        for record in self.corpus.iter_pages(paths):
+            cached = self._lint_cache.get(record.path)
+            if cached is None or cached[0] != record.mtime:
+                cached = (record.mtime, lint_page(self.corpus, record))
+                self._lint_cache[record.path] = cached
+            issues = validate_page(self.corpus, record, lint_errors=cached[1])
+            if issues:
+                self.results[record.path] = issues
+            else:
+                self.results.pop(record.path, None)
+
+        event = {
+            'changed': changed,
+            'checked': sorted(p for p in paths if p in self.corpus.pages),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'issues': {path: self.results[path] for path in sorted(paths) if path in self.results},
+            'total_issues': sum(len(issues) for issues in self.results.values()),
+        }
+        self.publish(event)
+        return event
+
+    # -- output ----------------------------------------------------------
+
+    def publish(self, event: Dict) -> None:
+        if not self.quiet:
+            self.print_event(event)
+        if self.json_file:
+            tmp = self.json_file.with_suffix('.tmp')
+            tmp.write_text(json.dumps({'last_event': event, 'results': self.results}, indent=2))
+            os.replace(tmp, self.json_file)
+        if self._clients:
+            self._broadcast(event)
+        for listener in self.listeners:
+            listener(event)
+
+    @staticmethod
+    def print_event(event: Dict) -> None:
+        label = ', '.join(event['changed']) if event['changed'] else 'initial scan'
+        print(f"🔄 {label}: checked {len(event['checked'])} pages in {event['duration_ms']:.1f}ms")
+        for path, issues in event['issues'].items():
+            for issue in issues:
+                print(f"   ❌ {path}:{issue['line']}: {issue['message']}")
+        if not event['issues']:
+            print("   ✅ No issues in checked pages")
+        print(f"   📊 {event['total_issues']} issues across the docs")
+
+    def _start_socket(self, socket_path: Path) -> None:
+        if socket_path.exists():
+            socket_path.unlink()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(socket_path))
+        self._server.listen()
+        threading.Thread(target=self._accept_clients, daemon=True).start()
+
+    def _accept_clients(self) -> None:
+        while self._server is not None:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            self._clients.append(client)
+
+    def _broadcast(self, event: Dict) -> None:
+        payload = (json.dumps(event) + '\n').encode('utf-8')
+        for client in list(self._clients):
+            try:
+                client.sendall(payload)
+            except OSError:
+                self._clients.remove(client)
+
+    def close(self) -> None:
+        if self._server is not None:
+            server, self._server = self._server, None
+            server.close()
+        for client in self._clients:
+            client.close()
+        self._clients.clear()
+
+    # -- watching --------------------------------------------------------
+
+    def watch(self, poll: bool = False) -> None:
+        """Block and re-validate on every change until interrupted"""
+        watcher = None if poll else _start_native_watcher(self.docs_dir)
+        if watcher is None:
+            if not self.quiet:
+                print(f"👀 Polling {self.docs_dir} every {POLL_INTERVAL}s")
+            watcher = PollingWatcher(self.docs_dir)
+        elif not self.quiet:
+            print(f"👀 Watching {self.docs_dir} for changes")
+
+        try:
+            while True:
+                changed, removed = watcher.collect()
+                if changed or removed:
+                    self.handle_changes(changed, removed)
+        finally:
+            watcher.stop()
+            self.close()
+
+
+def _relevant(rel_path: str) -> bool:
+    return not any(part.startswith('.') for part in Path(rel_path).parts)
+
+
+class PollingWatcher:
+    """Portable fallback: compare mtimes of the docs tree"""
+
+    def __init__(self, docs_dir: Path, interval: float = POLL_INTERVAL):
+        self.docs_dir = docs_dir
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, float]:
+        snapshot = {}
+        for root, dirs, files in os.walk(self.docs_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                path = Path(root) / name
+                rel_path = path.relative_to(self.docs_dir).as_posix()
+                if _relevant(rel_path):
+                    try:
+                        snapshot[rel_path] = path.stat().st_mtime
+                    except OSError:
+                        pass
+        return snapshot
+
+    def collect(self):
+        time.sleep(self.interval)
+        current = self._scan()
+        changed = [p for p, mtime in current.items() if self.snapshot.get(p) != mtime]
+        removed = [p for p in self.snapshot if p not in current]
+        self.snapshot = current
+        return changed, removed
+
+    def stop(self) -> None:
+        pass
+
+
+class NativeWatcher:
+    """inotify/FSEvents via watchdog, batched over DEBOUNCE_SECONDS"""
+
+    def __init__(self, docs_dir: Path, observer):
+        self.docs_dir = docs_dir
+        self.observer = observer
+        self.pending_changed: Set[str] = set()
+        self.pending_removed: Set[str] = set()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+    def record(self, path: str, removed: bool) -> None:
+        try:
+            rel_path = Path(path).relative_to(self.docs_dir.resolve()).as_posix()
+        except ValueError:
+            return
+        if not _relevant(rel_path):
+            return
+        with self.lock:
+            if removed:
+                self.pending_removed.add(rel_path)
+                self.pending_changed.discard(rel_path)
+            else:
+                self.pending_changed.add(rel_path)
+                self.pending_removed.discard(rel_path)
+        self.wakeup.set()
+
+    def collect(self):
+        self.wakeup.wait()
+        time.sleep(DEBOUNCE_SECONDS)
+        with self.lock:
+            changed, removed = sorted(self.pending_changed), sorted(self.pending_removed)
+            self.pending_changed.clear()
+            self.pending_removed.clear()
+            self.wakeup.clear()
+        return changed, removed
+
+    def stop(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+def _start_native_watcher(docs_dir: Path) -> Optional[NativeWatcher]:
+    """Start a watchdog observer, or return None when it is unavailable"""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type in ('opened', 'closed_no_write'):
+                return
+            if event.event_type == 'moved':
+                watcher.record(event.src_path, removed=True)
+                watcher.record(event.dest_path, removed=False)
+            else:
+                watcher.record(event.src_path, removed=event.event_type == 'deleted')
+
+    observer = Observer()
+    watcher = NativeWatcher(docs_dir, observer)
+    try:
+        observer.schedule(Handler(), str(docs_dir.resolve()), recursive=True)
+        observer.start()
+    except OSError:
+        return None
+    return watcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-validate docs incrementally as they are saved")
+    parser.add_argument("docs_dir", type=Path, nargs="?", default=Path("docs"),
+                        help="Documentation directory (default: docs)")
+    parser.add_argument("--poll", action="store_true", help="Use mtime polling instead of inotify")
+    parser.add_argument("--json-file", type=Path, help="Keep the current results in this JSON file")
+    parser.add_argument("--socket", type=Path, help="Stream results as JSON lines on this Unix socket")
+    args = parser.parse_args()
+
+    if not args.docs_dir.is_dir():
+        print(f"❌ Docs directory not found: {args.docs_dir}")
+        sys.exit(1)
+
+    daemon = ValidationDaemon(args.docs_dir, json_file=args.json_file, socket_path=args.socket)
+    daemon.start()
+    try:
+        daemon.watch(poll=args.poll)
+    except KeyboardInterrupt:
+        print("\n⚠️ Watch stopped")
+
+
+if __name__ == "__main__":
+    main()